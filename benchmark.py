@@ -0,0 +1,150 @@
+#-*- coding: utf-8 -*-
+
+
+from sys import argv, exit
+
+from constants import DOCTORS_FILE_INDEX, SCHEDULE_FILE_INDEX, REQUESTS_FILE_INDEX
+
+
+def startup(args):
+    """
+    Runs the startup benchmark of the birth-plan-manager tool with the given input files.
+
+    Args:
+        args (list): the benchmark arguments, with the doctors, schedule and requests files at the same positions
+                     as when running the birth-plan-manager tool.
+
+    Returns:
+        int: 0 if the startup is within its budget, 1 otherwise.
+    """
+
+    from classes.StartupBenchmark import StartupBenchmark
+
+    benchmark = StartupBenchmark(args[DOCTORS_FILE_INDEX], args[SCHEDULE_FILE_INDEX], args[REQUESTS_FILE_INDEX])
+    lines, within_budget = benchmark.create_report()
+
+    for line in lines:
+        print(line)
+
+    return 0 if within_budget else 1
+
+
+def parsing(args):
+    """
+    Runs the parsing benchmark of the birth-plan-manager tool, on generated files with an optional number of rows.
+
+    Args:
+        args (list): the benchmark arguments, with the number of rows of the generated files at the first position.
+
+    Returns:
+        int: 0 if the bulk parsing reaches its speedup target, 1 otherwise.
+    """
+
+    from classes.ParsingBenchmark import ParsingBenchmark
+
+    benchmark = ParsingBenchmark(int(args[1])) if len(args) > 1 else ParsingBenchmark()
+    lines, on_target = benchmark.create_report()
+
+    for line in lines:
+        print(line)
+
+    return 0 if on_target else 1
+
+
+def differential(args):
+    """
+    Runs the differential benchmark of the birth-plan-manager tool, with an optional number of updates, doctors and
+    requests, and the optional rules of the hospital given as when running the birth-plan-manager tool.
+
+    Args:
+        args (list): the benchmark arguments, with the number of updates, doctors of each update and requests of each
+                     update, and seed at the first, second, third and fourth positions, followed by the
+                     --closing-time, --assistance-duration and --max-work-time options.
+
+    Returns:
+        int: 0 if the output files of the planner and of the reference planner are byte-identical and the planner
+             reaches DIFFERENTIAL_SPEEDUP_TARGET times the speed of the reference planner, 1 otherwise.
+    """
+
+    from classes.DifferentialBenchmark import DifferentialBenchmark
+    from main import parse_options, parse_policy_overrides
+
+    positional, options = parse_options(args)
+    benchmark = DifferentialBenchmark(*[int(arg) for arg in positional[1:5]],
+                                      policy_overrides = parse_policy_overrides(options))
+    lines, on_target = benchmark.create_report()
+
+    for line in lines:
+        print(line)
+
+    return 0 if on_target else 1
+
+
+def concurrency(args):
+    """
+    Runs the concurrency benchmark of the birth-plan-manager tool, with an optional number of requests, doctors and
+    submitter threads.
+
+    Args:
+        args (list): the benchmark arguments, with the number of requests, doctors and largest number of submitter
+                     threads at the first, second and third positions.
+
+    Returns:
+        int: 0 if no doctor is double-booked and the roster outperforms a single lock, 1 otherwise.
+    """
+
+    from classes.ConcurrencyBenchmark import ConcurrencyBenchmark
+
+    benchmark = ConcurrencyBenchmark(*[int(arg) for arg in args[1:4]])
+    lines, on_target = benchmark.create_report()
+
+    for line in lines:
+        print(line)
+
+    return 0 if on_target else 1
+
+
+def sweep(args):
+    """
+    Runs the sweep benchmark of the birth-plan-manager tool, with an optional number of scenarios, doctors and
+    requests.
+
+    Args:
+        args (list): the benchmark arguments, with the number of scenarios, doctors and requests at the first, second
+                     and third positions.
+
+    Returns:
+        int: 0 if the warm scenario pool is bounded by the planning of the scenarios, 1 otherwise.
+    """
+
+    from classes.SweepBenchmark import SweepBenchmark
+
+    benchmark = SweepBenchmark(*[int(arg) for arg in args[1:4]])
+    lines, on_target = benchmark.create_report()
+
+    for line in lines:
+        print(line)
+
+    return 0 if on_target else 1
+
+
+BENCHMARKS = {"startup": startup, "parsing": parsing, "differential": differential, "concurrency": concurrency,
+              "sweep": sweep}
+
+
+def main(args):
+    """
+    Runs a benchmark of the birth-plan-manager tool from the command line.
+
+    Args:
+        args (list): the command line arguments, with the name of the benchmark followed by its arguments.
+
+    Returns:
+        int: the exit status of the benchmark.
+    """
+
+    return BENCHMARKS[args[1]](args[1:])
+
+
+if __name__ == "__main__":
+    exit(main(argv))
@@ -0,0 +1,324 @@
+#-*- coding: utf-8 -*-
+
+
+from classes.Time import Time
+from classes.Header import Header
+from classes.DataManager import DataManager
+
+from bisect import bisect_left, insort
+from constants import TICK_ARCHIVE_EXTENSION
+
+
+class ArchiveCatalog:
+    """
+    A class to represent a catalog of the files of the birth-plan-manager tool in an archive directory, indexed by
+    scope, date and time from their headers only.
+
+    Note:
+        The header of each file is cached with the modification time and size of the file, so that a rescan only reads
+        the headers of new or modified files, and files without a header of the tool are remembered and skipped in the
+        same way. For each scope, the catalog keeps a sorted index of entries
+        ((year, month, day, minutes), path), so that lookups by date and time are binary searches.
+    """
+
+    def __init__(self, directory, cache_file = None):
+        """
+        Initializes a new ArchiveCatalog.
+
+        Args:
+            directory (str): the archive directory.
+            cache_file (str, optional): the file where the cached headers are kept between runs. Defaults to None,
+                                        which keeps them in memory only.
+        """
+
+        self._directory = directory
+        self._cache_file = cache_file
+        self._entries = {}
+        self._skipped = {}
+        self._index = {}
+
+        if cache_file:
+            self.load_cache()
+
+
+    def get_directory(self):
+        """
+        The archive directory of the current ArchiveCatalog instance.
+
+        Returns:
+            str: the archive directory.
+        """
+
+        return self._directory
+
+
+    def get_header(self, path):
+        """
+        The cached header of a file of the current ArchiveCatalog instance.
+
+        Args:
+            path (str): the path of the file.
+
+        Returns:
+            Header: the header of the file, or None if the file is not in the catalog.
+        """
+
+        entry = self._entries.get(path)
+
+        return Header(*entry[2:]) if entry else None
+
+
+    def get_signature(self, path):
+        """
+        The cached modification time and size of a file of the current ArchiveCatalog instance.
+
+        Args:
+            path (str): the path of the file.
+
+        Returns:
+            tuple: the modification time of the file, in nanoseconds, and its size, in bytes, or None if the file is not
+                   in the catalog.
+        """
+
+        entry = self._entries.get(path)
+
+        return entry[:2] if entry else None
+
+
+    def create_key(self, date, time):
+        """
+        Creates the sort key of a date and time.
+
+        Args:
+            date (str): the date, in the format '%d:%m:%Y'.
+            time (str): the time, in the format "HhM".
+
+        Returns:
+            tuple: the year, month, day and minutes since midnight.
+        """
+
+        day, month, year = date.split(":")
+
+        return int(year), int(month), int(day), Time(time).convert_time_to_minutes()
+
+
+    def add_entry(self, path, mtime, size, header):
+        """
+        Adds a file to the current ArchiveCatalog instance and to the sorted index of its scope.
+
+        Args:
+            path (str): the path of the file.
+            mtime (int): the modification time of the file, in nanoseconds.
+            size (int): the size of the file, in bytes.
+            header (Header): the header of the file.
+        """
+
+        self._entries[path] = (mtime, size, header.get_organization(), header.get_time(), header.get_date(),
+                               header.get_scope())
+
+        insort(self._index.setdefault(header.get_scope(), []),
+               (self.create_key(header.get_date(), header.get_time()), path))
+
+
+    def remove_entry(self, path):
+        """
+        Removes a file from the current ArchiveCatalog instance and from the sorted index of its scope.
+
+        Args:
+            path (str): the path of the file.
+        """
+
+        _, _, _, time, date, scope = self._entries.pop(path)
+        index = self._index[scope]
+
+        del index[bisect_left(index, (self.create_key(date, time), path))]
+
+
+    def read_header(self, path):
+        """
+        Reads the header of a file, without reading its body.
+
+        Args:
+            path (str): the path of the file.
+
+        Returns:
+            Header: the header of the file, or None if the file does not start with a header of the birth-plan-manager
+                    tool.
+        """
+
+        from lzma import LZMAError
+
+        try:
+            header = DataManager(path).get_header()
+            self.create_key(header.get_date(), header.get_time())
+
+        except (OSError, EOFError, LZMAError, UnicodeDecodeError, ValueError):
+            return None
+
+        return header
+
+
+    def scan(self):
+        """
+        Scans the archive directory of the current ArchiveCatalog instance, reading the headers of the new or modified
+        files only and dropping the removed files.
+
+        Returns:
+            int: the number of headers read.
+        """
+
+        from os import scandir
+        from os.path import abspath
+
+        cache_file = abspath(self._cache_file) if self._cache_file else None
+        seen = set()
+        headers_read = 0
+
+        with scandir(self.get_directory()) as directory_entries:
+            for directory_entry in directory_entries:
+                if not directory_entry.is_file() or abspath(directory_entry.path) == cache_file or \
+                    directory_entry.name.endswith(TICK_ARCHIVE_EXTENSION):
+                    continue
+
+                path = directory_entry.path
+                status = directory_entry.stat()
+                signature = (status.st_mtime_ns, status.st_size)
+                entry = self._entries.get(path)
+                seen.add(path)
+
+                if (entry and entry[:2] == signature) or self._skipped.get(path) == signature:
+                    continue
+
+                if entry:
+                    self.remove_entry(path)
+
+                header = self.read_header(path)
+                headers_read += 1
+
+                if header:
+                    self.add_entry(path, status.st_mtime_ns, status.st_size, header)
+                    self._skipped.pop(path, None)
+                else:
+                    self._skipped[path] = signature
+
+        for path in [path for path in self._entries if path not in seen]:
+            self.remove_entry(path)
+
+        for path in [path for path in self._skipped if path not in seen]:
+            del self._skipped[path]
+
+        if self._cache_file:
+            self.save_cache()
+
+        return headers_read
+
+
+    def latest_before(self, scope, date, time, organization = None, inclusive = False):
+        """
+        Finds the latest file of a scope before a given date and time.
+
+        Args:
+            scope (str): the scope of the file, such as DOCTORS_FILE_SCOPE.
+            date (str): the date, in the format '%d:%m:%Y'.
+            time (str): the time, in the format "HhM".
+            organization (str, optional): the organization of the file. Defaults to None, which accepts any
+                                          organization.
+            inclusive (bool, optional): whether a file at the given date and time is accepted. Defaults to False.
+
+        Returns:
+            str: the path of the file, or None if there is no such file.
+        """
+
+        index = self._index.get(scope, [])
+        key = self.create_key(date, time)
+        position = bisect_left(index, (key[:3] + (key[3] + 1,), "") if inclusive else (key, ""))
+
+        for position in range(position - 1, -1, -1):
+            path = index[position][1]
+
+            if organization is None or self._entries[path][2] == organization:
+                return path
+
+        return None
+
+
+    def on_date(self, scope, date, organization = None):
+        """
+        Finds the files of a scope on a given date.
+
+        Args:
+            scope (str): the scope of the files, such as SCHEDULE_FILE_SCOPE.
+            date (str): the date, in the format '%d:%m:%Y'.
+            organization (str, optional): the organization of the files. Defaults to None, which accepts any
+                                          organization.
+
+        Returns:
+            list: the paths of the files, sorted by time and then by path.
+        """
+
+        index = self._index.get(scope, [])
+        day, month, year = date.split(":")
+
+        first = bisect_left(index, ((int(year), int(month), int(day), 0), ""))
+        last = bisect_left(index, ((int(year), int(month), int(day) + 1, 0), ""))
+
+        return [path for _, path in index[first:last] if organization is None or self._entries[path][2] == organization]
+
+
+    def in_scope(self, scope, organization = None):
+        """
+        Finds the files of a scope.
+
+        Args:
+            scope (str): the scope of the files, such as REQUESTS_FILE_SCOPE.
+            organization (str, optional): the organization of the files. Defaults to None, which accepts any
+                                          organization.
+
+        Returns:
+            list: the paths of the files, sorted by date and time and then by path.
+        """
+
+        return [path for _, path in self._index.get(scope, [])
+                if organization is None or self._entries[path][2] == organization]
+
+
+    def load_cache(self):
+        """
+        Loads the cached headers and skipped files of the current ArchiveCatalog instance from its cache file, if it exists.
+        """
+
+        from json import load
+        from os.path import exists
+
+        if not exists(self._cache_file):
+            return
+
+        with open(self._cache_file, "r", encoding = "utf-8") as in_file:
+            cache = load(in_file)
+
+        for path, (mtime, size, organization, time, date, scope) in cache["entries"].items():
+            self.add_entry(path, mtime, size, Header(organization, time, date, scope))
+
+        self._skipped = {path: tuple(signature) for path, signature in cache["skipped"].items()}
+
+
+    def save_cache(self):
+        """
+        Saves the cached headers and skipped files of the current ArchiveCatalog instance to its cache file.
+        """
+
+        from json import dump
+
+        with open(self._cache_file, "w", encoding = "utf-8") as out_file:
+            dump({"entries": self._entries, "skipped": self._skipped}, out_file)
+
+
+    def __len__(self):
+        """
+        The number of files of the current ArchiveCatalog instance.
+
+        Returns:
+            int: the number of cataloged files.
+        """
+
+        return len(self._entries)
@@ -0,0 +1,287 @@
+#-*- coding: utf-8 -*-
+
+
+from classes.PlanningPolicy import PlanningPolicy
+
+from copy import deepcopy
+from heapq import nsmallest
+
+
+class BatchAssignment:
+    """
+    A class to represent the assignment of the requests of an update to the slots of the doctors as a single minimum
+    cost assignment problem, solved with the Hungarian algorithm, as an alternative to the greedy assignment of the
+    birth-plan-manager tool.
+
+    Note:
+        Each doctor offers a sequence of slots, the assistances it would carry out one after the other from the next
+        update on, with the duration of an assistance, the daily break and the weekly working time of the policy, until
+        an assistance would end outside the operating time. The cost of an assignment first minimizes the number of
+        redirected requests, then the priority of the redirected requests and then the sum of the times of the
+        assistances, weighted by the priority of the requests. As the slots of a doctor are ordered by time, an optimal
+        assignment always uses the first slots of each doctor, so the assistances can be carried out in the order of
+        the slots.
+    """
+
+    def __init__(self, policy = None):
+        """
+        Initializes a new BatchAssignment.
+
+        Args:
+            policy (PlanningPolicy, optional): the rules of the hospital. Defaults to the default PlanningPolicy.
+        """
+
+        self._policy = policy if policy else PlanningPolicy.default()
+
+
+    def get_policy(self):
+        """
+        The rules of the hospital of the current BatchAssignment instance.
+
+        Returns:
+            PlanningPolicy: the rules of the hospital.
+        """
+
+        return self._policy
+
+
+    def create_slots(self, doctors, next_time, max_slots):
+        """
+        Creates the slots of the available doctors, replaying the assistances of each doctor on a copy of it.
+
+        Args:
+            doctors (list): the Doctor objects of the update.
+            next_time (Time): the time of the next update of the birth-plan-manager tool.
+            max_slots (int): the maximum number of slots of each doctor.
+
+        Returns:
+            list: the start of each slot in minutes, the position of its doctor and its position among the slots of the
+                  doctor, as tuples.
+        """
+
+        policy = self.get_policy()
+        slots = []
+
+        for position, doctor in enumerate(doctors):
+            doctor = deepcopy(doctor)
+
+            for slot in range(max_slots):
+                if doctor.weekly_leave_check(policy):
+                    break
+
+                assistance_time, adjusted_availability = doctor.adjust_availability(next_time, policy)
+
+                if not adjusted_availability.within_operating_time(policy):
+                    break
+
+                slots.append((assistance_time.convert_time_to_minutes(), position, slot))
+
+                doctor.update_working_time(adjusted_availability, policy)
+                doctor.daily_break_check(policy)
+
+        return slots
+
+
+    def select_slots(self, slots, doctors, count, high_risk_count):
+        """
+        Selects the slots that an optimal assignment may use: the earliest slots of all doctors, and the earliest slots
+        of the doctors with the minimum category for a high risk assistance, with the slots at the same start ordered
+        as their doctors are for the greedy assignment. Only the doctors with slots are ordered, so that the doctors on
+        weekly leave, whose availability is not a time, are never compared.
+
+        Args:
+            slots (list): the slots of the available doctors.
+            doctors (list): the Doctor objects of the update.
+            count (int): the number of requests.
+            high_risk_count (int): the number of high risk requests.
+
+        Returns:
+            list: the selected slots, from the earliest to the latest.
+        """
+
+        min_category = self.get_policy().get_min_category()
+        positions = sorted({position for _, position, _ in slots}, key = lambda position: doctors[position])
+        ranks = {position: rank for rank, position in enumerate(positions)}
+
+        def slot_key(slot):
+            return slot[0], ranks[slot[1]], slot[2]
+
+        selected = set(nsmallest(count, slots, key = slot_key))
+        selected.update(nsmallest(high_risk_count, (slot for slot in slots
+                                                    if int(doctors[slot[1]].get_category()) >= min_category),
+                                  key = slot_key))
+
+        return sorted(selected, key = slot_key)
+
+
+    def create_costs(self, mothers, doctors, slots):
+        """
+        Creates the cost matrix of the assignment, with a row for each request and a column for each slot, followed by
+        a column for each request to redirect it.
+
+        Args:
+            mothers (list): the Mother objects of the requests, from highest to lowest priority.
+            doctors (list): the Doctor objects of the update.
+            slots (list): the selected slots, from the earliest to the latest.
+
+        Returns:
+            list: the cost of assigning each request to each column, or None if it is not allowed.
+
+        Note:
+            The cost of a slot for a request is its position among the slots, weighted by the priority of the request,
+            so that the requests of higher priority take the earlier slots, as with the greedy assignment. The cost of
+            redirecting a request is above the sum of the costs of all slots and of the priority of all other
+            requests, so that an assignment with fewer redirected requests always costs less.
+        """
+
+        min_category = self.get_policy().get_min_category()
+        count = len(mothers)
+
+        priority_weight = len(slots) * count * count + 1
+        redirect_cost = (count * count + 1) * priority_weight
+
+        high_risk_columns = [int(doctors[position].get_category()) >= min_category for _, position, _ in slots]
+        costs = []
+
+        for rank, mother in enumerate(mothers):
+            weight = count - rank
+            redirect = redirect_cost + weight * priority_weight
+
+            if mother.get_risk() == "high":
+                row = [(column + 1) * weight if allowed else None
+                       for column, allowed in enumerate(high_risk_columns)]
+            else:
+                row = [(column + 1) * weight for column in range(len(slots))]
+
+            costs.append(row + [redirect] * count)
+
+        return costs
+
+
+    def solve(self, costs):
+        """
+        Solves a minimum cost assignment problem with the Hungarian algorithm, with potentials and shortest augmenting
+        paths, in O(n^2 m) for n rows and m columns.
+
+        Args:
+            costs (list): the cost of assigning each row to each column, or None if it is not allowed, with at least as
+                          many columns as rows and an allowed column for each row.
+
+        Returns:
+            list: the column assigned to each row.
+        """
+
+        rows = len(costs)
+        columns = len(costs[0]) if costs else 0
+        infinity = float("inf")
+
+        row_potentials = [0] * (rows + 1)
+        column_potentials = [0] * (columns + 1)
+        matches = [0] * (columns + 1)
+        ways = [0] * (columns + 1)
+
+        for row in range(1, rows + 1):
+            matches[0] = row
+            column = 0
+            minima = [infinity] * (columns + 1)
+            used = [False] * (columns + 1)
+
+            while matches[column]:
+                used[column] = True
+                matched_row = matches[column]
+                row_costs = costs[matched_row - 1]
+                row_potential = row_potentials[matched_row]
+                delta = infinity
+                next_column = 0
+
+                for candidate in range(1, columns + 1):
+                    if used[candidate]:
+                        continue
+
+                    cost = row_costs[candidate - 1]
+
+                    if cost is not None:
+                        reduced_cost = cost - row_potential - column_potentials[candidate]
+
+                        if reduced_cost < minima[candidate]:
+                            minima[candidate] = reduced_cost
+                            ways[candidate] = column
+
+                    if minima[candidate] < delta:
+                        delta = minima[candidate]
+                        next_column = candidate
+
+                for candidate in range(columns + 1):
+                    if used[candidate]:
+                        row_potentials[matches[candidate]] += delta
+                        column_potentials[candidate] -= delta
+                    else:
+                        minima[candidate] -= delta
+
+                column = next_column
+
+            while column:
+                previous_column = ways[column]
+                matches[column] = matches[previous_column]
+                column = previous_column
+
+        assignment = [0] * rows
+
+        for column in range(1, columns + 1):
+            if matches[column]:
+                assignment[matches[column] - 1] = column - 1
+
+        return assignment
+
+
+    def assign(self, mothers, doctors, next_time):
+        """
+        Assigns the requests of an update to the doctors.
+
+        Args:
+            mothers (list): the Mother objects of the requests, from highest to lowest priority.
+            doctors (list): the Doctor objects of the update.
+            next_time (Time): the time of the next update of the birth-plan-manager tool.
+
+        Returns:
+            list: the Mother and Doctor objects of each assigned request, as tuples, in the order in which the
+                  assistances have to be carried out by each doctor. The requests that are not in the list are
+                  redirected.
+        """
+
+        if not mothers:
+            return []
+
+        high_risk_count = sum(1 for mother in mothers if mother.get_risk() == "high")
+
+        slots = self.create_slots(doctors, next_time, len(mothers))
+        slots = self.select_slots(slots, doctors, len(mothers), high_risk_count)
+        costs = self.create_costs(mothers, doctors, slots)
+
+        assigned = []
+
+        for mother, column in zip(mothers, self.solve(costs)):
+            if column < len(slots):
+                assigned.append((column, mother))
+
+        assigned.sort(key = lambda assignment: assignment[0])
+
+        return [(mother, doctors[slots[column][1]]) for column, mother in assigned]
+
+
+    def count_assigned(self, next_schedule, mothers_collection):
+        """
+        Counts the requests of an update that were assigned to a doctor.
+
+        Args:
+            next_schedule (Schedule): the next schedule of the update.
+            mothers_collection (MothersCollection): the requests of the update.
+
+        Returns:
+            int: the number of requests with an assistance with a doctor in the next schedule.
+        """
+
+        requested = {mother.get_name() for mother in mothers_collection.mothers_items()}
+
+        return sum(1 for assistance in next_schedule.schedule_items()
+                   if assistance.get_doctor() and assistance.get_mother().get_name() in requested)
@@ -0,0 +1,321 @@
+#-*- coding: utf-8 -*-
+
+
+from classes.Doctor import Doctor
+from classes.Mother import Mother
+from classes.Time import Time
+from classes.Assistance import Assistance
+from classes.Header import Header
+from classes.DataManager import DataManager
+
+from array import array
+from itertools import repeat
+from constants import NUM_HEADER_LINES, WKL_LEAVE, REDIRECTED_REQUEST
+from constants import DOCTORS_FILE_SCOPE, SCHEDULE_FILE_SCOPE, REQUESTS_FILE_SCOPE
+
+
+class BulkParser(DataManager):
+    """
+    A class that parses the content of a doctors, schedule or requests file of the birth-plan-manager tool in bulk,
+    splitting the fields of all lines in a single pass and converting them to typed columns in batches.
+    """
+
+    # Fields of each line, by scope of the file
+    FIELDS = {DOCTORS_FILE_SCOPE: ("name", "category", "availability", "minutes_today", "weekly_time"),
+              REQUESTS_FILE_SCOPE: ("name", "age", "wristband", "risk"),
+              SCHEDULE_FILE_SCOPE: ("time", "mother", "doctor")}
+
+    # Fields converted to integers, by scope of the file
+    INT_FIELDS = {DOCTORS_FILE_SCOPE: ("category", "minutes_today"),
+                  REQUESTS_FILE_SCOPE: ("age",),
+                  SCHEDULE_FILE_SCOPE: ()}
+
+    # Fields with the format "HhM" converted to minutes, by scope of the file
+    TIME_FIELDS = {DOCTORS_FILE_SCOPE: ("availability", "weekly_time"),
+                   REQUESTS_FILE_SCOPE: (),
+                   SCHEDULE_FILE_SCOPE: ("time",)}
+
+
+    def __init__(self, file_name = None, header = None):
+        """
+        Initializes a new BulkParser.
+
+        Args:
+            file_name (str, optional): the name of the file to parse. Defaults to None.
+            header (Header, optional): the header of the file to parse. Defaults to None.
+
+        Note:
+            The file is read into a single buffer once, which is used both for the header and for the content.
+        """
+
+        self._buffer = None
+        self._lines = None
+        self._columns = None
+        self._records = None
+
+        super().__init__(file_name, header)
+
+
+    def get_buffer(self):
+        """
+        The whole text of the file associated with the current BulkParser instance, read on first use.
+
+        Returns:
+            str: the text of the file associated with the current BulkParser instance.
+        """
+
+        if self._buffer is None:
+            in_file = self.open_file()
+            self._buffer = in_file.read()
+            in_file.close()
+
+        return self._buffer
+
+
+    def create_header_from_file_name(self):
+        """
+        Creates the Header object of the current BulkParser instance from the buffer of its file.
+        """
+
+        lines = self.get_buffer().split("\n", NUM_HEADER_LINES)
+
+        organization, hour, date = (lines[i].rstrip() for i in range(1, NUM_HEADER_LINES - 1, 2))
+        scope = lines[NUM_HEADER_LINES - 1].rstrip().rstrip(":")
+
+        self.set_header(Header(organization, hour, date, scope))
+
+
+    def get_fields(self):
+        """
+        The fields of each line of the file associated with the current BulkParser instance, according to its scope.
+
+        Returns:
+            tuple: the names of the fields of each line.
+        """
+
+        return self.FIELDS[self.get_header().get_scope()]
+
+
+    def get_lines(self):
+        """
+        The lines of content of the file associated with the current BulkParser instance, split from its buffer and
+        validated on first use.
+
+        Returns:
+            list: the lines after the header, without trailing whitespace.
+
+        Raises:
+            ValueError: if a line does not have the number of fields of its scope, with the same message as when the
+                        file is read line by line.
+        """
+
+        if self._lines is None:
+            self.split_lines()
+
+        return self._lines
+
+
+    def split_lines(self):
+        """
+        Splits the content of the buffer of the current BulkParser instance into lines and checks, in a single pass,
+        that every line has the number of fields of its scope.
+
+        Raises:
+            ValueError: if a line does not have the number of fields of its scope, with the same message as when the
+                        file is read line by line.
+        """
+
+        buffer = self.get_buffer()
+        position = -1
+
+        for _ in range(NUM_HEADER_LINES):
+            position = buffer.find("\n", position + 1)
+
+            if position == -1:
+                break
+
+        lines = buffer[position + 1:].split("\n") if position != -1 else []
+
+        if lines and lines[-1] == "":
+            lines.pop()
+
+        if lines and ("\r" in buffer or "\t" in buffer or " \n" in buffer or lines[-1][-1:].isspace()):
+            lines = list(map(str.rstrip, lines))
+
+        if set(map(str.count, lines, repeat(", "))) - {len(self.get_fields()) - 1}:
+            self.raise_line_error(lines)
+
+        self._lines = lines
+
+
+    def raise_line_error(self, lines):
+        """
+        Finds the first line with the wrong number of fields and raises the error that reading it line by line raises.
+
+        Args:
+            lines (list): the lines of the content of the file, without trailing whitespace.
+
+        Raises:
+            ValueError: if a line does not have the number of fields of the scope of the current BulkParser instance.
+        """
+
+        fields = self.get_fields()
+
+        for line in lines:
+            values = line.split(", ")
+
+            if len(values) < len(fields):
+                raise ValueError(f"not enough values to unpack (expected {len(fields)}, got {len(values)})")
+            elif len(values) > len(fields):
+                raise ValueError(f"too many values to unpack (expected {len(fields)})")
+
+
+    def get_columns(self):
+        """
+        The fields of the file associated with the current BulkParser instance, as one column of strings per field,
+        split in a single pass over all the lines on first use.
+
+        Returns:
+            dict: the list of strings of each field, by field name.
+
+        Raises:
+            ValueError: if a line does not have the number of fields of its scope, with the same message as when the
+                        file is read line by line.
+        """
+
+        if self._columns is None:
+            fields = self.get_fields()
+            lines = self.get_lines()
+            values = ", ".join(lines).split(", ") if lines else []
+
+            self._columns = {field: values[i::len(fields)] for i, field in enumerate(fields)}
+
+        return self._columns
+
+
+    def convert_ints(self, column):
+        """
+        Converts a column of strings to integers in a single batch, converting each distinct string only once.
+
+        Args:
+            column (list): the strings to convert.
+
+        Returns:
+            array: the integers of the column, as an array of signed integers.
+
+        Raises:
+            ValueError: if a string is not an integer.
+        """
+
+        conversions = {value: int(value) for value in set(column)}
+
+        return array("i", list(map(conversions.__getitem__, column)))
+
+
+    def convert_time(self, time):
+        """
+        Converts a string with the format "HhM" to minutes.
+
+        Args:
+            time (str): the string to convert, where WKL_LEAVE is also allowed.
+
+        Returns:
+            int: the minutes of the time, or -1 for WKL_LEAVE.
+
+        Raises:
+            ValueError: if the string is neither a time with the format "HhM" nor WKL_LEAVE.
+        """
+
+        if time == WKL_LEAVE:
+            return -1
+
+        hours, minutes = time.split("h")
+
+        return int(hours) * 60 + int(minutes)
+
+
+    def convert_times(self, column):
+        """
+        Converts a column of strings with the format "HhM" to minutes in a single batch, converting each distinct
+        string only once.
+
+        Args:
+            column (list): the strings to convert, where WKL_LEAVE is also allowed.
+
+        Returns:
+            array: the minutes of the column, as an array of signed integers with -1 for each WKL_LEAVE value.
+
+        Raises:
+            ValueError: if a string is neither a time with the format "HhM" nor WKL_LEAVE.
+        """
+
+        conversions = {value: self.convert_time(value) for value in set(column)}
+
+        return array("i", list(map(conversions.__getitem__, column)))
+
+
+    def get_records(self):
+        """
+        The compact records of the file associated with the current BulkParser instance, with each field converted
+        in a single batch.
+
+        Returns:
+            dict: the column of each field, by field name, as an array of signed integers for the integer fields and
+                  the fields with the format "HhM" (converted to minutes), and as a list of strings otherwise.
+
+        Raises:
+            ValueError: if a line does not have the number of fields of its scope or if a field cannot be converted.
+        """
+
+        if self._records is None:
+            scope = self.get_header().get_scope()
+            records = dict(self.get_columns())
+
+            for field in self.INT_FIELDS[scope]:
+                records[field] = self.convert_ints(records[field])
+
+            for field in self.TIME_FIELDS[scope]:
+                records[field] = self.convert_times(records[field])
+
+            self._records = records
+
+        return self._records
+
+
+    def __len__(self):
+        """
+        The number of lines of content of the file associated with the current BulkParser instance.
+
+        Returns:
+            int: the number of lines after the header.
+        """
+
+        return len(self.get_lines())
+
+
+    def objects_items(self):
+        """
+        Supports lazy iteration over the objects of the file associated with the current BulkParser instance, each
+        one split from its line and built only when it is reached.
+
+        Yields:
+            Doctor, Mother or Assistance: each object of the file, according to its scope, one at a time.
+
+        Note:
+            The assistances of redirected requests have no doctor, as when the schedule is read line by line.
+        """
+
+        scope = self.get_header().get_scope()
+        values = map(str.split, self.get_lines(), repeat(", "))
+
+        if scope == DOCTORS_FILE_SCOPE:
+            for name, category, availability, minutes_today, weekly_time in values:
+                yield Doctor(name, category, availability, minutes_today, weekly_time)
+
+        elif scope == REQUESTS_FILE_SCOPE:
+            for name, age, wristband, risk in values:
+                yield Mother(name, age, wristband, risk)
+
+        elif scope == SCHEDULE_FILE_SCOPE:
+            for time, mother, doctor in values:
+                yield Assistance(Time(time), Mother(mother), None if doctor == REDIRECTED_REQUEST else Doctor(doctor))
@@ -0,0 +1,73 @@
+#-*- coding: utf-8 -*-
+
+
+class Bundle:
+    """
+    A class to read and write the files of the birth-plan-manager tool as a stream of length-prefixed frames, so that
+    an update can be planned from a pipe without any file on the disk.
+
+    Note:
+        Each frame is a line with the name of the file and the length in bytes of its content, separated by a space,
+        followed by the content of the file. The content of the frames that are read is decoded as the input files of
+        the tool are, and the content of the frames that are written is encoded as its output files are, so that the
+        content of each written frame is identical to the file the tool would have written.
+    """
+
+    # Encodings of the content of the frames that are read and written
+    READ_ENCODING = "utf-8"
+    WRITE_ENCODING = "utf-8-sig"
+
+
+    def read(self, in_stream):
+        """
+        Reads every frame of a binary stream, until the end of the stream.
+
+        Args:
+            in_stream (file): the binary stream to read, such as sys.stdin.buffer.
+
+        Returns:
+            dict: the content of each file, by file name, in the order of the frames.
+
+        Raises:
+            ValueError: if a frame has no valid length or is shorter than its length.
+        """
+
+        files = {}
+
+        for frame_line in iter(in_stream.readline, b""):
+            if not frame_line.strip():
+                continue
+
+            file_name, _, length = frame_line.decode(self.READ_ENCODING).rstrip("\r\n").rpartition(" ")
+
+            if not file_name or not length.isdigit():
+                raise ValueError(f"Bundle error: invalid frame line '{frame_line.decode(self.READ_ENCODING).rstrip()}'.")
+
+            content = in_stream.read(int(length))
+
+            if len(content) < int(length):
+                raise ValueError(f"Bundle error: frame of file '{file_name}' shorter than {length} bytes.")
+
+            files[file_name] = content.decode(self.READ_ENCODING)
+
+        return files
+
+
+    def write(self, out_stream, files, encoding = WRITE_ENCODING):
+        """
+        Writes a frame for each file to a binary stream.
+
+        Args:
+            out_stream (file): the binary stream to write, such as sys.stdout.buffer.
+            files (dict): the content of each file, by file name.
+            encoding (str, optional): the encoding of the content of the frames. Defaults to WRITE_ENCODING, and
+                                      READ_ENCODING writes frames that are read back unchanged.
+        """
+
+        for file_name, content in files.items():
+            content = content.encode(encoding)
+
+            out_stream.write(f"{file_name} {len(content)}\n".encode(self.READ_ENCODING))
+            out_stream.write(content)
+
+        out_stream.flush()
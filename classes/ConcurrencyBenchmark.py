@@ -0,0 +1,206 @@
+#-*- coding: utf-8 -*-
+
+
+from classes.Time import Time
+from classes.Doctor import Doctor
+from classes.Mother import Mother
+from classes.ConcurrentRoster import ConcurrentRoster
+from classes.DoctorsCollection import DoctorsCollection
+from classes.PlanningPolicy import PlanningPolicy
+
+from constants import CONCURRENCY_REQUESTS, CONCURRENCY_DOCTORS, CONCURRENCY_SUBMITTERS, CONCURRENCY_SEED
+
+
+class ConcurrencyBenchmark:
+    """
+    A class that books randomized requests in a ConcurrentRoster from an increasing number of submitter threads,
+    checks that no doctor is ever booked twice for the same working time and compares the throughput of each number of
+    submitters with that of the same roster behind a single lock.
+
+    Note:
+        Each submitter takes the next request from a shared queue and books it, doing nothing else, so that the
+        throughput only measures the bookings. The throughput of the roster behind a single lock is reported as a
+        baseline but not gated on: with the global interpreter lock of CPython, the bookings of several threads never
+        run in parallel, so the lock striping of the roster keeps the bookings consistent without booking faster.
+    """
+
+    def __init__(self, requests = CONCURRENCY_REQUESTS, doctors = CONCURRENCY_DOCTORS,
+                 submitters = CONCURRENCY_SUBMITTERS, seed = CONCURRENCY_SEED):
+        """
+        Initializes a new ConcurrencyBenchmark.
+
+        Args:
+            requests (int, optional): the number of generated requests. Defaults to CONCURRENCY_REQUESTS.
+            doctors (int, optional): the number of generated doctors. Defaults to CONCURRENCY_DOCTORS.
+            submitters (int, optional): the largest number of submitter threads, from 1 doubling up to it. Defaults to
+                                        CONCURRENCY_SUBMITTERS.
+            seed (int, optional): the seed of the generated doctors and requests. Defaults to CONCURRENCY_SEED.
+        """
+
+        self._requests = requests
+        self._doctors = doctors
+        self._submitters = submitters
+        self._seed = seed
+
+
+    def create_inputs(self):
+        """
+        Generates the doctors and the requests of the benchmark.
+
+        Returns:
+            tuple:
+                - doctors_collection (DoctorsCollection): the generated doctors.
+                - mothers (list): the generated Mother objects.
+        """
+
+        from random import Random
+
+        generator = Random(self._seed)
+
+        doctors = [Doctor(f"Doctor {i:04d}", generator.choice("123"), generator.choice(("8h00", "8h10", "8h20")),
+                          str(generator.choice((0, 100, 200))), generator.choice(("0h00", "20h00", "36h00")))
+                   for i in range(self._doctors)]
+
+        mothers = [Mother(f"Mother {i:06d}", str(generator.randrange(18, 43)),
+                          generator.choice(("green", "yellow", "red")), generator.choice(("low", "medium", "high")))
+                   for i in range(self._requests)]
+
+        return DoctorsCollection(doctors = doctors), mothers
+
+
+    def run_submitters(self, roster, mothers, submitters, lock = None):
+        """
+        Books the requests in a roster from a number of submitter threads.
+
+        Args:
+            roster (ConcurrentRoster): the roster of the doctors.
+            mothers (list): the Mother objects of the requests.
+            submitters (int): the number of submitter threads.
+            lock (threading.Lock, optional): the single lock held around every booking, as the baseline of the lock
+                                             striping of the roster. Defaults to None, which books without it.
+
+        Returns:
+            tuple:
+                - elapsed (float): the time to book every request, in seconds.
+                - redirects (int): the number of redirected requests.
+        """
+
+        from contextlib import nullcontext
+        from queue import Queue, Empty
+        from threading import Thread
+        from time import perf_counter
+
+        requests = Queue()
+        redirects = []
+
+        booking_lock = lock if lock else nullcontext()
+
+        for mother in mothers:
+            requests.put(mother)
+
+        def submit():
+            while True:
+                try:
+                    mother = requests.get_nowait()
+                except Empty:
+                    return
+
+                with booking_lock:
+                    assistance = roster.book(mother)
+
+                if assistance is None:
+                    redirects.append(mother)
+
+        threads = [Thread(target = submit) for _ in range(submitters)]
+        start = perf_counter()
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        return perf_counter() - start, len(redirects)
+
+
+    def double_booking_check(self, roster, mothers, redirects):
+        """
+        Checks that the bookings of a roster never overlap for a doctor and that every request was either booked once
+        or redirected.
+
+        Args:
+            roster (ConcurrentRoster): the roster after the bookings.
+            mothers (list): the Mother objects of the requests.
+            redirects (int): the number of redirected requests.
+
+        Returns:
+            bool:
+                - True if no doctor was booked twice for the same working time and every request was handled once.
+                - False otherwise.
+        """
+
+        assistance_minutes = roster.get_policy().get_assistance_minutes()
+        bookings = roster.get_bookings()
+        starts = {}
+
+        for assistance in bookings:
+            starts.setdefault(assistance.get_doctor().get_name(), []).append(
+                Time(assistance.get_time().get_time_string()).convert_time_to_minutes())
+
+        for doctor_starts in starts.values():
+            doctor_starts.sort()
+
+            if any(later - earlier < assistance_minutes for earlier, later in zip(doctor_starts, doctor_starts[1:])):
+                return False
+
+        booked = {assistance.get_mother().get_name() for assistance in bookings}
+
+        return len(booked) == len(bookings) and len(bookings) + redirects == len(mothers)
+
+
+    def create_report(self):
+        """
+        Books the generated requests with 1, 2, 4... submitters up to the largest number of submitters, in the roster
+        and in the roster behind a single lock, and compares their throughputs.
+
+        Returns:
+            tuple:
+                - lines (list): the lines of the report, one for each number of submitters.
+                - on_target (bool): True if no doctor was ever double-booked and every request was handled once, False
+                                    otherwise.
+        """
+
+        from threading import Lock
+
+        policy = PlanningPolicy.default()
+        doctors_collection, mothers = self.create_inputs()
+        next_time = Time("8h00")
+
+        lines = []
+        consistent = True
+        throughputs = []
+        submitters = 1
+
+        while submitters <= self._submitters:
+            throughput = {}
+            checked = True
+
+            for baseline in (True, False):
+                roster = ConcurrentRoster(doctors_collection, next_time, policy)
+                elapsed, redirects = self.run_submitters(roster, mothers, submitters, Lock() if baseline else None)
+                checked = self.double_booking_check(roster, mothers, redirects) and checked
+                throughput[baseline] = len(mothers) / elapsed
+
+            consistent = consistent and checked
+
+            throughputs.append(throughput)
+
+            lines.append(f"{submitters} submitter{'s' if submitters > 1 else ''}: {throughput[False]:,.0f} requests/s "
+                         f"({throughput[False] / throughputs[0][False]:.1f}x), single lock "
+                         f"{throughput[True]:,.0f} requests/s, striping {throughput[False] / throughput[True]:.2f}x, "
+                         f"{len(mothers) - redirects} booked, {redirects} redirected, "
+                         f"{'no double booking' if checked else 'DOUBLE BOOKING'}")
+
+            submitters *= 2
+
+        return lines, consistent
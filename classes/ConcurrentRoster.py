@@ -0,0 +1,193 @@
+#-*- coding: utf-8 -*-
+
+
+from classes.Time import Time
+from classes.Assistance import Assistance
+from classes.PlanningPolicy import PlanningPolicy
+
+from copy import deepcopy
+from heapq import heapify, heappush, heappop
+from constants import WKL_LEAVE
+
+
+class ConcurrentRoster:
+    """
+    A class to represent the doctors of an update shared by several threads, which assign requests to them as the
+    requests arrive, with an atomic operation that selects the doctor of a request and books its assistance.
+
+    Note:
+        The doctors are split into stripes by category, each one with its own lock and its own priority index of the
+        available doctors, ordered as the doctors of the Doctor class. A booking peeks at the first doctor of each
+        eligible stripe, one stripe at a time, and then books the best of them under the lock of its stripe only, if
+        the stripe has not changed since it was peeked; otherwise it starts again. As a booking only makes a doctor
+        less available, the first doctors of the other stripes can only have become worse meanwhile, so the booked
+        doctor is the one the greedy assignment would select at that moment, and no two bookings ever take the same
+        working time of a doctor. No thread ever holds more than one lock, so bookings cannot deadlock.
+    """
+
+    def __init__(self, doctors_collection, next_time, policy = None):
+        """
+        Initializes a new ConcurrentRoster.
+
+        Args:
+            doctors_collection (DoctorsCollection): the doctors of the update, copied so that the collection is left
+                                                    unchanged.
+            next_time (Time): the time of the next update of the birth-plan-manager tool.
+            policy (PlanningPolicy, optional): the rules of the hospital. Defaults to the default PlanningPolicy.
+        """
+
+        from threading import Lock
+
+        self._next_time = next_time
+        self._policy = policy if policy else PlanningPolicy.default()
+        self._doctors = doctors_collection.get_doctors()
+        self._stripes = {}
+
+        for doctor in self._doctors:
+            stripe = self._stripes.setdefault(int(doctor.get_category()),
+                                              {"lock": Lock(), "index": [], "version": 0, "bookings": []})
+
+            if doctor.get_availability() != WKL_LEAVE and not doctor.weekly_leave_check(self._policy):
+                stripe["index"].append((self.doctor_key(doctor), doctor))
+
+        for stripe in self._stripes.values():
+            heapify(stripe["index"])
+
+
+    def get_policy(self):
+        """
+        The rules of the hospital of the current ConcurrentRoster instance.
+
+        Returns:
+            PlanningPolicy: the rules of the hospital.
+        """
+
+        return self._policy
+
+
+    def get_doctors(self):
+        """
+        A deep copy of the doctors of the current ConcurrentRoster instance, with their working time as of the last
+        booking of each stripe.
+
+        Returns:
+            list: a deep copy of the Doctor objects of the roster.
+        """
+
+        doctors = []
+
+        for category in sorted(self._stripes):
+            with self._stripes[category]["lock"]:
+                doctors.extend(deepcopy([doctor for doctor in self._doctors if int(doctor.get_category()) == category]))
+
+        return doctors
+
+
+    def get_bookings(self):
+        """
+        The assistances booked in the current ConcurrentRoster instance.
+
+        Returns:
+            list: the Assistance objects booked with the doctors of each stripe, in the order of the bookings of each
+                  stripe.
+        """
+
+        bookings = []
+
+        for category in sorted(self._stripes):
+            with self._stripes[category]["lock"]:
+                bookings.extend(self._stripes[category]["bookings"])
+
+        return bookings
+
+
+    def doctor_key(self, doctor):
+        """
+        The key that orders the doctors from highest to lowest availability for an assistance.
+
+        Args:
+            doctor (Doctor): the doctor.
+
+        Returns:
+            tuple: the key of the doctor, in the order of the criteria of the Doctor class.
+        """
+
+        return (Time(doctor.get_availability()).convert_time_to_minutes(), -int(doctor.get_category()),
+                int(doctor.get_minutes_today()), Time(doctor.get_weekly_time()).convert_time_to_minutes(),
+                doctor.get_name())
+
+
+    def peek_stripes(self, mother):
+        """
+        Finds the first doctor of each stripe eligible for the request of a mother, locking one stripe at a time.
+
+        Args:
+            mother (Mother): the mother of the request.
+
+        Returns:
+            tuple: the key, category and version of the stripe with the best first doctor, or None if no eligible
+                   stripe has an available doctor.
+        """
+
+        min_category = self.get_policy().get_min_category() if mother.get_risk() == "high" else 0
+        best = None
+
+        for category, stripe in self._stripes.items():
+            if category < min_category:
+                continue
+
+            with stripe["lock"]:
+                candidate = (stripe["index"][0][0], category, stripe["version"]) if stripe["index"] else None
+
+            if candidate and (best is None or candidate < best):
+                best = candidate
+
+        return best
+
+
+    def book(self, mother):
+        """
+        Selects the doctor for the request of a mother and books its assistance, as a single atomic operation, safe
+        to call from several threads at once.
+
+        Args:
+            mother (Mother): the mother of the request.
+
+        Returns:
+            Assistance: the booked assistance, or None if the request has to be redirected, because no eligible doctor
+                        is available or the assistance of the selected doctor would end outside the operating time.
+        """
+
+        policy = self.get_policy()
+
+        while True:
+            best = self.peek_stripes(mother)
+
+            if best is None:
+                return None
+
+            _, category, version = best
+            stripe = self._stripes[category]
+
+            with stripe["lock"]:
+                if stripe["version"] != version or not stripe["index"]:
+                    continue
+
+                doctor = stripe["index"][0][1]
+                assistance_time, adjusted_availability = doctor.adjust_availability(self._next_time, policy)
+
+                if not adjusted_availability.within_operating_time(policy):
+                    return None
+
+                heappop(stripe["index"])
+                doctor.update_working_time(adjusted_availability, policy)
+                doctor.daily_break_check(policy)
+
+                if not doctor.weekly_leave_check(policy):
+                    heappush(stripe["index"], (self.doctor_key(doctor), doctor))
+
+                stripe["version"] += 1
+                assistance = Assistance(assistance_time, mother, doctor)
+                stripe["bookings"].append(assistance)
+
+                return assistance
@@ -0,0 +1,241 @@
+#-*- coding: utf-8 -*-
+
+
+from classes.PlanningPolicy import PlanningPolicy
+from classes.DataManager import DataManager
+
+from constants import NUM_HEADER_LINES, WKL_LEAVE, REDIRECTED_REQUEST
+
+
+class ConsistencyValidator:
+    """
+    A class that checks whether a doctors file and a schedule file of the birth-plan-manager tool are consistent with
+    each other, in a single linear sweep over both files.
+    """
+
+    def __init__(self, doctors_file, schedule_file, policy = None):
+        """
+        Initializes a new ConsistencyValidator.
+
+        Args:
+            doctors_file (str): the name of the doctors file.
+            schedule_file (str): the name of the schedule file.
+            policy (PlanningPolicy, optional): the rules of the hospital. Defaults to the default PlanningPolicy.
+        """
+
+        self._policy = policy if policy else PlanningPolicy.default()
+        self._doctors_file = doctors_file
+        self._schedule_file = schedule_file
+        self._violations = []
+        self._times = {}
+
+
+    def get_violations(self):
+        """
+        The violations found by the current ConsistencyValidator instance.
+
+        Returns:
+            list: a string describing each violation, with the file and line where it occurs.
+        """
+
+        return list(self._violations)
+
+
+    def add_violation(self, message, file_name, line_number):
+        """
+        Records a violation found by the current ConsistencyValidator instance.
+
+        Args:
+            message (str): the description of the violation.
+            file_name (str): the name of the file where the violation occurs.
+            line_number (int): the number of the line where the violation occurs, counting the header lines.
+        """
+
+        self._violations.append(f"File consistency error: {message} in file '{file_name}', line {line_number}.")
+
+
+    def convert_time(self, time):
+        """
+        Converts a string with the format "HhM" to minutes, caching the result, since the same times repeat across the
+        lines of a file.
+
+        Args:
+            time (str): the string to convert.
+
+        Returns:
+            int: the minutes of the time, or None if the string is not a time with the format "HhM".
+        """
+
+        hours, separator, minutes = time.partition("h")
+
+        if separator and hours.isdigit() and minutes.isdigit() and len(minutes) == 2 and int(minutes) < 60:
+            self._times[time] = int(hours) * 60 + int(minutes)
+        else:
+            self._times[time] = None
+
+        return self._times[time]
+
+
+    def read_lines(self, file_name):
+        """
+        Reads the lines of content of a file, after its header.
+
+        Args:
+            file_name (str): the name of the file.
+
+        Returns:
+            list: the lines of content of the file, without trailing whitespace, split as when the collections read the
+                  file, so that a file ending with a newline has no empty last line.
+        """
+
+        with DataManager(file_name).open_file() as in_file:
+            lines = in_file.readlines()[NUM_HEADER_LINES:]
+
+        return [line.rstrip() for line in lines]
+
+
+    def sweep_doctors(self):
+        """
+        Checks each line of the doctors file and builds the aggregates of each doctor.
+
+        Returns:
+            dict: the line number, availability (in minutes, or None on weekly leave) and accumulated minutes in the
+                  day of each doctor, by name.
+        """
+
+        max_weekly_minutes = self._policy.get_weekly_minutes()
+        max_work_time = f"{max_weekly_minutes // 60}h{max_weekly_minutes % 60:02d}"
+        file_name = self._doctors_file
+        times = self._times
+        doctors = {}
+
+        for line_number, line in enumerate(self.read_lines(file_name), start = NUM_HEADER_LINES + 1):
+            fields = line.split(", ")
+
+            if len(fields) != 5:
+                self.add_violation(f"expected 5 fields but found {len(fields)}", file_name, line_number)
+                continue
+
+            name, category, availability, minutes_today, weekly_time = fields
+
+            if name in doctors:
+                self.add_violation(f"doctor {name} already listed in line {doctors[name][0]}", file_name, line_number)
+
+            if category not in ("1", "2", "3"):
+                self.add_violation(f"invalid category {category}", file_name, line_number)
+
+            if not minutes_today.isdigit():
+                self.add_violation(f"invalid minutes {minutes_today}", file_name, line_number)
+                minutes_today = "0"
+
+            weekly_minutes = times[weekly_time] if weekly_time in times else self.convert_time(weekly_time)
+
+            if weekly_minutes is None:
+                self.add_violation(f"invalid weekly time {weekly_time}", file_name, line_number)
+
+            if availability == WKL_LEAVE:
+                availability_minutes = None
+
+                if weekly_minutes is not None and weekly_minutes < max_weekly_minutes:
+                    self.add_violation(f"weekly leave with weekly time {weekly_time} under {max_work_time}",
+                                       file_name, line_number)
+
+            else:
+                availability_minutes = times[availability] if availability in times else self.convert_time(availability)
+
+                if availability_minutes is None:
+                    self.add_violation(f"invalid availability {availability}", file_name, line_number)
+
+                if weekly_minutes is not None and weekly_minutes >= max_weekly_minutes:
+                    self.add_violation(f"weekly time {weekly_time} reaches {max_work_time} without weekly leave",
+                                       file_name, line_number)
+
+            doctors[name] = (line_number, availability_minutes, int(minutes_today))
+
+        return doctors
+
+
+    def sweep_schedule(self, doctors):
+        """
+        Checks each line of the schedule file against the aggregates of the doctors and builds the aggregates of the
+        assistances of each doctor.
+
+        Args:
+            doctors (dict): the line number, availability and accumulated minutes in the day of each doctor, by name.
+
+        Returns:
+            dict: the end of the last assistance (in minutes) and the number of assistances of each doctor, by name.
+        """
+
+        duration = self._policy.get_assistance_minutes()
+        file_name = self._schedule_file
+        times = self._times
+        assistances = {}
+        previous_start = 0
+
+        for line_number, line in enumerate(self.read_lines(file_name), start = NUM_HEADER_LINES + 1):
+            fields = line.split(", ")
+
+            if len(fields) != 3:
+                self.add_violation(f"expected 3 fields but found {len(fields)}", file_name, line_number)
+                continue
+
+            time, mother, doctor = fields
+            start = times[time] if time in times else self.convert_time(time)
+
+            if start is None:
+                self.add_violation(f"invalid time {time}", file_name, line_number)
+                continue
+
+            if start < previous_start:
+                self.add_violation(f"assistance of {mother} before the previous assistance", file_name, line_number)
+
+            previous_start = start
+
+            if doctor == REDIRECTED_REQUEST:
+                continue
+
+            if doctor not in doctors:
+                self.add_violation(f"doctor {doctor} not in file '{self._doctors_file}'", file_name, line_number)
+                continue
+
+            last_end, count = assistances.get(doctor, (None, 0))
+
+            if last_end is not None and start < last_end:
+                self.add_violation(f"assistance of {mother} overlaps the previous assistance of {doctor}",
+                                   file_name, line_number)
+
+            assistances[doctor] = (max(start + duration, last_end or 0), count + 1)
+
+        return assistances
+
+
+    def validate(self):
+        """
+        Sweeps the doctors and schedule files of the current ConsistencyValidator instance and checks that every doctor
+        is available after the end of their last scheduled assistance and has accumulated at least the minutes of their
+        scheduled assistances.
+
+        Returns:
+            list: a string describing each violation, with the file and line where it occurs.
+        """
+
+        duration = self._policy.get_assistance_minutes()
+
+        self._violations = []
+
+        doctors = self.sweep_doctors()
+        assistances = self.sweep_schedule(doctors)
+
+        for name, (last_end, count) in assistances.items():
+            line_number, availability, minutes_today = doctors[name]
+
+            if availability is not None and availability < last_end:
+                self.add_violation(f"doctor {name} available before the end of their last scheduled assistance",
+                                   self._doctors_file, line_number)
+
+            if minutes_today < count * duration:
+                self.add_violation(f"doctor {name} with fewer minutes than their {count} scheduled assistances",
+                                   self._doctors_file, line_number)
+
+        return self.get_violations()
@@ -0,0 +1,134 @@
+#-*- coding: utf-8 -*-
+
+
+from hashlib import blake2b
+
+
+class ContentDigest:
+    """
+    A class to represent an order-independent digest of the records of a collection, updated incrementally as records
+    are added and removed.
+
+    Note:
+        The digest is the sum, modulo 2 ** (8 * DIGEST_SIZE), of the BLAKE2b hashes of the string representations of
+        the records, so that it does not depend on their order and adding or removing a record costs a single hash.
+    """
+
+    # Size of the hash of each record, in bytes
+    DIGEST_SIZE = 16
+
+
+    def __init__(self, records = []):
+        """
+        Initializes a new ContentDigest.
+
+        Args:
+            records (list, optional): the records whose string representations are added to the digest. Defaults to an
+                                      empty list.
+        """
+
+        self._value = 0
+        self._count = 0
+
+        for record in records:
+            self.add(record)
+
+
+    def hash_record(self, record):
+        """
+        Hashes the string representation of a record.
+
+        Args:
+            record (object): the record to hash.
+
+        Returns:
+            int: the hash of the record.
+        """
+
+        return int.from_bytes(blake2b(str(record).encode("utf-8"), digest_size = self.DIGEST_SIZE).digest(), "little")
+
+
+    def add(self, record):
+        """
+        Adds a record to the current ContentDigest instance.
+
+        Args:
+            record (object): the record to add.
+        """
+
+        self._value = (self._value + self.hash_record(record)) % (1 << 8 * self.DIGEST_SIZE)
+        self._count += 1
+
+
+    def discard(self, record):
+        """
+        Removes a record from the current ContentDigest instance.
+
+        Args:
+            record (object): the record to remove, with the same string representation as when it was added.
+        """
+
+        self._value = (self._value - self.hash_record(record)) % (1 << 8 * self.DIGEST_SIZE)
+        self._count -= 1
+
+
+    def replace(self, previous_record, record):
+        """
+        Replaces a record of the current ContentDigest instance, such as a record updated in place.
+
+        Args:
+            previous_record (object): the record to remove, or its string representation before the update.
+            record (object): the record to add.
+        """
+
+        self.discard(previous_record)
+        self.add(record)
+
+
+    def get_value(self):
+        """
+        The value of the current ContentDigest instance.
+
+        Returns:
+            str: the digest, as a hexadecimal string.
+        """
+
+        return f"{self._value:0{2 * self.DIGEST_SIZE}x}"
+
+
+    def __len__(self):
+        """
+        The number of records of the current ContentDigest instance.
+
+        Returns:
+            int: the number of records added and not removed.
+        """
+
+        return self._count
+
+
+    def __eq__(self, other_digest):
+        """
+        Checks the equality between the current ContentDigest instance and another one.
+
+        Args:
+            other_digest (ContentDigest): another instance of the ContentDigest class.
+
+        Returns:
+            bool:
+                - True if both instances have the same number of records and the same value.
+                - False otherwise.
+        """
+
+        return self._count == other_digest._count and self._value == other_digest._value
+
+
+    def __str__(self):
+        """
+        The string representation of the current ContentDigest instance.
+
+        Returns:
+            str: the digest, as a hexadecimal string.
+        """
+
+        return self.get_value()
@@ -3,8 +3,10 @@
 
 from classes.Header import Header
 from classes.Time import Time
+from classes.PlanningPolicy import PlanningPolicy
 
-from constants import NUM_HEADER_LINES, FILE_TIME_INCREMENT
+from constants import NUM_HEADER_LINES, DIGEST_EXTENSION
+from constants import COMPRESSION_EXTENSIONS, COMPRESSION_MAGIC_NUMBERS, COMPRESSION_BUFFER_SIZE
 from constants import DOCTORS_FILE_INDEX, SCHEDULE_FILE_INDEX, REQUESTS_FILE_INDEX
 from constants import DOCTORS_FILE_SCOPE, SCHEDULE_FILE_SCOPE, REQUESTS_FILE_SCOPE
 
@@ -13,6 +15,13 @@ class DataManager:
     """
     A class that provides mechanisms to read and write data from or to files of the birth-plan-manager tool.
     """
+
+    # Content of each file read from memory instead of the disk, by file name
+    _file_contents = {}
+
+    # Extension of the compression of the files written, or an empty string to write them uncompressed
+    _compression = ""
+
     
     def __init__(self, file_name = None, header = None):
         """
@@ -81,11 +90,17 @@ class DataManager:
     def create_header_from_file_name(self):
         """
         Creates the Header object of the current DataManager instance from its file_name attribute.
+
+        Note:
+            Only the header lines of the file are read.
         """
 
+        from itertools import islice
+
         header = []
 
-        lines = self.open_file().readlines()
+        with self.open_file() as in_file:
+            lines = list(islice(in_file, NUM_HEADER_LINES))
             
         for i, line in enumerate(lines, start=1):
             if i in range(2, NUM_HEADER_LINES, 2):
@@ -99,16 +114,115 @@ class DataManager:
         self.set_header(Header(organization, hour, date, scope))
 
 
-    def retrieve_next_time(self):
+    @classmethod
+    def set_file_contents(cls, file_contents):
+        """
+        Sets the content of the files read from memory instead of the disk, such as the files read from a pipe.
+
+        Args:
+            file_contents (dict): the content of each file, by file name. An empty dictionary reads every file from
+                                  the disk again.
+        """
+
+        cls._file_contents = dict(file_contents)
+
+
+    @classmethod
+    def set_compression(cls, extension):
+        """
+        Sets the compression of the files written, appending its extension to their names.
+
+        Args:
+            extension (str): one of the extensions of COMPRESSION_EXTENSIONS, such as ".gz", or an empty string to
+                             write the files uncompressed.
+
+        Raises:
+            ValueError: if the extension is not one of COMPRESSION_EXTENSIONS.
+        """
+
+        if extension and extension not in COMPRESSION_EXTENSIONS:
+            raise ValueError(f"Compression error: unknown compression extension '{extension}'.")
+
+        cls._compression = extension
+
+
+    @staticmethod
+    def detect_compression(file_name, magic_number = b""):
+        """
+        Detects the compression of a file from the extension of its name or from the first bytes of its content.
+
+        Args:
+            file_name (str): the name of the file.
+            magic_number (bytes, optional): the first bytes of the content of the file. Defaults to an empty string of
+                                            bytes, which detects the compression from the extension only.
+
+        Returns:
+            str: the name of the compression module, "gzip", "bz2" or "lzma", or None if the file is not compressed.
+        """
+
+        from os.path import splitext
+
+        compression = COMPRESSION_EXTENSIONS.get(splitext(file_name)[1])
+
+        if compression:
+            return compression
+
+        for number, compression in COMPRESSION_MAGIC_NUMBERS.items():
+            if magic_number.startswith(number):
+                return compression
+
+        return None
+
+
+    @staticmethod
+    def open_compressed(file_name, compression, mode = "rb"):
+        """
+        Opens a compressed file as a binary stream, decompressed or compressed on the fly.
+
+        Args:
+            file_name (str): the name of the file.
+            compression (str): the name of the compression module, "gzip", "bz2" or "lzma".
+            mode (str, optional): the binary mode of the file, "rb" or "wb". Defaults to "rb".
+
+        Returns:
+            file: the binary stream of the decompressed content, buffered by COMPRESSION_BUFFER_SIZE bytes so that the
+                  content is decompressed in large blocks.
+
+        Note:
+            The gzip files are written without a modification time, so that the same content is always compressed to
+            the same bytes.
+        """
+
+        from io import BufferedReader, BufferedWriter
+        from importlib import import_module
+
+        if compression == "gzip":
+            from gzip import GzipFile
+            compressed_file = GzipFile(file_name, mode, mtime = 0)
+        else:
+            compressed_file = import_module(compression).open(file_name, mode)
+
+        if mode.startswith("r"):
+            return BufferedReader(compressed_file, COMPRESSION_BUFFER_SIZE)
+
+        return BufferedWriter(compressed_file, COMPRESSION_BUFFER_SIZE)
+
+
+    def retrieve_next_time(self, policy = None):
         """
         Retrieves the next update time of of the birth-plan-manager tool for the current DataManager instance.
 
+        Args:
+            policy (PlanningPolicy, optional): the rules of the hospital. Defaults to the default PlanningPolicy.
+
         Returns:
             str: the time of the next update time of of the birth-plan-manager tool for the current DataManager instance.
         """
 
+        policy = policy if policy else PlanningPolicy.default()
+
         next_time = Time(self.get_header().get_time())
-        next_time.update_time(FILE_TIME_INCREMENT)
+        next_time.add_minutes(policy.get_increment_minutes())
 
         return next_time.get_time_string()
 
@@ -119,9 +233,26 @@ class DataManager:
 
         Returns:
             file: an open file object (in read mode with UTF-8 encoding) associated with the current DataManager instance.
+
+        Note:
+            If the content of the file was set with the set_file_contents() method, it is read from memory instead. If
+            the file is compressed with gzip, bz2 or lzma, according to the extension of its name or to its first
+            bytes, it is decompressed as it is read.
         """
 
-        return open(self.get_file_name(), "r", encoding = "utf-8")
+        from io import StringIO, TextIOWrapper
+
+        if self.get_file_name() in DataManager._file_contents:
+            return StringIO(DataManager._file_contents[self.get_file_name()])
+
+        in_file = open(self.get_file_name(), "rb")
+        compression = DataManager.detect_compression(self.get_file_name(), in_file.peek(8)[:8])
+
+        if compression:
+            in_file.close()
+            in_file = DataManager.open_compressed(self.get_file_name(), compression)
+
+        return TextIOWrapper(in_file, encoding = "utf-8")
     
     
     def remove_header(self):
@@ -163,56 +294,180 @@ class DataManager:
         return file_scopes.get(file_position)
 
 
-    def create_file_name(self):
+    def scope_consistency_check(self, file_position):
+        """
+        Checks whether the scope of the header of the current DataManager instance is consistent with the scope
+        expected for its position index when running the birth-plan-manager tool.
+
+        Args:
+            file_position (int): the index representing a file position, expected to be one of DOCTORS_FILE_INDEX,
+                                 SCHEDULE_FILE_INDEX, or REQUESTS_FILE_INDEX.
+
+        Returns:
+            bool:
+                - True if the header of the current DataManager instance has the expected scope.
+                - False otherwise.
+        """
+
+        actual_header = self.get_header()
+
+        expected_header = Header(actual_header.get_organization(), actual_header.get_time(), actual_header.get_date(),
+                                 self.retrieve_file_scope(file_position))
+
+        return expected_header == actual_header
+
+
+    def create_file_name(self, policy = None):
         """
         Creates the file name associated with the next DataManager instance, according to the file name and header
         of the current DataManager instance.
 
+        Args:
+            policy (PlanningPolicy, optional): the rules of the hospital. Defaults to the default PlanningPolicy.
+
         Returns:
             str: the file name without the .txt extension to initialize the DataManager instance at the next
                  update of the birth-plan-manager tool.
         """
         
         scope = self.get_header().get_scope().lower()
-        next_time = self.retrieve_next_time()
+        next_time = self.retrieve_next_time(policy)
         new_file_name = "".join((scope, next_time))
 
         return new_file_name
 
 
-    def create_header(self):
+    def create_header(self, policy = None):
         """
         Creates the header associated with the next DataManager instance, according to the header of the current 
         DataManager instance and the next update time of the birth-plan-manager tool.
 
+        Args:
+            policy (PlanningPolicy, optional): the rules of the hospital. Defaults to the default PlanningPolicy.
+
         Returns:
             Header: the Header object to initialize the DataManager instance at the next update of the
                     birth-plan-manager tool.
         """
 
         organization = self.get_header().get_organization()
-        time = Time(self.get_header().get_time())
-        time.update_time(FILE_TIME_INCREMENT)
+        time = self.retrieve_next_time(policy)
         date = self.get_header().get_date()
         scope = self.get_header().get_scope()
         
-        return Header(organization, time.get_time_string(), date, scope)
+        return Header(organization, time, date, scope)
     
 
-    def write_file(self):
+    def get_digest(self):
+        """
+        The content digest of the current DataManager instance.
+
+        Returns:
+            ContentDigest: the order-independent digest of the records of the current DataManager instance, or None if
+                           it has no records.
+        """
+
+        return None
+
+
+    def create_file_content(self, policy = None):
+        """
+        Creates the name and content of the .txt file of the current DataManager instance, according to the
+        specifications of the birth-plan-manager tool.
+
+        Args:
+            policy (PlanningPolicy, optional): the rules of the hospital. Defaults to the default PlanningPolicy.
+
+        Returns:
+            tuple:
+                - file_name (str): the name of the file, or None if the file is not written because the update after
+                                   it is not within the operating time.
+                - content (str): the content of the file.
+        """
+
+        next_time = Time(self.retrieve_next_time(policy))
+
+        if not next_time.within_operating_time(policy):
+            return None, ""
+
+        lines = str(self).split('\n')
+
+        return "".join((lines[1], ".txt")), '\n'.join(lines[2:])
+
+
+    def create_snapshot(self, policy = None):
+        """
+        Creates an immutable snapshot of the .txt file of the current DataManager instance, which can be written
+        later, or by another thread, whatever happens to the current DataManager instance in the meantime.
+
+        Args:
+            policy (PlanningPolicy, optional): the rules of the hospital. Defaults to the default PlanningPolicy.
+
+        Returns:
+            tuple: the file name, content and content digest of the file, as strings, with None as the content digest
+                   if the current DataManager instance has none, or None if the file is not written because the update
+                   after it is not within the operating time.
+        """
+
+        file_name, content = self.create_file_content(policy)
+
+        if not file_name:
+            return None
+
+        digest = self.get_digest()
+
+        return file_name, content, None if digest is None else str(digest)
+
+
+    @classmethod
+    def write_snapshot(cls, snapshot, digest_file = False):
+        """
+        Writes a snapshot created with the create_snapshot() method to its .txt file.
+
+        Args:
+            snapshot (tuple): the file name, content and content digest of the file.
+            digest_file (bool, optional): whether the content digest is also written, once the file is written, to a
+                                          file with the same name followed by DIGEST_EXTENSION. Defaults to False.
+
+        Note:
+            If a compression was set with the set_compression() method, its extension is appended to the name of the
+            file, which is compressed.
+        """
+
+        file_name, content, digest = snapshot
+        file_name = "".join((file_name, cls._compression))
+
+        if cls._compression:
+            from io import TextIOWrapper
+            in_file = TextIOWrapper(cls.open_compressed(file_name, COMPRESSION_EXTENSIONS[cls._compression], "wb"),
+                                    encoding = "utf-8-sig")
+        else:
+            in_file = open(file_name, "w", encoding="utf-8-sig")
+
+        in_file.write(content)
+        in_file.close()
+
+        if digest is not None and digest_file:
+            with open("".join((file_name, DIGEST_EXTENSION)), "w", encoding = "utf-8") as out_file:
+                out_file.write(digest)
+
+
+    def write_file(self, policy = None, digest_file = False):
         """
         Writes the current DataManager instance to a .txt file, according to the specifications of the 
         birth-plan-manager tool.
+
+        Args:
+            policy (PlanningPolicy, optional): the rules of the hospital. Defaults to the default PlanningPolicy.
+            digest_file (bool, optional): whether the content digest of the current DataManager instance is also
+                                          written, to a file with the same name followed by DIGEST_EXTENSION. Defaults
+                                          to False.
         """
 
-        next_time = Time(self.retrieve_next_time())
+        snapshot = self.create_snapshot(policy)
 
-        if next_time.within_operating_time():
-            
-            lines = str(self).split('\n')
-            in_file = open("".join((lines[1], ".txt")), "w", encoding="utf-8-sig")
-            in_file.write('\n'.join(lines[2:]))
-            in_file.close()
+        if snapshot:
+            DataManager.write_snapshot(snapshot, digest_file)
         
 
     def __lt__(self, other_data_manager):
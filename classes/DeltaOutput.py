@@ -0,0 +1,138 @@
+#-*- coding: utf-8 -*-
+
+
+from classes.DataManager import DataManager
+from classes.PlanningObserver import PlanningObserver
+from classes.PlanningPolicy import PlanningPolicy
+
+from constants import DELTA_FILE_SCOPE
+
+
+class DeltaOutput(DataManager, PlanningObserver):
+    """
+    A class to represent the changes between the output files of an update of the birth-plan-manager tool and those of
+    the update before, recorded with the events of the planning of the next schedule, so that the doctors and schedule
+    of the next update can be patched in instead of read again.
+
+    Note:
+        The next doctors are the doctors before, with the changed doctors replaced by name. The next schedule is the
+        schedule before, without the completed assistances and with the assigned and redirected ones.
+    """
+
+    def __init__(self, doctors_collection, policy = None):
+        """
+        Initializes a new DeltaOutput.
+
+        Args:
+            doctors_collection (DoctorsCollection): the collection of doctors at the current update of the
+                                                    birth-plan-manager tool.
+            policy (PlanningPolicy, optional): the rules of the hospital. Defaults to the default PlanningPolicy.
+
+        Note:
+            The header of the delta is the header of the doctors collection at the next update, with the delta scope.
+        """
+
+        policy = policy if policy else PlanningPolicy.default()
+
+        header = doctors_collection.create_header(policy)
+        header.set_scope(DELTA_FILE_SCOPE)
+
+        super().__init__("".join((DELTA_FILE_SCOPE.lower(), header.get_time())), header)
+
+        self._doctors = {}
+        self._assistances = []
+        self._redirects = []
+        self._completed = []
+
+
+    def get_doctors(self):
+        """
+        The doctors changed in the current DeltaOutput instance.
+
+        Returns:
+            list: the changed doctors, in the order of their first change.
+        """
+
+        return list(self._doctors.values())
+
+
+    def record_assistance(self, assistance, doctor):
+        """
+        Records an assistance assigned in the update and the doctor whose working time has changed.
+
+        Args:
+            assistance (Assistance): the newly assigned assistance.
+            doctor (Doctor): the doctor carrying out the assistance, with its working time already updated.
+        """
+
+        self._assistances.append(assistance)
+        self._doctors[doctor.get_name()] = doctor
+
+
+    def record_redirect(self, assistance):
+        """
+        Records an assistance redirected to another hospital network in the update.
+
+        Args:
+            assistance (Assistance): the redirected assistance.
+        """
+
+        self._redirects.append(assistance)
+
+
+    def record_weekly_leave(self, doctor):
+        """
+        Records a doctor whose availability has been set to weekly leave in the update.
+
+        Args:
+            doctor (Doctor): the doctor on weekly leave.
+        """
+
+        self._doctors[doctor.get_name()] = doctor
+
+
+    def record_completed(self, assistance):
+        """
+        Records an assistance dropped from the schedule in the update.
+
+        Args:
+            assistance (Assistance): the completed assistance.
+        """
+
+        self._completed.append(assistance)
+
+
+    def __str__(self):
+        """
+        The string representation of the current DeltaOutput instance.
+
+        Each line shows the kind of change, followed by the line of the changed doctor or of the assistance, as in the
+        doctors and schedule files: the changed doctors first, then the assigned, redirected and completed
+        assistances, each in the order they were recorded.
+
+        Returns:
+            str: the current DeltaOutput instance as a string.
+
+        Example:
+            >>> str(deltaoutput)
+            "Filename:
+             delta10h30
+             Organization:
+             SmartMaternityCare
+             Time:
+             10h30
+             Date:
+             10:12:2023
+             Delta:
+             doctor, Brian Cooper, 3, 11h10, 120, 8h00
+             assigned, 10h50, Barbara Brooks, Brian Cooper
+             redirected, 10h30, Rachel Green, redirected to other network
+             completed, 9h50, Mary Evans, Brian Cooper"
+        """
+
+        lines = [f"doctor, {doctor}" for doctor in self._doctors.values()]
+        lines.extend(f"assigned, {assistance}" for assistance in self._assistances)
+        lines.extend(f"redirected, {assistance}" for assistance in self._redirects)
+        lines.extend(f"completed, {assistance}" for assistance in self._completed)
+
+        return super().__str__() + '\n' + '\n'.join(lines)
@@ -0,0 +1,346 @@
+#-*- coding: utf-8 -*-
+
+
+from classes.ReferencePlanner import ReferencePlanner
+
+from constants import DIFFERENTIAL_CASES, DIFFERENTIAL_DOCTORS, DIFFERENTIAL_REQUESTS, DIFFERENTIAL_SEED
+from constants import WKL_LEAVE, REDIRECTED_REQUEST, DOCTORS_FILE_SCOPE, SCHEDULE_FILE_SCOPE, REQUESTS_FILE_SCOPE
+from constants import REQUESTS_FILE_PREFIX, DIFFERENTIAL_SPEEDUP_TARGET
+
+
+class DifferentialBenchmark:
+    """
+    A class that plans randomized updates of the birth-plan-manager tool with both the planner of the tool and the
+    ReferencePlanner class, checks that their output files are byte-identical and compares their planning times.
+
+    Note:
+        The inputs are generated from a fixed seed, so that every run checks the same cases, and are dense with ties:
+        few distinct availabilities, categories, minutes in the day, weekly times, ages, wristbands and risks, names
+        sharing long prefixes, repeated requests and requests for mothers already on the schedule. Both planners
+        plan each update from the same collections read from its input files, and only the planning is timed.
+    """
+
+    def __init__(self, cases = DIFFERENTIAL_CASES, doctors = DIFFERENTIAL_DOCTORS, requests = DIFFERENTIAL_REQUESTS,
+                 seed = DIFFERENTIAL_SEED, policy_overrides = {}):
+        """
+        Initializes a new DifferentialBenchmark.
+
+        Args:
+            cases (int, optional): the number of generated updates. Defaults to DIFFERENTIAL_CASES.
+            doctors (int, optional): the number of doctors of each generated update. Defaults to DIFFERENTIAL_DOCTORS.
+            requests (int, optional): the number of requests of each generated update. Defaults to
+                                      DIFFERENTIAL_REQUESTS.
+            seed (int, optional): the seed of the generated updates. Defaults to DIFFERENTIAL_SEED.
+            policy_overrides (dict, optional): the rules of the hospital that override those of the organization, as
+                                               keyword arguments of the PlanningPolicy class. Defaults to an empty
+                                               dictionary.
+        """
+
+        self._cases = cases
+        self._doctors = doctors
+        self._requests = requests
+        self._seed = seed
+        self._policy_overrides = policy_overrides
+
+
+    def create_inputs(self, generator):
+        """
+        Generates the lines of the three input files of an update.
+
+        Args:
+            generator (random.Random): the seeded generator of the update.
+
+        Returns:
+            tuple:
+                - time (str): the time of the update.
+                - doctors (list): the lines of content of the doctors file.
+                - schedule (list): the lines of content of the schedule file.
+                - requests (list): the lines of content of the requests file.
+        """
+
+        minutes = generator.choice(range(480, 1170, 30))
+        time = f"{minutes // 60}h{minutes % 60:02d}"
+
+        doctors = []
+
+        for i in range(self._doctors):
+            name = f"Doctor {generator.choice('ABC')}{i:04d}"
+            weekly_time = generator.choice(("12h00", "39h00", "39h20", "39h40", "40h00"))
+            availability = generator.choice(range(minutes - 30, minutes + 90, 10))
+
+            if weekly_time == "40h00":
+                availability = WKL_LEAVE
+            elif generator.random() < 0.1:
+                availability = f"{availability // 60:02d}h{availability % 60:02d}"
+            else:
+                availability = f"{availability // 60}h{availability % 60:02d}"
+
+            doctors.append(f"{name}, {generator.choice('123')}, {availability}, "
+                           f"{generator.choice((0, 200, 220, 240, 260))}, {weekly_time}")
+
+        schedule = []
+        on_schedule = []
+
+        for i in range(self._requests // 10):
+            start = generator.choice(range(minutes - 40, minutes + 60, 10))
+            doctor = doctors[generator.randrange(len(doctors))].split(", ")[0]
+            mother = f"Mother {generator.choice('AB')}{i:05d}"
+
+            schedule.append((start, mother, generator.choice((doctor, doctor, REDIRECTED_REQUEST))))
+            on_schedule.append(mother)
+
+        schedule = [f"{start // 60}h{start % 60:02d}, {mother}, {doctor}" for start, mother, doctor in sorted(schedule)]
+
+        requests = []
+
+        for i in range(self._requests):
+            if generator.random() < 0.1 and requests:
+                name = generator.choice(requests).split(", ")[0]
+            elif generator.random() < 0.05:
+                name = generator.choice(on_schedule)
+            else:
+                name = f"Mother {generator.choice('AB')}{self._requests + i:05d}"
+
+            age = generator.choice((20, 30, 40))
+            wristband = generator.choice(("green", "yellow", "red"))
+            risk = generator.choice(("low", "medium", "high"))
+
+            requests.append(f"{name}, {age}, {wristband}, {risk}")
+
+        return time, doctors, schedule, requests
+
+
+    def write_inputs(self, directory, time, doctors, schedule, requests):
+        """
+        Writes the three input files of an update to a directory.
+
+        Args:
+            directory (str): the directory of the input files.
+            time (str): the time of the update.
+            doctors (list): the lines of content of the doctors file.
+            schedule (list): the lines of content of the schedule file.
+            requests (list): the lines of content of the requests file.
+
+        Returns:
+            tuple: the names of the doctors, schedule and requests files.
+        """
+
+        from os.path import join
+
+        file_names = []
+
+        for prefix, scope, lines in (("doctors", DOCTORS_FILE_SCOPE, doctors),
+                                     ("schedule", SCHEDULE_FILE_SCOPE, schedule),
+                                     (REQUESTS_FILE_PREFIX, REQUESTS_FILE_SCOPE, requests)):
+            file_name = join(directory, "".join((prefix, time, ".txt")))
+            header = ["Organization:", "SmartMaternityCare", "Time:", time, "Date:", "10:12:2023", f"{scope}:"]
+
+            with open(file_name, "w", encoding = "utf-8") as out_file:
+                out_file.write("\n".join(header + lines))
+
+            file_names.append(file_name)
+
+        return tuple(file_names)
+
+
+    def load_inputs(self, input_files):
+        """
+        Reads the input files of an update and compiles its rules, as the birth-plan-manager tool does before planning.
+
+        Args:
+            input_files (tuple): the names of the doctors, schedule and requests files.
+
+        Returns:
+            tuple:
+                - schedule (Schedule): the schedule of the update.
+                - doctors_collection (DoctorsCollection): the doctors of the update.
+                - mothers_collection (MothersCollection): the requests of the update, without the mothers already on
+                                                          the schedule.
+                - policy (PlanningPolicy): the rules of the hospital, with the overrides of the benchmark.
+        """
+
+        from classes.Registry import Registry
+        from classes.Schedule import Schedule
+        from classes.PlanningPolicy import PlanningPolicy
+        from classes.DoctorsCollection import DoctorsCollection
+        from classes.MothersCollection import MothersCollection
+
+        doctors_file, schedule_file, requests_file = input_files
+
+        doctors_collection = DoctorsCollection(doctors_file)
+        policy = PlanningPolicy.for_organization(doctors_collection.get_header().get_organization(),
+                                                 **self._policy_overrides)
+
+        mothers_collection = MothersCollection(requests_file)
+        schedule = Schedule(schedule_file, registry = Registry(doctors_collection))
+
+        mothers_collection.remove_scheduled_mothers(schedule)
+
+        return schedule, doctors_collection, mothers_collection, policy
+
+
+    def create_outputs(self, schedule, doctors_collection, next_schedule, next_doctors, policy):
+        """
+        Creates the output files of an update from its next schedule and doctors, as the birth-plan-manager tool
+        writes them.
+
+        Args:
+            schedule (Schedule): the schedule of the update.
+            doctors_collection (DoctorsCollection): the doctors of the update.
+            next_schedule (Schedule): the schedule of the next update.
+            next_doctors (DoctorsCollection): the doctors of the next update.
+            policy (PlanningPolicy): the rules of the hospital.
+
+        Returns:
+            dict: the content of each output file, by file name.
+        """
+
+        from classes.DoctorsCollection import DoctorsCollection
+
+        next_schedule.set_file_name(schedule.create_file_name(policy))
+        next_schedule.set_header(schedule.create_header(policy))
+
+        next_doctors_collection = DoctorsCollection(doctors = next_doctors.get_doctors())
+        next_doctors_collection.set_file_name(doctors_collection.create_file_name(policy))
+        next_doctors_collection.set_header(doctors_collection.create_header(policy))
+
+        outputs = {}
+
+        for output_file in (next_schedule, next_doctors_collection):
+            file_name, content = output_file.create_file_content(policy)
+
+            if file_name:
+                outputs[file_name] = content
+
+        return outputs
+
+
+    def run_planner(self, schedule, doctors_collection, mothers_collection, policy):
+        """
+        Plans an update with the planner of the birth-plan-manager tool.
+
+        Args:
+            schedule (Schedule): the schedule of the update.
+            doctors_collection (DoctorsCollection): the doctors of the update.
+            mothers_collection (MothersCollection): the requests of the update.
+            policy (PlanningPolicy): the rules of the hospital.
+
+        Returns:
+            tuple:
+                - outputs (dict): the content of each output file, by file name.
+                - elapsed (float): the planning time, in seconds.
+        """
+
+        from time import perf_counter
+
+        start = perf_counter()
+        next_schedule, next_doctors = schedule.create_next_schedule(doctors_collection, mothers_collection,
+                                                                    policy = policy)
+        elapsed = perf_counter() - start
+
+        return self.create_outputs(schedule, doctors_collection, next_schedule, next_doctors, policy), elapsed
+
+
+    def run_reference(self, schedule, doctors_collection, mothers_collection, policy):
+        """
+        Plans an update with the ReferencePlanner class.
+
+        Args:
+            schedule (Schedule): the schedule of the update.
+            doctors_collection (DoctorsCollection): the doctors of the update.
+            mothers_collection (MothersCollection): the requests of the update.
+            policy (PlanningPolicy): the rules of the hospital.
+
+        Returns:
+            tuple:
+                - outputs (dict): the content of each output file, by file name.
+                - elapsed (float): the planning time, in seconds.
+        """
+
+        from time import perf_counter
+
+        start = perf_counter()
+        next_schedule, next_doctors = ReferencePlanner(policy).plan(schedule, doctors_collection, mothers_collection)
+        elapsed = perf_counter() - start
+
+        return self.create_outputs(schedule, doctors_collection, next_schedule, next_doctors, policy), elapsed
+
+
+    def compare_outputs(self, outputs, expected_outputs):
+        """
+        Finds the first difference between the output files of the planner and those of the ReferencePlanner class.
+
+        Args:
+            outputs (dict): the content of each output file of the planner, by file name.
+            expected_outputs (dict): the content of each output file of the ReferencePlanner class, by file name.
+
+        Returns:
+            str: the description of the first difference, or None if the output files are identical.
+        """
+
+        if sorted(outputs) != sorted(expected_outputs):
+            return f"files {sorted(outputs)} instead of {sorted(expected_outputs)}"
+
+        for file_name in sorted(outputs):
+            lines = outputs[file_name].split("\n")
+            expected_lines = expected_outputs[file_name].split("\n")
+
+            for line_number, (line, expected_line) in enumerate(zip(lines, expected_lines), start = 1):
+                if line != expected_line:
+                    return f"{file_name}, line {line_number}: '{line}' instead of '{expected_line}'"
+
+            if outputs[file_name] != expected_outputs[file_name]:
+                return f"{file_name}: {len(lines)} lines instead of {len(expected_lines)}"
+
+        return None
+
+
+    def create_report(self):
+        """
+        Plans every generated update with both planners and compares their output files and planning times.
+
+        Returns:
+            tuple:
+                - lines (list): the lines of the report, one for each update whose output files differ, followed by
+                                the summary of the comparison and by a line if the planner misses
+                                DIFFERENTIAL_SPEEDUP_TARGET.
+                - on_target (bool): True if the output files of every update are identical and the planner reaches
+                                    DIFFERENTIAL_SPEEDUP_TARGET times the speed of the ReferencePlanner class, False
+                                    otherwise.
+        """
+
+        from random import Random
+        from tempfile import TemporaryDirectory
+
+        generator = Random(self._seed)
+        lines = []
+        planner_time = reference_time = 0.0
+
+        for case in range(self._cases):
+            with TemporaryDirectory() as directory:
+                inputs = self.load_inputs(self.write_inputs(directory, *self.create_inputs(generator)))
+
+            outputs, elapsed = self.run_planner(*inputs)
+            planner_time += elapsed
+
+            expected_outputs, elapsed = self.run_reference(*inputs)
+            reference_time += elapsed
+
+            difference = self.compare_outputs(outputs, expected_outputs)
+
+            if difference:
+                lines.append(f"Case {case} (seed {self._seed}): {difference}")
+
+        identical = not lines
+
+        lines.append(f"{self._cases - len(lines)} of {self._cases} cases identical, {self._doctors} doctors and "
+                     f"{self._requests} requests each")
+        lines.append(f"Planner {planner_time * 1000:.1f} ms, reference {reference_time * 1000:.1f} ms, "
+                     f"speedup {reference_time / planner_time:.2f}x")
+
+        fast = reference_time / planner_time >= DIFFERENTIAL_SPEEDUP_TARGET
+
+        if not fast:
+            lines.append(f"Planner slower than the target of {DIFFERENTIAL_SPEEDUP_TARGET}x the reference")
+
+        return lines, identical and fast
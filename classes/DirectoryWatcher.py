@@ -0,0 +1,162 @@
+#-*- coding: utf-8 -*-
+
+
+from classes.ArchiveCatalog import ArchiveCatalog
+from classes.PlanningPolicy import PlanningPolicy
+
+from constants import DOCTORS_FILE_SCOPE, SCHEDULE_FILE_SCOPE, REQUESTS_FILE_SCOPE
+
+
+class DirectoryWatcher:
+    """
+    A class that watches a directory for the requests files of the birth-plan-manager tool, so that each update is
+    planned as soon as its requests file is complete, from the doctors and schedule files of the update before.
+
+    Note:
+        The directory is polled with an ArchiveCatalog, which only reads the headers of the new or modified files at
+        each poll. A requests file is complete once it starts with a valid header of the requests scope and its
+        modification time and size have not changed between two polls, so that a file still being written is not
+        planned. A requests file modified after it was planned is planned again, and the requests files already in
+        the directory when the watch starts are not planned. A requests file deferred because its doctors and schedule
+        files are not in the directory yet is returned again by each poll, until it is resumed.
+    """
+
+    def __init__(self, directory, policy_overrides = {}):
+        """
+        Initializes a new DirectoryWatcher, with the requests files already in the directory taken as planned.
+
+        Args:
+            directory (str): the watched directory.
+            policy_overrides (dict, optional): the planning rules that override those of the organization, as keyword
+                                               arguments of the PlanningPolicy class, whose time increment between
+                                               updates is used to find the input files of an update. Defaults to an
+                                               empty dictionary.
+        """
+
+        self._catalog = ArchiveCatalog(directory)
+        self._catalog.scan()
+        self._policy_overrides = policy_overrides
+        self._pending = {}
+        self._deferred = set()
+        self._planned = {path: self._catalog.get_signature(path)
+                         for path in self._catalog.in_scope(REQUESTS_FILE_SCOPE)}
+
+
+    def get_directory(self):
+        """
+        The watched directory of the current DirectoryWatcher instance.
+
+        Returns:
+            str: the watched directory.
+        """
+
+        return self._catalog.get_directory()
+
+
+    def poll(self):
+        """
+        Polls the watched directory of the current DirectoryWatcher instance for the requests files that became
+        complete since the poll before.
+
+        Returns:
+            list: the paths of the complete requests files and of the deferred ones, sorted by date and time, each one
+                  taken as planned.
+        """
+
+        self._catalog.scan()
+
+        requests_files = self._catalog.in_scope(REQUESTS_FILE_SCOPE)
+        complete_files = []
+
+        for path in requests_files:
+            signature = self._catalog.get_signature(path)
+
+            if self._planned.get(path) == signature:
+                self._pending.pop(path, None)
+
+                if path in self._deferred:
+                    complete_files.append(path)
+
+            elif self._pending.get(path) != signature:
+                self._pending[path] = signature
+
+            else:
+                del self._pending[path]
+                self._planned[path] = signature
+                complete_files.append(path)
+
+        for path in set(self._pending).union(self._planned).difference(requests_files):
+            self._pending.pop(path, None)
+            self._planned.pop(path, None)
+
+        self._deferred.intersection_update(requests_files)
+
+        return complete_files
+
+
+    def defer(self, requests_file):
+        """
+        Defers a requests file whose input files are not in the watched directory yet, so that it is returned again by
+        the next polls.
+
+        Args:
+            requests_file (str): the path of the requests file, as returned by the poll() method.
+
+        Returns:
+            bool:
+                - True if the requests file was not deferred before.
+                - False otherwise.
+        """
+
+        deferred = requests_file in self._deferred
+        self._deferred.add(requests_file)
+
+        return not deferred
+
+
+    def resume(self, requests_file):
+        """
+        Stops deferring a requests file, once it has been planned.
+
+        Args:
+            requests_file (str): the path of the requests file, as returned by the poll() method.
+        """
+
+        self._deferred.discard(requests_file)
+
+
+    def find_inputs(self, requests_file):
+        """
+        Finds the doctors and schedule files of the update of a requests file, as those of its organization and date
+        whose time is the time of the requests file minus the time increment between updates, rescanning the watched
+        directory first, so that the output files of the update planned before are found.
+
+        Args:
+            requests_file (str): the path of the requests file, as returned by the poll() method.
+
+        Returns:
+            tuple: the paths of the doctors and schedule files, each one None if there is no such file.
+        """
+
+        self._catalog.scan()
+
+        header = self._catalog.get_header(requests_file)
+
+        if header is None:
+            return None, None
+
+        policy = PlanningPolicy.for_organization(header.get_organization(), **self._policy_overrides)
+        key = self._catalog.create_key(header.get_date(), header.get_time())
+        key = key[:3] + (key[3] - policy.get_increment_minutes(),)
+        input_files = []
+
+        for scope in (DOCTORS_FILE_SCOPE, SCHEDULE_FILE_SCOPE):
+            path = self._catalog.latest_before(scope, header.get_date(), header.get_time(), header.get_organization())
+            input_header = self._catalog.get_header(path) if path else None
+
+            if input_header and self._catalog.create_key(input_header.get_date(), input_header.get_time()) == key:
+                input_files.append(path)
+            else:
+                input_files.append(None)
+
+        return tuple(input_files)
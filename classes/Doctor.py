@@ -3,7 +3,7 @@
 
 from classes.Time import Time
 
-from constants import MAX_WORK_TIME, DAILY_BREAK, ASSISTANCE_DURATION
+from classes.PlanningPolicy import PlanningPolicy
 
 
 class Doctor:
@@ -141,46 +141,52 @@ class Doctor:
         self._weekly_time = weekly_time
     
 
-    def weekly_leave_check(self):
+    def weekly_leave_check(self, policy = None):
         """
         Checks whether the current Doctor instance has reached its maximum allowed weekly working time.
 
+        Args:
+            policy (PlanningPolicy, optional): the rules of the hospital. Defaults to the default PlanningPolicy.
+
         Returns:
             bool:
                 - True if the current Doctor instance has reached the maximum weekly work time.
                 - False otherwise.
         """
 
-        weekly_time_object = Time(self.get_weekly_time()).get_time_delta()
-        max_weekly_time_object = Time(MAX_WORK_TIME).get_time_delta()
+        policy = policy if policy else PlanningPolicy.default()
 
-        return weekly_time_object >= max_weekly_time_object
+        return policy.weekly_leave_check(Time(self.get_weekly_time()).convert_time_to_minutes())
             
 
-    def daily_break_check(self):
+    def daily_break_check(self, policy = None):
         """
         Checks whether the current Doctor instance has reached its maximum daily working time for the first time
-        without taking a break and, if so, increments its availability by 1 hour.
+        without taking a break and, if so, increments its availability by the daily break.
+
+        Args:
+            policy (PlanningPolicy, optional): the rules of the hospital. Defaults to the default PlanningPolicy.
 
         Note:
-            The availability of the current Doctor instance is incremented by 1 hour if the condition is met.
+            The availability of the current Doctor instance is incremented by the daily break if the condition is met.
         """
 
-        daily_work_minutes = int(self.get_minutes_today())
-        
-        if 240 <= daily_work_minutes <260:
+        policy = policy if policy else PlanningPolicy.default()
+
+        if policy.daily_break_check(int(self.get_minutes_today())):
             availability = Time(self.get_availability())
-            availability.update_time(DAILY_BREAK)
+            availability.add_minutes(policy.get_break_minutes())
             self.set_availability(availability.get_time_string())    
     
 
-    def adjust_availability(self, next_time):
+    def adjust_availability(self, next_time, policy = None):
         """
         Adjusts the availability of the current Doctor instance, according to the next update of the birth-plan-manager
         tool and the duration of an assistance.
 
         Args:
             next_time (Time): the time of the next update of the birth-plan-manager tool.
+            policy (PlanningPolicy, optional): the rules of the hospital. Defaults to the default PlanningPolicy.
         
         Returns:
             tuple:
@@ -188,21 +194,23 @@ class Doctor:
                 - adjusted_availability (Time): the adjusted availability of the doctor carrying out the assistance.
         """
 
+        policy = policy if policy else PlanningPolicy.default()
+
         availability = Time(self.get_availability())
 
         if availability.get_time_delta() < next_time.get_time_delta():
             assistance_time = Time(next_time.get_time_string())
             adjusted_availability = Time(next_time.get_time_string())
-            adjusted_availability.update_time(ASSISTANCE_DURATION)
+            adjusted_availability.add_minutes(policy.get_assistance_minutes())
         else:
             assistance_time = Time(availability.get_time_string())
             adjusted_availability = Time(self.get_availability())
-            adjusted_availability.update_time(ASSISTANCE_DURATION)
+            adjusted_availability.add_minutes(policy.get_assistance_minutes())
         
         return assistance_time, adjusted_availability
     
 
-    def update_working_time(self, adjusted_availability):
+    def update_working_time(self, adjusted_availability, policy = None):
         """
         Updates the availability, minutes_today and weekly_time attributes of a Doctor instance to whom an
         assistance has been assigned to.
@@ -210,21 +218,43 @@ class Doctor:
         Args:
             adjusted_availability (Time): the newly calculated availability time for the Doctor instance, adjusted according
                                           to the assistance duration and the next update of the birth-plan-manager tool.
+            policy (PlanningPolicy, optional): the rules of the hospital. Defaults to the default PlanningPolicy.
         
         Note:
             The current Doctor instance is updated with regards to its availability, minutes_today and weekly_time attributes.
         """
 
+        policy = policy if policy else PlanningPolicy.default()
+
         self.set_availability(adjusted_availability.get_time_string())
 
-        new_minutes_today = int(self.get_minutes_today()) + Time(ASSISTANCE_DURATION).convert_minutes_to_int()
+        new_minutes_today = int(self.get_minutes_today()) + policy.get_assistance_minutes()
         self.set_minutes_today(str(new_minutes_today))
 
         weekly_time = Time(self.get_weekly_time())
-        weekly_time.update_time(ASSISTANCE_DURATION) 
+        weekly_time.add_minutes(policy.get_assistance_minutes())
         self.set_weekly_time(weekly_time.get_time_string())
 
 
+    def priority_key(self):
+        """
+        The key that orders the current Doctor instance among other doctors as the __lt__() method does, with each of
+        its times converted only once.
+
+        Returns:
+            tuple: the availability in minutes, the negated category, the minutes in the day, the weekly time in minutes
+                   and the name of the current Doctor instance, or None if one of them is missing, in which case the
+                   __lt__() method only compares the names.
+        """
+
+        if not (self.get_name() and self.get_category() and self.get_availability() and self.get_minutes_today() and
+                self.get_weekly_time()):
+            return None
+
+        return (Time(self.get_availability()).convert_time_to_minutes(), -int(self.get_category()),
+                int(self.get_minutes_today()), Time(self.get_weekly_time()).convert_time_to_minutes(), self.get_name())
+
+
     def __lt__(self, other_doctor):
         """
         Compares the current Doctor instance and another one, according to the priority criteria defined in the
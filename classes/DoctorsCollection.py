@@ -3,9 +3,12 @@
 
 from classes.Doctor import Doctor
 from classes.DataManager import DataManager
+from classes.PlanningPolicy import PlanningPolicy
+from classes.ContentDigest import ContentDigest
 
 from copy import deepcopy
-from constants import WKL_LEAVE, MIN_CATEG
+from operator import itemgetter
+from constants import WKL_LEAVE
 
 
 class DoctorsCollection(DataManager):
@@ -29,6 +32,7 @@ class DoctorsCollection(DataManager):
         
         super().__init__(file_name, header)
         self._doctors = deepcopy(doctors)
+        self._digest = ContentDigest(self._doctors)
         
         if self.get_file_name() and not self.get_doctors():
             self.set_doctors()
@@ -62,9 +66,35 @@ class DoctorsCollection(DataManager):
             for line in in_file:
                 name, category, availability, accumulated_work_minutes, weekly_work_time = line.rstrip().split(", ")                
                 self._doctors.append(Doctor(name, category, availability, accumulated_work_minutes, weekly_work_time))
+                self._digest.add(self._doctors[-1])
 
         else:
             self._doctors = doctors
+            self._digest = ContentDigest(doctors)
+
+
+    def get_digest(self):
+        """
+        The content digest of the current DoctorsCollection instance, kept up to date as doctors are added or updated.
+
+        Returns:
+            ContentDigest: the order-independent digest of the doctors of the current DoctorsCollection instance.
+        """
+
+        return self._digest
+
+
+    def refresh_digest(self, previous_doctor, doctor):
+        """
+        Updates the content digest of the current DoctorsCollection instance after one of its doctors has been
+        updated in place.
+
+        Args:
+            previous_doctor (str): the string representation of the doctor before the update.
+            doctor (Doctor): the updated doctor.
+        """
+
+        self._digest.replace(previous_doctor, doctor)
 
 
     def doctors_items(self):
@@ -79,59 +109,94 @@ class DoctorsCollection(DataManager):
             yield doctor
 
 
-    def sort_doctors(self):
+    def sort_doctors(self, policy = None):
         """
         Sorts the doctors in the current DoctorsCollection instance, who are not on weekly leave, from highest to
         lowest availability, according to the criteria defined in the specification of the birth-plan-manager tool.
+
+        Args:
+            policy (PlanningPolicy, optional): the rules of the hospital. Defaults to the default PlanningPolicy.
         
         Returns:
             list: a new list of sorted Doctor objects who are available for an assistance.
+
+        Note:
+            The doctors are sorted by their priority keys, computed once per doctor, in the same order as their
+            __lt__() method, which is only used when a doctor has a missing field.
         """
 
         doctors_to_sort = []
 
         for doctor in self.doctors_items():
-            if not doctor.weekly_leave_check():
+            if not doctor.weekly_leave_check(policy):
                 doctors_to_sort.append(doctor)
 
-        return sorted(doctors_to_sort)
+        keys = [doctor.priority_key() for doctor in doctors_to_sort]
+
+        if None in keys:
+            return sorted(doctors_to_sort)
+
+        return [doctor for _, doctor in sorted(zip(keys, doctors_to_sort), key = itemgetter(0))]
 
     
-    def select_doctor(self, min_category=False):
+    def select_doctor(self, min_category=False, policy = None, lookahead = None):
         """
         Selects the doctor for an assistance according to the specifications of the birth-plan-manager tool.
 
         This method finds the most appropriate doctor who:
-        1. Has a category of at least 2 for high-risk mothers.
+        1. Has a category of at least 2 (or the minimum category of the policy) for high-risk mothers.
         2. Is not on weekly leave.
 
+        Args:
+            min_category (bool, optional): whether the doctor must have the minimum category for a high risk
+                                           assistance. Defaults to False.
+            policy (PlanningPolicy, optional): the rules of the hospital. Defaults to the default PlanningPolicy.
+            lookahead (Lookahead, optional): the lookahead whose reserved working time the doctors of a request that
+                                             is not high risk must leave untouched. Defaults to None.
+
         Returns:
             Doctor: the selected doctor for an assistance.
             None: if no doctor is available that satisfies the criteria.
         """
 
-        for doctor in self.sort_doctors():
+        policy = policy if policy else PlanningPolicy.default()
+
+        for doctor in self.sort_doctors(policy):
             
             if min_category:
-                category_check = int(doctor.get_category()) >= MIN_CATEG
+                category_check = int(doctor.get_category()) >= policy.get_min_category()
                 if category_check:
                     return doctor
                 
-            else:
+            elif lookahead is None or lookahead.reserve_check(doctor):
                 return doctor
 
         return None
     
 
-    def add_weekly_leave(self):
+    def add_weekly_leave(self, policy = None):
         """
         Checks whether each Doctor object in the doctors list of the current DoctorsCollection instance has reached the
         maximum allowed value for their weekly_time attribute and, if so, updates their availability to 'weekly leave'.
+
+        Args:
+            policy (PlanningPolicy, optional): the rules of the hospital. Defaults to the default PlanningPolicy.
+
+        Returns:
+            list: the Doctor objects whose availability has been changed to 'weekly leave', in the order of the
+                  collection.
         """
 
+        doctors_on_leave = []
+
         for doctor in self.doctors_items():
-            if doctor.weekly_leave_check():
+            if doctor.weekly_leave_check(policy) and doctor.get_availability() != WKL_LEAVE:
+                previous_doctor = str(doctor)
                 doctor.set_availability(WKL_LEAVE)
+                self.refresh_digest(previous_doctor, doctor)
+                doctors_on_leave.append(doctor)
+
+        return doctors_on_leave
 
 
     def __lt__(self, other_doctors_collection):
@@ -161,15 +226,14 @@ class DoctorsCollection(DataManager):
         
         Returns:
             bool:
-                - True if both instances have the same Doctor objects in their doctors attribute.
+                - True if both instances have the same doctors in their doctors attribute, in any order.
                 - False otherwise.
+
+        Note:
+            The content digests of both instances are compared, so the comparison takes constant time.
         """
 
-        if len(self.get_doctors()) != len(other_doctors_collection.get_doctors()):
-            return False
-        
-        return all(x == y for x, y in zip(sorted(self.get_doctors()), 
-                                          sorted(other_doctors_collection.get_doctors())))
+        return self.get_digest() == other_doctors_collection.get_digest()
 
 
     def __str__(self):
@@ -3,8 +3,6 @@
 
 from classes.Time import Time
 
-from datetime import datetime
-
 
 class Header:
     """
@@ -136,6 +134,8 @@ class Header:
         if self.get_date() == other_header.get_date():
             return Time(self.get_time()) < Time(other_header.get_time())
 
+        from datetime import datetime
+
         return datetime.strptime(self.get_date(), '%d:%m:%Y').date() < \
                 datetime.strptime(other_header.get_date(), '%d:%m:%Y').date()
 
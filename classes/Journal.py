@@ -0,0 +1,333 @@
+#-*- coding: utf-8 -*-
+
+
+from classes.Time import Time
+from classes.Header import Header
+from classes.PlanningPolicy import PlanningPolicy
+from classes.PlanningObserver import PlanningObserver
+
+from constants import JOURNAL_SNAPSHOT_INTERVAL, JOURNAL_INDEX_EXTENSION, DOCTORS_FILE_SCOPE, SCHEDULE_FILE_SCOPE
+
+
+class Journal(PlanningObserver):
+    """
+    A class to represent an append-only journal of the updates of the birth-plan-manager tool, recording the changes
+    of each update and periodic full snapshots, from which the state at any journaled update can be replayed.
+
+    Note:
+        Each entry of the journal is a line of JSON. The index of the journal, in a file with the same name followed
+        by JOURNAL_INDEX_EXTENSION, has a line with the date, time, byte offset and kind of each entry, so that
+        replays seek directly to the nearest snapshot.
+    """
+
+    def __init__(self, file_name, snapshot_interval = JOURNAL_SNAPSHOT_INTERVAL, policy_overrides = {}):
+        """
+        Initializes a new Journal.
+
+        Args:
+            file_name (str): the name of the journal file.
+            snapshot_interval (int, optional): the number of updates between full snapshots. Defaults to
+                                               JOURNAL_SNAPSHOT_INTERVAL.
+            policy_overrides (dict, optional): the planning rules that override those of the organization of each
+                                               journaled update, as keyword arguments of the PlanningPolicy class.
+                                               Defaults to an empty dictionary.
+        """
+
+        self._file_name = file_name
+        self._snapshot_interval = snapshot_interval
+        self._policy_overrides = policy_overrides
+        self._doctors = {}
+        self._assistances = []
+        self._redirects = []
+        self._completed = []
+
+
+    def get_file_name(self):
+        """
+        The name of the journal file of the current Journal instance.
+
+        Returns:
+            str: the name of the journal file.
+        """
+
+        return self._file_name
+
+
+    def get_policy(self, organization):
+        """
+        The rules of the hospital of an organization in the current Journal instance, with its overrides.
+
+        Args:
+            organization (str): the organization of a journaled update.
+
+        Returns:
+            PlanningPolicy: the rules of the hospital.
+        """
+
+        return PlanningPolicy.for_organization(organization, **self._policy_overrides)
+
+
+    def get_index_file_name(self):
+        """
+        The name of the index file of the current Journal instance.
+
+        Returns:
+            str: the name of the index file.
+        """
+
+        return "".join((self.get_file_name(), JOURNAL_INDEX_EXTENSION))
+
+
+    def get_index(self):
+        """
+        The index of the entries of the current Journal instance, in the order they were appended.
+
+        Returns:
+            list: a tuple with the date, time, byte offset and kind ("snapshot" or "delta") of each entry.
+        """
+
+        from os.path import exists
+
+        index = []
+
+        if exists(self.get_index_file_name()):
+            with open(self.get_index_file_name(), "r", encoding = "utf-8") as in_file:
+                for line in in_file:
+                    date, time, offset, kind = line.rstrip().split(", ")
+                    index.append((date, time, int(offset), kind))
+
+        return index
+
+
+    def record_assistance(self, assistance, doctor):
+        """
+        Records an assistance assigned in the update and the doctor whose working time has changed.
+
+        Args:
+            assistance (Assistance): the newly assigned assistance.
+            doctor (Doctor): the doctor carrying out the assistance, with its working time already updated.
+        """
+
+        self._assistances.append(str(assistance))
+        self._doctors[doctor.get_name()] = doctor
+
+
+    def record_redirect(self, assistance):
+        """
+        Records an assistance redirected to another hospital network in the update.
+
+        Args:
+            assistance (Assistance): the redirected assistance.
+        """
+
+        self._redirects.append(str(assistance))
+
+
+    def record_weekly_leave(self, doctor):
+        """
+        Records a doctor whose availability has been set to weekly leave in the update.
+
+        Args:
+            doctor (Doctor): the doctor on weekly leave.
+        """
+
+        self._doctors[doctor.get_name()] = doctor
+
+
+    def record_completed(self, assistance):
+        """
+        Records an assistance dropped from the schedule in the update.
+
+        Args:
+            assistance (Assistance): the completed assistance.
+        """
+
+        self._completed.append(str(assistance))
+
+
+    def previous_update_check(self, index_entry, header):
+        """
+        Checks whether an entry of the index of the current Journal instance is the update right before the update of
+        a given header, so that the changes of the latter can be applied to the former.
+
+        Args:
+            index_entry (tuple): the date, time, byte offset and kind of an entry of the index.
+            header (Header): the header of the next schedule.
+
+        Returns:
+            bool:
+                - True if the entry has the same date and is the time increment of the policy before the time of
+                  the header.
+                - False otherwise.
+        """
+
+        date, time, _, _ = index_entry
+
+        next_time = Time(time)
+        next_time.add_minutes(self.get_policy(header.get_organization()).get_increment_minutes())
+
+        return date == header.get_date() and next_time.get_time_string() == header.get_time()
+
+
+    def commit(self, schedule, doctors_collection):
+        """
+        Appends the entry of an update to the current Journal instance: a full snapshot of the next schedule and
+        doctors if no snapshot was appended in the last snapshot_interval updates or if the previous entry is not the
+        update right before, or the changes recorded during the planning otherwise.
+
+        Args:
+            schedule (Schedule): the next schedule, with its header set.
+            doctors_collection (DoctorsCollection): the next collection of doctors.
+        """
+
+        from json import dumps
+        from os import fsync
+
+        header = schedule.get_header()
+        index = self.get_index()
+        kinds = [kind for _, _, _, kind in index[-self._snapshot_interval:]]
+
+        entry = {"organization": header.get_organization(), "date": header.get_date(), "time": header.get_time()}
+
+        if "snapshot" not in kinds or not self.previous_update_check(index[-1], header):
+            kind = "snapshot"
+            entry["doctors"] = [str(doctor) for doctor in doctors_collection.doctors_items()]
+            entry["schedule"] = [str(assistance) for assistance in schedule.schedule_items()]
+
+        else:
+            kind = "delta"
+            entry["doctors"] = [str(doctor) for doctor in self._doctors.values()]
+            entry["assistances"] = self._assistances
+            entry["redirects"] = self._redirects
+            entry["completed"] = self._completed
+
+        entry["kind"] = kind
+
+        with open(self.get_file_name(), "ab") as out_file:
+            offset = out_file.seek(0, 2)
+            out_file.write(dumps(entry).encode("utf-8") + b"\n")
+            out_file.flush()
+            fsync(out_file.fileno())
+
+        with open(self.get_index_file_name(), "a", encoding = "utf-8") as out_file:
+            out_file.write(f"{header.get_date()}, {header.get_time()}, {offset}, {kind}\n")
+
+        self._doctors = {}
+        self._assistances = []
+        self._redirects = []
+        self._completed = []
+
+
+    def replay(self, date, time):
+        """
+        Reconstructs the state of the birth-plan-manager tool at a journaled update, reading only the entries from the
+        nearest snapshot at or before that update.
+
+        Args:
+            date (str): the date of the update, in the format '%d:%m:%Y'.
+            time (str): the time of the update, in the format "HhM".
+
+        Returns:
+            tuple:
+                - organization (str): the organization of the update.
+                - doctors (list): the lines of the doctors at the update.
+                - schedule (list): the lines of the schedule at the update, sorted as in the schedule file.
+
+        Raises:
+            KeyError: if the update is not in the journal or no snapshot precedes it.
+        """
+
+        from json import loads
+
+        index = self.get_index()
+        positions = [i for i, (entry_date, entry_time, _, _) in enumerate(index)
+                     if entry_date == date and entry_time == time]
+
+        if not positions:
+            raise KeyError(f"update {date} {time} not in journal '{self.get_file_name()}'")
+
+        target = positions[-1]
+        snapshots = [i for i in range(target + 1) if index[i][3] == "snapshot"]
+
+        if not snapshots:
+            raise KeyError(f"no snapshot before update {date} {time} in journal '{self.get_file_name()}'")
+
+        doctors = {}
+        schedule = set()
+
+        with open(self.get_file_name(), "rb") as in_file:
+            in_file.seek(index[snapshots[-1]][2])
+
+            for _ in range(snapshots[-1], target + 1):
+                entry = loads(in_file.readline())
+
+                if entry["kind"] == "snapshot":
+                    doctors = {line.split(", ")[0]: line for line in entry["doctors"]}
+                    schedule = set(entry["schedule"])
+
+                else:
+                    for line in entry["doctors"]:
+                        doctors[line.split(", ")[0]] = line
+
+                    schedule.difference_update(entry["completed"])
+                    schedule.update(entry["assistances"], entry["redirects"])
+
+        schedule = sorted(schedule, key = self.assistance_sort_key)
+
+        return entry["organization"], list(doctors.values()), schedule
+
+
+    def assistance_sort_key(self, line):
+        """
+        The key that sorts the lines of a schedule as in the schedule file: by time, then by mother's name.
+
+        Args:
+            line (str): a line of a schedule.
+
+        Returns:
+            tuple: the minutes of the time and the name of the mother of the line.
+        """
+
+        time, mother, _ = line.split(", ")
+
+        return Time(time).convert_time_to_minutes(), mother
+
+
+    def recover(self, date, time):
+        """
+        Writes the doctors and schedule files of a journaled update, as they were written by the birth-plan-manager
+        tool at that update.
+
+        Args:
+            date (str): the date of the update, in the format '%d:%m:%Y'.
+            time (str): the time of the update, in the format "HhM".
+        """
+
+        from classes.Doctor import Doctor
+        from classes.Mother import Mother
+        from classes.Schedule import Schedule
+        from classes.DoctorsCollection import DoctorsCollection
+
+        from constants import REDIRECTED_REQUEST
+
+        organization, doctors_lines, schedule_lines = self.replay(date, time)
+        policy = self.get_policy(organization)
+
+        doctors = [Doctor(*line.split(", ")) for line in doctors_lines]
+        doctors_collection = DoctorsCollection(header = Header(organization, time, date, DOCTORS_FILE_SCOPE),
+                                               doctors = doctors)
+        doctors_collection.set_file_name("".join((DOCTORS_FILE_SCOPE.lower(), time)))
+        doctors_collection.write_file(policy)
+
+        schedule = Schedule(header = Header(organization, time, date, SCHEDULE_FILE_SCOPE))
+        schedule.set_file_name("".join((SCHEDULE_FILE_SCOPE.lower(), time)))
+
+        for line in schedule_lines:
+            assistance_time, mother, doctor = line.split(", ")
+
+            if doctor == REDIRECTED_REQUEST:
+                schedule.add_assistance(Time(assistance_time), Mother(mother))
+            else:
+                schedule.add_assistance(Time(assistance_time), Mother(mother), Doctor(doctor))
+
+        schedule.write_file(policy)
@@ -0,0 +1,356 @@
+#-*- coding: utf-8 -*-
+
+
+from classes.Time import Time
+from classes.DataManager import DataManager
+from classes.PlanningObserver import PlanningObserver
+from classes.PlanningPolicy import PlanningPolicy
+
+from collections import deque
+from constants import LOOKAHEAD_TICKS, WKL_LEAVE
+
+
+class Lookahead(DataManager, PlanningObserver):
+    """
+    A class to represent the lookahead of the planning over the next updates, which reserves the working time of the
+    doctors with the minimum category for a high risk assistance for the high risk requests forecast in the horizon.
+
+    Note:
+        The horizon is kept up to date incrementally: the forecast requests of the updates that enter or leave the
+        horizon are added to or removed from the required working time, and the availability of each eligible doctor
+        is kept in Fenwick trees of the count and sum of availabilities by minute, updated as the planning assigns
+        assistances, so that the working time they can offer in the horizon is computed in logarithmic time. The
+        doctors are only read again when they differ from those left by the last planning, according to the content
+        digest of their collection.
+    """
+
+    # Number of minutes indexed by the Fenwick trees, from midnight
+    TREE_MINUTES = 2 * 24 * 60
+
+
+    def __init__(self, file_name = None, header = None, forecast = {}, horizon = LOOKAHEAD_TICKS, policy = None):
+        """
+        Initializes a new Lookahead.
+
+        Args:
+            file_name (str, optional): the name of the forecast file. Defaults to None.
+            header (Header, optional): the header of the forecast file. Defaults to None.
+            forecast (dict, optional): the number of requests and high risk requests forecast for each update, as
+                                       tuples, by time of the update in minutes. Defaults to an empty dictionary.
+            horizon (int, optional): the number of updates of the horizon. Defaults to LOOKAHEAD_TICKS.
+            policy (PlanningPolicy, optional): the rules of the hospital. Defaults to the default PlanningPolicy.
+
+        Note:
+            If file_name is provided and forecast is an empty dictionary, the set_forecast() method will be called to
+            populate the forecast from the file.
+        """
+
+        super().__init__(file_name, header)
+        self._forecast = dict(forecast)
+        self._horizon = horizon
+        self._policy = policy if policy else PlanningPolicy.default()
+
+        if self.get_file_name() and not self._forecast:
+            self.set_forecast()
+
+        self._ticks = sorted(self._forecast)
+        self._next_tick = 0
+        self._window = deque()
+        self._required = 0
+        self._next_minutes = None
+
+        self._counts = [0] * (self.TREE_MINUTES + 1)
+        self._sums = [0] * (self.TREE_MINUTES + 1)
+        self._availabilities = {}
+        self._digest = None
+
+
+    def set_forecast(self):
+        """
+        Reads the forecast of the current Lookahead instance from its file, where each line has the time of an update,
+        the number of requests and the number of high risk requests forecast for it.
+        """
+
+        for line in super().remove_header():
+            time, requests, high_risk_requests = line.rstrip().split(", ")
+            self._forecast[Time(time).convert_time_to_minutes()] = (int(requests), int(high_risk_requests))
+
+
+    def get_forecast(self):
+        """
+        The forecast of the current Lookahead instance.
+
+        Returns:
+            dict: the number of requests and high risk requests forecast for each update, as tuples, by time of the
+                  update in minutes.
+        """
+
+        return dict(self._forecast)
+
+
+    def get_horizon(self):
+        """
+        The number of updates of the horizon of the current Lookahead instance.
+
+        Returns:
+            int: the number of updates of the horizon.
+        """
+
+        return self._horizon
+
+
+    def update_trees(self, minutes, count):
+        """
+        Adds a number of availabilities at a given minute to the Fenwick trees of the current Lookahead instance.
+
+        Args:
+            minutes (int): the availability, in minutes since midnight.
+            count (int): the number of availabilities to add, or to remove if negative.
+        """
+
+        minutes = min(max(minutes, 0), self.TREE_MINUTES - 1)
+        position = minutes + 1
+
+        while position <= self.TREE_MINUTES:
+            self._counts[position] += count
+            self._sums[position] += count * minutes
+            position += position & -position
+
+
+    def query_trees(self, minutes):
+        """
+        Counts and sums the availabilities of the Fenwick trees of the current Lookahead instance up to a given minute.
+
+        Args:
+            minutes (int): the last minute counted, in minutes since midnight.
+
+        Returns:
+            tuple: the number and the sum of the availabilities up to the given minute.
+        """
+
+        position = min(max(minutes, -1), self.TREE_MINUTES - 1) + 1
+        count = 0
+        total = 0
+
+        while position > 0:
+            count += self._counts[position]
+            total += self._sums[position]
+            position -= position & -position
+
+        return count, total
+
+
+    def add_doctor(self, doctor):
+        """
+        Adds the availability of a doctor to the current Lookahead instance, if it has the minimum category for a high
+        risk assistance and is not on weekly leave.
+
+        Args:
+            doctor (Doctor): the doctor.
+        """
+
+        policy = self._policy
+
+        if int(doctor.get_category()) < policy.get_min_category() or doctor.get_availability() == WKL_LEAVE or \
+            doctor.weekly_leave_check(policy):
+            return
+
+        minutes = Time(doctor.get_availability()).convert_time_to_minutes()
+        self._availabilities[doctor.get_name()] = minutes
+        self.update_trees(minutes, 1)
+
+
+    def remove_doctor(self, name):
+        """
+        Removes the availability of a doctor from the current Lookahead instance, if it has one.
+
+        Args:
+            name (str): the name of the doctor.
+        """
+
+        minutes = self._availabilities.pop(name, None)
+
+        if minutes is not None:
+            self.update_trees(minutes, -1)
+
+
+    def synchronize(self, doctors_collection):
+        """
+        Reads the availabilities of the doctors of a collection again, unless they are those left by the last planning.
+
+        Args:
+            doctors_collection (DoctorsCollection): the doctors of the update.
+
+        Returns:
+            bool:
+                - True if the availabilities were read again.
+                - False otherwise.
+        """
+
+        digest = doctors_collection.get_digest().get_value()
+
+        if digest == self._digest:
+            return False
+
+        self._counts = [0] * (self.TREE_MINUTES + 1)
+        self._sums = [0] * (self.TREE_MINUTES + 1)
+        self._availabilities = {}
+
+        for doctor in doctors_collection.doctors_items():
+            self.add_doctor(doctor)
+
+        self._digest = digest
+
+        return True
+
+
+    def mark_synchronized(self, doctors_collection):
+        """
+        Records the doctors left by a planning, whose availabilities the current Lookahead instance followed through
+        its planning events.
+
+        Args:
+            doctors_collection (DoctorsCollection): the next doctors of the update.
+        """
+
+        self._digest = doctors_collection.get_digest().get_value()
+
+
+    def advance(self, next_time):
+        """
+        Moves the horizon of the current Lookahead instance to the updates after a given update, removing the forecast
+        requests of the updates that left it and adding those of the updates that entered it.
+
+        Args:
+            next_time (Time): the time of the next update of the birth-plan-manager tool.
+        """
+
+        increment = self._policy.get_increment_minutes()
+        self._next_minutes = next_time.convert_time_to_minutes()
+        last_minutes = self._next_minutes + self._horizon * increment
+
+        while self._window and self._window[0] <= self._next_minutes:
+            self._required -= self._forecast[self._window.popleft()][1]
+
+        while self._next_tick < len(self._ticks) and self._ticks[self._next_tick] <= last_minutes:
+            tick = self._ticks[self._next_tick]
+
+            if tick > self._next_minutes:
+                self._window.append(tick)
+                self._required += self._forecast[tick][1]
+
+            self._next_tick += 1
+
+
+    def get_window(self):
+        """
+        The working time window of the horizon of the current Lookahead instance, from the first update after the next
+        one to the end of the last update of the horizon or the closing time of the hospital.
+
+        Returns:
+            tuple: the start and end of the window, in minutes since midnight.
+        """
+
+        increment = self._policy.get_increment_minutes()
+
+        return (self._next_minutes + increment,
+                min(self._next_minutes + (self._horizon + 1) * increment, self._policy.get_closing_minutes()))
+
+
+    def get_capacity(self):
+        """
+        The working time that the eligible doctors of the current Lookahead instance can offer in its window.
+
+        Returns:
+            int: the working time, in minutes.
+        """
+
+        start, end = self.get_window()
+
+        if end <= start:
+            return 0
+
+        count_end, sum_end = self.query_trees(end - 1)
+        count_start, sum_start = self.query_trees(start)
+
+        return count_end * end - count_start * start - (sum_end - sum_start)
+
+
+    def get_required(self):
+        """
+        The working time required by the high risk requests forecast in the horizon of the current Lookahead instance.
+
+        Returns:
+            int: the working time, in minutes.
+        """
+
+        return self._required * self._policy.get_assistance_minutes()
+
+
+    def get_spare(self):
+        """
+        The working time of the eligible doctors in the horizon of the current Lookahead instance that is not reserved
+        for the forecast high risk requests.
+
+        Returns:
+            int: the spare working time, in minutes, negative if the eligible doctors cannot cover the forecast.
+        """
+
+        return self.get_capacity() - self.get_required()
+
+
+    def contribution(self, minutes):
+        """
+        The working time that a doctor with a given availability offers in the window of the current Lookahead
+        instance.
+
+        Args:
+            minutes (int): the availability of the doctor, in minutes since midnight.
+
+        Returns:
+            int: the working time, in minutes.
+        """
+
+        start, end = self.get_window()
+
+        return max(0, end - max(minutes, start))
+
+
+    def reserve_check(self, doctor):
+        """
+        Checks whether a doctor can be assigned to a request that is not high risk without taking working time
+        reserved for the forecast high risk requests.
+
+        Args:
+            doctor (Doctor): the doctor.
+
+        Returns:
+            bool:
+                - True if the doctor does not have the minimum category for a high risk assistance, if the assistance
+                  takes no working time of the horizon, or if the working time left after the assistance still covers
+                  the forecast high risk requests.
+                - False otherwise.
+        """
+
+        minutes = self._availabilities.get(doctor.get_name())
+
+        if minutes is None or self._next_minutes is None:
+            return True
+
+        end = max(minutes, self._next_minutes) + self._policy.get_assistance_minutes()
+        loss = self.contribution(minutes) - self.contribution(end)
+
+        return loss == 0 or self.get_spare() - loss >= 0
+
+
+    def record_assistance(self, assistance, doctor):
+        """
+        Updates the availability of a doctor to whom an assistance has been assigned.
+
+        Args:
+            assistance (Assistance): the newly assigned assistance.
+            doctor (Doctor): the doctor carrying out the assistance, with its working time already updated.
+        """
+
+        self.remove_doctor(doctor.get_name())
+        self.add_doctor(doctor)
@@ -0,0 +1,210 @@
+#-*- coding: utf-8 -*-
+
+
+from classes.PlanningObserver import PlanningObserver
+
+from constants import MEMORY_TRACE_FRAMES, MEMORY_REPORT_MODULES
+
+
+class MemoryAccountant(PlanningObserver):
+    """
+    A class that accounts for the memory allocated by each phase of the planning of the birth-plan-manager tool, with
+    tracemalloc snapshots taken at the end of each phase.
+
+    Note:
+        Each allocation is attributed to the innermost module of the tool in its traceback, so that the deep copies and
+        file buffers allocated by the standard library are attributed to the module of the tool that asked for them,
+        such as classes.Schedule for the deep copies of create_next_schedule(). The allocations without a module of
+        the tool in their traceback are attributed to "other". The phases of every update planned are added up by
+        name: their peak is the highest and their net allocation is the sum.
+    """
+
+    # Phases of the planning, in the order of the report
+    PHASES = ("load", "sort", "assign", "merge", "write")
+
+
+    def __init__(self, budget = None, frames = MEMORY_TRACE_FRAMES):
+        """
+        Initializes a new MemoryAccountant.
+
+        Args:
+            budget (int, optional): the highest peak of traced memory allowed, in bytes. Defaults to None, which
+                                    allows any peak.
+            frames (int, optional): the number of frames stored in the traceback of each allocation. Defaults to
+                                    MEMORY_TRACE_FRAMES.
+        """
+
+        from os.path import dirname, abspath
+
+        self._budget = budget
+        self._frames = frames
+        self._root = dirname(dirname(abspath(__file__)))
+        self._modules = {}
+        self._phases = {}
+        self._totals = {}
+        self._current = 0
+
+
+    def get_phases(self):
+        """
+        The memory accounted for each phase by the current MemoryAccountant instance.
+
+        Returns:
+            dict: the peak of traced memory, the net allocation and the net allocation by module, in bytes, of each
+                  phase, as a dictionary with the keys "peak", "net" and "modules", by phase name.
+        """
+
+        return {phase: {"peak": data["peak"], "net": data["net"], "modules": dict(data["modules"])}
+                for phase, data in self._phases.items()}
+
+
+    def start(self):
+        """
+        Starts tracing the memory allocations, from which the first phase is accounted.
+        """
+
+        import tracemalloc
+
+        tracemalloc.start(self._frames)
+        self._totals = self.group_traces()
+        tracemalloc.reset_peak()
+        self._current = tracemalloc.get_traced_memory()[0]
+
+
+    def stop(self):
+        """
+        Stops tracing the memory allocations, releasing the traces.
+        """
+
+        import tracemalloc
+
+        tracemalloc.stop()
+
+
+    def find_module(self, traceback):
+        """
+        Finds the innermost module of the tool in the traceback of an allocation.
+
+        Args:
+            traceback (tracemalloc.Traceback): the traceback of the allocation, from the oldest to the most recent
+                                               frame.
+
+        Returns:
+            str: the name of the module, such as "classes.Schedule", or "other" if no frame belongs to the tool.
+        """
+
+        from os.path import relpath, splitext, sep
+
+        for frame in reversed(traceback):
+            module = self._modules.get(frame.filename)
+
+            if module is None:
+                if frame.filename.startswith(self._root + sep):
+                    module = splitext(relpath(frame.filename, self._root))[0].replace(sep, ".")
+                else:
+                    module = ""
+
+                self._modules[frame.filename] = module
+
+            if module:
+                return module
+
+        return "other"
+
+
+    def group_traces(self):
+        """
+        Takes a snapshot of the traced memory and adds up its allocations by module, leaving out the allocations of
+        tracemalloc and of the current MemoryAccountant instance.
+
+        Returns:
+            dict: the traced memory of each module, in bytes, by module name.
+        """
+
+        import tracemalloc
+
+        filters = (tracemalloc.Filter(False, tracemalloc.__file__, all_frames = True),
+                   tracemalloc.Filter(False, __file__, all_frames = True))
+        snapshot = tracemalloc.take_snapshot().filter_traces(filters)
+        totals = {}
+
+        for trace in snapshot.traces:
+            module = self.find_module(trace.traceback)
+            totals[module] = totals.get(module, 0) + trace.size
+
+        return totals
+
+
+    def record_phase(self, phase):
+        """
+        Records the end of a phase, accounting for its peak of traced memory and its net allocation by module since the
+        end of the phase before.
+
+        Args:
+            phase (str): the name of the phase that ends.
+        """
+
+        import tracemalloc
+
+        current, peak = tracemalloc.get_traced_memory()
+        totals = self.group_traces()
+
+        data = self._phases.setdefault(phase, {"peak": 0, "net": 0, "modules": {}})
+        data["peak"] = max(data["peak"], peak)
+        data["net"] += current - self._current
+
+        for module in set(totals) | set(self._totals):
+            data["modules"][module] = data["modules"].get(module, 0) + totals.get(module, 0) - \
+                self._totals.get(module, 0)
+
+        self._totals = totals
+        tracemalloc.reset_peak()
+        self._current = tracemalloc.get_traced_memory()[0]
+
+
+    def within_budget_check(self):
+        """
+        Checks whether the peak of traced memory of every phase is within the budget of the current MemoryAccountant
+        instance.
+
+        Returns:
+            bool:
+                - True if there is no budget or no phase exceeded it.
+                - False otherwise.
+        """
+
+        return self._budget is None or all(data["peak"] <= self._budget for data in self._phases.values())
+
+
+    def create_report(self):
+        """
+        Creates the report of the memory accounted for each phase by the current MemoryAccountant instance.
+
+        Returns:
+            list: the lines of the report, one for each phase, with the modules of the largest net allocations,
+                  followed by an error line if the budget was exceeded.
+
+        Example:
+            "Memory phase assign: peak 412.5 KiB, net +36.2 KiB (classes.Schedule +30.1 KiB, classes.Doctor +4.0 KiB,
+             other +2.1 KiB)"
+        """
+
+        lines = []
+
+        for phase in sorted(self._phases, key = lambda phase: (self.PHASES.index(phase) if phase in self.PHASES
+                                                                else len(self.PHASES), phase)):
+            data = self._phases[phase]
+            modules = sorted((module for module, size in data["modules"].items() if size),
+                             key = lambda module: (-abs(data["modules"][module]), module))[:MEMORY_REPORT_MODULES]
+            allocations = ", ".join(f"{module} {data['modules'][module] / 1024:+,.1f} KiB" for module in modules)
+
+            lines.append(f"Memory phase {phase}: peak {data['peak'] / 1024:,.1f} KiB, net {data['net'] / 1024:+,.1f} "
+                         f"KiB ({allocations})")
+
+        if not self.within_budget_check():
+            phase = max(self._phases, key = lambda phase: self._phases[phase]["peak"])
+
+            lines.append(f"Memory budget error: peak of {self._phases[phase]['peak'] / 1048576:,.2f} MiB in phase "
+                         f"'{phase}' over the budget of {self._budget / 1048576:,.2f} MiB.")
+
+        return lines
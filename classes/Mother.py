@@ -219,6 +219,26 @@ class Mother:
             return False
 
 
+    def equality_key(self):
+        """
+        The key shared by the current Mother instance and every Mother instance equal to it, according to the __eq__()
+        method, so that mothers can be looked up in a set.
+
+        Returns:
+            tuple: the name, age, wristband and risk if they are all defined, the name alone if it is the only one
+                   defined, or the identity of the current Mother instance otherwise, since it is then only equal to
+                   itself.
+        """
+
+        if self.get_name() and self.get_age() and self.get_wristband() and self.get_risk():
+            return (self.get_name(), self.get_age(), self.get_wristband(), self.get_risk())
+
+        if self.get_name() and not (self.get_age() or self.get_wristband() or self.get_risk()):
+            return (self.get_name(),)
+
+        return (id(self), None, None, None, None)
+
+
     def __str__(self):
         """
         The string representation of the current Mother instance.
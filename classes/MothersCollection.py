@@ -3,8 +3,10 @@
 
 from classes.Mother import Mother
 from classes.DataManager import DataManager
+from classes.ContentDigest import ContentDigest
 
 from copy import deepcopy
+from constants import MERGED_REQUEST, SCHEDULED_REQUEST
 
 
 class MothersCollection(DataManager):
@@ -24,10 +26,17 @@ class MothersCollection(DataManager):
         Note:
             If file_name is provided and mothers is an empty list, the set_mothers() method will be called to populate
             the mothers from the file.
+            Requests for a mother that is already in the collection are merged through the add_mother() method.
         """
         
         super().__init__(file_name, header)
-        self._mothers = deepcopy(mothers)
+        self._mothers = []
+        self._mothers_index = {}
+        self._duplicates = []
+        self._digest = ContentDigest()
+
+        for mother in deepcopy(mothers):
+            self.add_mother(mother)
                 
         if self.get_file_name() and not self.get_mothers():
             self.set_mothers()
@@ -60,12 +69,118 @@ class MothersCollection(DataManager):
                         
             for line in in_file:
                 name, age, wristband, risk = line.rstrip().split(", ")
-                self._mothers.append(Mother(name, age, wristband, risk))
+                self.add_mother(Mother(name, age, wristband, risk))
+
+        else:
+            self._mothers = []
+            self._mothers_index = {}
+            self._digest = ContentDigest()
+
+            for mother in mothers:
+                self.add_mother(mother)
+
+
+    def add_mother(self, mother):
+        """
+        Adds a Mother object to the current MothersCollection instance, merging it with any earlier request for the
+        same mother.
+
+        Args:
+            mother (Mother): the mother that needs an assistance.
+
+        Note:
+            Mothers are identified by their name. When a request for an already indexed mother is added, the indexed
+            Mother object keeps the attributes with the highest priority for assistance and the new request is
+            recorded as a duplicate.
+        """
+
+        indexed_mother = self._mothers_index.get(mother.get_name())
+
+        if indexed_mother is None:
+            self._mothers_index[mother.get_name()] = mother
+            self._mothers.append(mother)
+            self._digest.add(mother)
 
         else:
-            self._mothers = mothers
+            if mother < indexed_mother:
+                previous_mother = str(indexed_mother)
+                indexed_mother.set_age(mother.get_age())
+                indexed_mother.set_wristband(mother.get_wristband())
+                indexed_mother.set_risk(mother.get_risk())
+                self._digest.replace(previous_mother, indexed_mother)
+
+            self._duplicates.append((mother, MERGED_REQUEST))
+
+
+    def remove_scheduled_mothers(self, schedule):
+        """
+        Removes from the current MothersCollection instance the mothers that already have an assistance with a doctor
+        in a given schedule, recording each removed request as a duplicate.
+
+        Args:
+            schedule (Schedule): the schedule containing the planned assistances.
+        """
+
+        scheduled_names = set()
+
+        for assistance in schedule.schedule_items():
+            if assistance.get_doctor():
+                scheduled_names.add(assistance.get_mother().get_name())
+
+        mothers = []
+
+        for mother in self._mothers:
+            if mother.get_name() in scheduled_names:
+                del self._mothers_index[mother.get_name()]
+                self._digest.discard(mother)
+                self._duplicates.append((mother, SCHEDULED_REQUEST))
+            else:
+                mothers.append(mother)
+
+        self._mothers = mothers
+
+
+    def duplicates_items(self):
+        """
+        Supports iteration over the duplicate requests collapsed by the current MothersCollection instance.
+
+        Yields:
+            tuple: each collapsed request, as a pair with the Mother object of the request and the reason why it was
+                   collapsed, one at a time.
+        """
+
+        for mother, reason in self._duplicates:
+            yield mother, reason
+
+
+    def create_duplicates_report(self):
+        """
+        Creates the report of the duplicate requests collapsed by the current MothersCollection instance.
+
+        Returns:
+            list: a list of strings, each representing a collapsed request followed by the reason why it was collapsed.
+
+        Example:
+            >>> motherscollection.create_duplicates_report()
+            ["Barbara Brooks, 28, green, high, merged with previous request",
+             "Mary Evans, 31, red, medium, already on schedule"]
+        """
+
+        return [f"{mother}, {reason}" for mother, reason in self.duplicates_items()]
             
 
+    def get_digest(self):
+        """
+        The content digest of the current MothersCollection instance, kept up to date as mothers are added, merged or
+        removed.
+
+        Returns:
+            ContentDigest: the order-independent digest of the mothers of the current MothersCollection instance.
+        """
+
+        return self._digest
+
+
     def mothers_items(self):
         """
         Supports iteration over the mothers attribute of the current MothersCollection instance.
@@ -114,15 +229,14 @@ class MothersCollection(DataManager):
         
         Returns:
             bool:
-                - True if both instances have the same Mother objects in their mothers attribute.
+                - True if both instances have the same mothers in their mothers attribute, in any order.
                 - False otherwise.
+
+        Note:
+            The content digests of both instances are compared, so the comparison takes constant time.
         """
 
-        if len(self.get_mothers()) != len(other_mothers_collection.get_mothers()):
-            return False
-        
-        return all(x == y for x, y in zip(sorted(self.get_mothers()), 
-                                          sorted(other_mothers_collection.get_mothers())))
+        return self.get_digest() == other_mothers_collection.get_digest()
 
     
     def __str__(self):
@@ -0,0 +1,314 @@
+#-*- coding: utf-8 -*-
+
+
+from classes.Time import Time
+from classes.Schedule import Schedule
+from classes.DoctorsCollection import DoctorsCollection
+from classes.PlanningPolicy import PlanningPolicy
+
+from heapq import heappush, heappop
+from constants import WKL_LEAVE
+
+
+class NetworkPlanner:
+    """
+    A class to represent the planner of an update of a network of hospitals, which plans each hospital on its own and
+    then routes the requests that a hospital redirects to the hospital of the network with the earliest eligible
+    doctor, instead of redirecting them outside the network.
+
+    Note:
+        The hospitals are planned in parallel, in separate processes, so that an update of the whole network takes
+        about as long as the update of its slowest hospital. The redirected requests are then routed from the highest
+        to the lowest priority, through a priority index of the available doctors of every hospital, ordered as the
+        doctors of a single hospital are, with the earlier hospitals of the network first for equal doctors.
+    """
+
+    def __init__(self, units, processes = None, policy_overrides = {}):
+        """
+        Initializes a new NetworkPlanner.
+
+        Args:
+            units (list): the doctors collection, schedule and requests (MothersCollection) of each hospital of the
+                          network, as tuples.
+            processes (int, optional): the number of processes planning the hospitals in parallel. Defaults to None,
+                                       which uses one process per hospital, up to the number of processors, and 1
+                                       plans the hospitals one after the other in the current process.
+            policy_overrides (dict, optional): the rules that override those of the organization of every hospital,
+                                               as keyword arguments of the PlanningPolicy class. Defaults to an empty
+                                               dictionary.
+        """
+
+        self._units = list(units)
+        self._processes = processes
+        self._policies = [PlanningPolicy.for_organization(doctors_collection.get_header().get_organization(),
+                                                          **policy_overrides)
+                          for doctors_collection, _, _ in self._units]
+        self._routed = 0
+
+
+    def get_units(self):
+        """
+        The hospitals of the current NetworkPlanner instance.
+
+        Returns:
+            list: the doctors collection, schedule and requests of each hospital, as tuples.
+        """
+
+        return self._units
+
+
+    def get_policies(self):
+        """
+        The rules of each hospital of the current NetworkPlanner instance.
+
+        Returns:
+            list: the PlanningPolicy object of each hospital, in the order of the hospitals.
+        """
+
+        return self._policies
+
+
+    @staticmethod
+    def plan_unit(doctors_collection, schedule, mothers_collection, policy):
+        """
+        Plans the update of a single hospital, as the birth-plan-manager tool does.
+
+        Args:
+            doctors_collection (DoctorsCollection): the doctors of the hospital.
+            schedule (Schedule): the schedule of the hospital.
+            mothers_collection (MothersCollection): the requests of the hospital.
+            policy (PlanningPolicy): the rules of the hospital.
+
+        Returns:
+            tuple:
+                - next_schedule (Schedule): the next schedule of the hospital.
+                - next_doctors (DoctorsCollection): the next doctors of the hospital.
+        """
+
+        return schedule.create_next_schedule(doctors_collection, mothers_collection, policy = policy)
+
+
+    def plan_units(self):
+        """
+        Plans the update of each hospital of the current NetworkPlanner instance on its own, in parallel.
+
+        Returns:
+            list: the next schedule and next doctors of each hospital, as tuples, in the order of the hospitals.
+        """
+
+        from concurrent.futures import ProcessPoolExecutor
+        from os import cpu_count
+
+        arguments = [(doctors_collection, schedule, mothers_collection, policy)
+                     for (doctors_collection, schedule, mothers_collection), policy in zip(self._units, self._policies)]
+
+        processes = self._processes if self._processes else min(len(arguments), cpu_count() or 1)
+
+        if processes <= 1:
+            return [self.plan_unit(*unit_arguments) for unit_arguments in arguments]
+
+        with ProcessPoolExecutor(max_workers = processes) as executor:
+            return list(executor.map(self.plan_unit, *zip(*arguments)))
+
+
+    def doctor_key(self, doctor, unit):
+        """
+        The key that orders the doctors of the network from highest to lowest availability for an assistance.
+
+        Args:
+            doctor (Doctor): the doctor.
+            unit (int): the position of the hospital of the doctor in the network.
+
+        Returns:
+            tuple: the key of the doctor, in the order of the criteria of the Doctor class, followed by the position of
+                   its hospital.
+        """
+
+        return (Time(doctor.get_availability()).convert_time_to_minutes(), -int(doctor.get_category()),
+                int(doctor.get_minutes_today()), Time(doctor.get_weekly_time()).convert_time_to_minutes(),
+                doctor.get_name(), unit)
+
+
+    def push_doctor(self, indices, keys, doctor, unit):
+        """
+        Adds a doctor to the priority indices of the network, with its current key, unless it is on weekly leave.
+
+        Args:
+            indices (tuple): the priority index of every doctor and the priority index of the doctors with the minimum
+                             category for a high risk assistance, as heaps.
+            keys (dict): the current key of each doctor, by hospital position and name.
+            doctor (Doctor): the doctor.
+            unit (int): the position of the hospital of the doctor in the network.
+        """
+
+        policy = self._policies[unit]
+
+        if doctor.get_availability() == WKL_LEAVE or doctor.weekly_leave_check(policy):
+            keys.pop((unit, doctor.get_name()), None)
+            return
+
+        key = self.doctor_key(doctor, unit)
+        keys[(unit, doctor.get_name())] = key
+        all_doctors, high_risk_doctors = indices
+
+        heappush(all_doctors, (key, doctor))
+
+        if int(doctor.get_category()) >= policy.get_min_category():
+            heappush(high_risk_doctors, (key, doctor))
+
+
+    def peek_doctor(self, index, keys):
+        """
+        Finds the doctor with the highest availability in a priority index, dropping the entries of doctors whose key
+        changed since they were added.
+
+        Args:
+            index (list): the priority index, as a heap.
+            keys (dict): the current key of each doctor, by hospital position and name.
+
+        Returns:
+            tuple: the key and Doctor object of the doctor, or None if the index has no doctor.
+        """
+
+        while index:
+            key, doctor = index[0]
+
+            if keys.get((key[-1], doctor.get_name())) == key:
+                return index[0]
+
+            heappop(index)
+
+        return None
+
+
+    def route_redirects(self, next_units):
+        """
+        Routes the requests redirected by each hospital to the hospital of the network with the earliest eligible
+        doctor, from the highest to the lowest priority.
+
+        Args:
+            next_units (list): the next schedule and next doctors of each hospital, as tuples, updated in place.
+
+        Returns:
+            list: the next schedule and next doctors of each hospital, as tuples, with the routed requests moved to the
+                  schedule of the hospital that takes them.
+
+        Note:
+            The number of routed requests is kept for the count_redirects() method.
+        """
+
+        indices = ([], [])
+        keys = {}
+        redirects = []
+
+        for unit, ((_, _, mothers_collection), (next_schedule, next_doctors)) in enumerate(zip(self._units,
+                                                                                                next_units)):
+            for doctor in next_doctors.doctors_items():
+                self.push_doctor(indices, keys, doctor, unit)
+
+            requested = {mother.get_name() for mother in mothers_collection.mothers_items()}
+
+            for assistance in next_schedule.schedule_items():
+                if not assistance.get_doctor() and assistance.get_mother().get_name() in requested:
+                    redirects.append((assistance.get_mother(), unit))
+
+        routed = [set() for _ in next_units]
+        assistances = [[] for _ in next_units]
+
+        for mother, home_unit in sorted(redirects, key = lambda redirect: redirect[0]):
+            entry = self.peek_doctor(indices[1] if mother.get_risk() == "high" else indices[0], keys)
+
+            if not entry:
+                continue
+
+            key, doctor = entry
+            unit = key[-1]
+            policy = self._policies[unit]
+            next_doctors = next_units[unit][1]
+            next_time = Time(self._units[unit][0].retrieve_next_time(policy))
+
+            assistance_time, adjusted_availability = doctor.adjust_availability(next_time, policy)
+
+            if not adjusted_availability.within_operating_time(policy):
+                continue
+
+            previous_doctor = str(doctor)
+            doctor.update_working_time(adjusted_availability, policy)
+            doctor.daily_break_check(policy)
+            next_doctors.refresh_digest(previous_doctor, doctor)
+
+            routed[home_unit].add(mother.get_name())
+            assistances[unit].append((assistance_time, mother, doctor))
+            self.push_doctor(indices, keys, doctor, unit)
+
+        for unit, (next_schedule, next_doctors) in enumerate(next_units):
+            if not routed[unit] and not assistances[unit]:
+                continue
+
+            kept = [assistance for assistance in next_schedule.schedule_items()
+                    if assistance.get_doctor() or assistance.get_mother().get_name() not in routed[unit]]
+
+            next_schedule = Schedule(header = next_schedule.get_header(), schedule = kept)
+
+            for assistance_time, mother, doctor in assistances[unit]:
+                next_schedule.add_assistance(assistance_time, mother, doctor)
+
+            next_schedule.sort_schedule()
+            next_doctors.add_weekly_leave(self._policies[unit])
+            next_units[unit] = (next_schedule, next_doctors)
+
+        self._routed = sum(len(routed_mothers) for routed_mothers in routed)
+
+        return next_units
+
+
+    def plan(self):
+        """
+        Plans the update of the network of the current NetworkPlanner instance.
+
+        Returns:
+            list: the next schedule and next doctors collection of each hospital, as tuples, in the order of the
+                  hospitals, with their file names and headers set as those of the birth-plan-manager tool.
+        """
+
+        next_units = self.route_redirects(self.plan_units())
+        planned_units = []
+
+        for (doctors_collection, schedule, _), (next_schedule, next_doctors), policy in zip(self._units, next_units,
+                                                                                              self._policies):
+            next_schedule.set_file_name(schedule.create_file_name(policy))
+            next_schedule.set_header(schedule.create_header(policy))
+
+            next_doctors_collection = DoctorsCollection(doctors = next_doctors.get_doctors())
+            next_doctors_collection.set_file_name(doctors_collection.create_file_name(policy))
+            next_doctors_collection.set_header(doctors_collection.create_header(policy))
+
+            planned_units.append((next_schedule, next_doctors_collection))
+
+        return planned_units
+
+
+    def count_redirects(self, planned_units):
+        """
+        Counts the requests of an update of the network that their hospital redirected, kept inside the network by
+        routing them to another hospital and sent outside the network.
+
+        Args:
+            planned_units (list): the next schedule and next doctors collection of each hospital, as tuples, as
+                                  returned by the plan() method.
+
+        Returns:
+            tuple:
+                - kept (int): the number of requests routed to another hospital of the network.
+                - sent (int): the number of requests of the update redirected outside the network.
+        """
+
+        sent = 0
+
+        for (_, _, mothers_collection), (next_schedule, _) in zip(self._units, planned_units):
+            requested = {mother.get_name() for mother in mothers_collection.mothers_items()}
+
+            sent += sum(1 for assistance in next_schedule.schedule_items()
+                        if not assistance.get_doctor() and assistance.get_mother().get_name() in requested)
+
+        return self._routed, sent
@@ -0,0 +1,138 @@
+#-*- coding: utf-8 -*-
+
+
+from classes.DataManager import DataManager
+
+from constants import OUTPUT_QUEUE_SIZE
+
+
+class OutputWriter:
+    """
+    A class to represent a background writer of the output files of the birth-plan-manager tool, so that writing the
+    files of an update overlaps with planning the next one.
+
+    Note:
+        The files are handed to a single writer thread as immutable snapshots, through a bounded queue that blocks the
+        planning when the disk falls too far behind. The files are written in the order they were submitted, so the
+        files of an update are never written before the files of the updates before it.
+    """
+
+    def __init__(self, queue_size = OUTPUT_QUEUE_SIZE):
+        """
+        Initializes a new OutputWriter and starts its writer thread.
+
+        Args:
+            queue_size (int, optional): the maximum number of snapshots waiting to be written. Defaults to
+                                        OUTPUT_QUEUE_SIZE.
+        """
+
+        from queue import Queue
+        from threading import Thread
+
+        self._queue = Queue(maxsize = queue_size)
+        self._errors = []
+        self._closed = False
+        self._thread = Thread(target = self.run, name = "OutputWriter", daemon = True)
+        self._thread.start()
+
+
+    def submit(self, data_manager, policy = None, digest_file = False):
+        """
+        Hands a snapshot of the .txt file of a DataManager instance to the writer thread, waiting for room in the
+        queue if it is full.
+
+        Args:
+            data_manager (DataManager): the collection whose file is written.
+            policy (PlanningPolicy, optional): the rules of the hospital. Defaults to the default PlanningPolicy.
+            digest_file (bool, optional): whether the content digest of the collection is also written. Defaults to
+                                          False.
+
+        Raises:
+            ValueError: if the current OutputWriter instance is closed.
+        """
+
+        if self._closed:
+            raise ValueError("Output writer error: files submitted after the writer was closed.")
+
+        snapshot = data_manager.create_snapshot(policy)
+
+        if snapshot:
+            self._queue.put((snapshot, digest_file))
+
+
+    def run(self):
+        """
+        Writes the snapshots of the queue of the current OutputWriter instance, in order, until it is closed.
+
+        Note:
+            Any error raised while writing a snapshot, such as an OSError, an encoding error or a compression error,
+            is kept and raised again in the calling thread by the flush() and close() methods, and the next snapshots
+            are still written, so that the writer thread never dies with snapshots left in the queue.
+        """
+
+        while True:
+            item = self._queue.get()
+
+            try:
+                if item is None:
+                    return
+
+                DataManager.write_snapshot(*item)
+
+            except Exception as error:
+                self._errors.append(error)
+
+            finally:
+                self._queue.task_done()
+
+
+    def flush(self):
+        """
+        Waits until every snapshot submitted to the current OutputWriter instance is written.
+
+        Raises:
+            Exception: the first error raised while writing a snapshot since the last flush.
+        """
+
+        self._queue.join()
+
+        if self._errors:
+            error = self._errors[0]
+            self._errors = []
+            raise error
+
+
+    def close(self):
+        """
+        Writes every snapshot submitted to the current OutputWriter instance and stops its writer thread. Closing an
+        OutputWriter instance more than once has no effect.
+
+        Raises:
+            Exception: the first error raised while writing a snapshot since the last flush.
+        """
+
+        if not self._closed:
+            self._closed = True
+            self._queue.put(None)
+            self._thread.join()
+
+        self.flush()
+
+
+    def __enter__(self):
+        """
+        Supports the use of the current OutputWriter instance in a with statement.
+
+        Returns:
+            OutputWriter: the current OutputWriter instance.
+        """
+
+        return self
+
+
+    def __exit__(self, exception_type, exception, traceback):
+        """
+        Closes the current OutputWriter instance at the end of a with statement, even if an exception was raised.
+        """
+
+        self.close()
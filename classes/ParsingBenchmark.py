@@ -0,0 +1,147 @@
+#-*- coding: utf-8 -*-
+
+
+from classes.BulkParser import BulkParser
+from classes.DoctorsCollection import DoctorsCollection
+from classes.MothersCollection import MothersCollection
+
+from constants import PARSING_BENCHMARK_ROWS, PARSING_SPEEDUP_TARGET
+
+
+class ParsingBenchmark:
+    """
+    A class that compares the rows parsed per second by the line-by-line collections and by the BulkParser class.
+    """
+
+    def __init__(self, rows = PARSING_BENCHMARK_ROWS):
+        """
+        Initializes a new ParsingBenchmark.
+
+        Args:
+            rows (int, optional): the number of lines of content of the generated files. Defaults to
+                                  PARSING_BENCHMARK_ROWS.
+        """
+
+        self._rows = rows
+
+
+    def get_rows(self):
+        """
+        The number of lines of content of the files generated by the current ParsingBenchmark instance.
+
+        Returns:
+            int: the number of lines of content of the generated files.
+        """
+
+        return self._rows
+
+
+    def write_doctors_file(self, file_name):
+        """
+        Writes a doctors file with the number of rows of the current ParsingBenchmark instance.
+
+        Args:
+            file_name (str): the name of the file to write.
+        """
+
+        lines = ["Organization:", "SmartMaternityCare", "Time:", "10h00", "Date:", "10:12:2023", "Doctors:"]
+
+        for i in range(self.get_rows()):
+            lines.append(f"Doctor {i:06d}, {i % 3 + 1}, {8 + i % 10}h{i % 60:02d}, {i % 300}, {i % 40}h{i % 6}0")
+
+        with open(file_name, "w", encoding = "utf-8") as out_file:
+            out_file.write("\n".join(lines))
+
+
+    def write_requests_file(self, file_name):
+        """
+        Writes a requests file with the number of rows of the current ParsingBenchmark instance.
+
+        Args:
+            file_name (str): the name of the file to write.
+        """
+
+        wristbands = ("green", "yellow", "red")
+        risks = ("low", "medium", "high")
+
+        lines = ["Organization:", "SmartMaternityCare", "Time:", "10h30", "Date:", "10:12:2023", "Mothers:"]
+
+        for i in range(self.get_rows()):
+            lines.append(f"Mother {i:06d}, {18 + i % 25}, {wristbands[i % 3]}, {risks[i // 3 % 3]}")
+
+        with open(file_name, "w", encoding = "utf-8") as out_file:
+            out_file.write("\n".join(lines))
+
+
+    def time_parsing(self, parse, file_name):
+        """
+        Measures the best time of a parsing function over five runs, each one starting without garbage left by the
+        previous ones.
+
+        Args:
+            parse (function): the function that parses a file, given its name.
+            file_name (str): the name of the file to parse.
+
+        Returns:
+            float: the best parsing time, in seconds.
+        """
+
+        from gc import collect
+        from time import perf_counter
+
+        timings = []
+
+        for _ in range(5):
+            collect()
+            start = perf_counter()
+            parse(file_name)
+            timings.append(perf_counter() - start)
+
+        return min(timings)
+
+
+    def create_report(self):
+        """
+        Parses the generated doctors and requests files with the collections, line by line, and with the BulkParser
+        class, into typed records and into objects, and compares their rows per second.
+
+        Returns:
+            tuple:
+                - lines (list): the lines of the report, one for each generated file, followed by a line for each file
+                                whose typed records miss PARSING_SPEEDUP_TARGET.
+                - on_target (bool): True if the bulk parsing into typed records reaches PARSING_SPEEDUP_TARGET for
+                                    every file, False otherwise.
+
+        Note:
+            The collections also build the content digest of their objects, so the speedups compare the bulk parsing
+            with the parsing the collections actually do, not with splitting the lines alone.
+        """
+
+        from os.path import join
+        from tempfile import TemporaryDirectory
+
+        lines = []
+        misses = []
+
+        with TemporaryDirectory() as directory:
+            doctors_file = join(directory, "doctors10h00.txt")
+            requests_file = join(directory, "requests10h30.txt")
+
+            self.write_doctors_file(doctors_file)
+            self.write_requests_file(requests_file)
+
+            for file_name, collection in ((doctors_file, DoctorsCollection), (requests_file, MothersCollection)):
+                line_time = self.time_parsing(collection, file_name)
+                records_time = self.time_parsing(lambda name: BulkParser(name).get_records(), file_name)
+                objects_time = self.time_parsing(lambda name: list(BulkParser(name).objects_items()), file_name)
+
+                lines.append(f"{collection.__name__}: {self.get_rows() / line_time:,.0f} rows/s line by line, "
+                             f"{self.get_rows() / records_time:,.0f} rows/s in bulk for typed records "
+                             f"({line_time / records_time:.1f}x), {self.get_rows() / objects_time:,.0f} rows/s in "
+                             f"bulk for objects ({line_time / objects_time:.1f}x)")
+
+                if line_time / records_time < PARSING_SPEEDUP_TARGET:
+                    misses.append(f"{collection.__name__}: typed records {line_time / records_time:.1f}x, below the "
+                                  f"target of {PARSING_SPEEDUP_TARGET}x")
+
+        return lines + misses, not misses
@@ -0,0 +1,79 @@
+#-*- coding: utf-8 -*-
+
+
+class PlanningObserver:
+    """
+    A class to represent an observer of the planning of a Schedule, notified of each planning event as the next
+    schedule is created.
+
+    Note:
+        Every method does nothing, so that subclasses only override the events they need to follow.
+    """
+
+    def record_assistance(self, assistance, doctor):
+        """
+        Records an assistance that has been assigned to a doctor in the next schedule.
+
+        Args:
+            assistance (Assistance): the newly assigned assistance.
+            doctor (Doctor): the doctor carrying out the assistance, with its working time already updated.
+        """
+
+        pass
+
+
+    def record_redirect(self, assistance):
+        """
+        Records an assistance that has been redirected to another hospital network.
+
+        Args:
+            assistance (Assistance): the redirected assistance, without a doctor associated to it.
+        """
+
+        pass
+
+
+    def record_weekly_leave(self, doctor):
+        """
+        Records a doctor that has reached the maximum weekly working time, with an assistance of the next schedule or
+        before it, and whose availability has been set to weekly leave in the update.
+
+        Args:
+            doctor (Doctor): the doctor whose availability has been set to weekly leave.
+        """
+
+        pass
+
+
+    def record_pending(self, assistance):
+        """
+        Records an assistance of the current schedule that is carried over to the next schedule.
+
+        Args:
+            assistance (Assistance): the assistance that is yet to be carried out.
+        """
+
+        pass
+
+
+    def record_completed(self, assistance):
+        """
+        Records an assistance of the current schedule that is completed by the time of the next schedule.
+
+        Args:
+            assistance (Assistance): the assistance that is dropped from the next schedule.
+        """
+
+        pass
+
+
+    def record_phase(self, phase):
+        """
+        Records the end of a phase of the planning, such as the sorting of the requests or the assignment of the
+        doctors.
+
+        Args:
+            phase (str): the name of the phase that ends, one of "load", "sort", "assign", "merge" and "write".
+        """
+
+        pass
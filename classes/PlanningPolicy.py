@@ -0,0 +1,245 @@
+#-*- coding: utf-8 -*-
+
+
+from constants import ASSISTANCE_DURATION, FILE_TIME_INCREMENT, DAILY_BREAK, MAX_WORK_TIME, CLOSING_TIME, OPENING_TIME
+from constants import MAX_DAILY_MINUTES, MIN_CATEG, POLICY_OVERRIDES
+
+
+class PlanningPolicy:
+    """
+    A class to represent the rules of the birth-plan-manager tool, compiled once into minutes, so that the planning
+    does not parse any constant while it runs.
+
+    Note:
+        Every duration and time of day is held as an integer number of minutes. The daily break is taken when the
+        accumulated minutes in a day reach max_daily_minutes for the first time, that is, when they are at least
+        max_daily_minutes and less than max_daily_minutes plus the duration of an assistance.
+    """
+
+    # Default PlanningPolicy instance, compiled on first use
+    _default = None
+
+
+    def __init__(self, assistance_duration = ASSISTANCE_DURATION, file_time_increment = FILE_TIME_INCREMENT,
+                 daily_break = DAILY_BREAK, max_work_time = MAX_WORK_TIME, opening_time = OPENING_TIME,
+                 closing_time = CLOSING_TIME, max_daily_minutes = MAX_DAILY_MINUTES, min_category = MIN_CATEG):
+        """
+        Initializes a new PlanningPolicy.
+
+        Args:
+            assistance_duration (str, optional): the duration of each assistance, in the format "HhM". Defaults to
+                                                 ASSISTANCE_DURATION.
+            file_time_increment (str, optional): the time increment in each update, in the format "HhM". Defaults to
+                                                 FILE_TIME_INCREMENT.
+            daily_break (str, optional): the duration of the daily break, in the format "HhM". Defaults to
+                                         DAILY_BREAK.
+            max_work_time (str, optional): the maximum working time in a week, in the format "HhM". Defaults to
+                                           MAX_WORK_TIME.
+            opening_time (str, optional): the opening time of the hospital, in the format "HhM". Defaults to
+                                          OPENING_TIME.
+            closing_time (str, optional): the closing time of the hospital, in the format "HhM". Defaults to
+                                          CLOSING_TIME.
+            max_daily_minutes (int, optional): the daily work minutes before the daily break. Defaults to
+                                               MAX_DAILY_MINUTES.
+            min_category (int, optional): the minimum category of a doctor for a high risk assistance. Defaults to
+                                          MIN_CATEG.
+        """
+
+        self._assistance_minutes = self.convert_minutes(assistance_duration)
+        self._increment_minutes = self.convert_minutes(file_time_increment)
+        self._break_minutes = self.convert_minutes(daily_break)
+        self._weekly_minutes = self.convert_minutes(max_work_time)
+        self._opening_minutes = self.convert_minutes(opening_time)
+        self._closing_minutes = self.convert_minutes(closing_time)
+        self._break_start = int(max_daily_minutes)
+        self._break_end = self._break_start + self._assistance_minutes
+        self._min_category = int(min_category)
+
+
+    @classmethod
+    def default(cls):
+        """
+        The PlanningPolicy instance with the rules defined in constants.py, compiled on the first call only.
+
+        Returns:
+            PlanningPolicy: the default PlanningPolicy instance.
+        """
+
+        if cls._default is None:
+            cls._default = cls()
+
+        return cls._default
+
+
+    @classmethod
+    def for_organization(cls, organization, **overrides):
+        """
+        Compiles the PlanningPolicy instance of an organization, from the rules defined in constants.py, the overrides
+        of the organization in POLICY_OVERRIDES and the given overrides, in increasing order of precedence.
+
+        Args:
+            organization (str): the name of the organization, as in the headers of its files.
+            **overrides: the rules that override those of the organization, as keyword arguments of the PlanningPolicy
+                         class.
+
+        Returns:
+            PlanningPolicy: the PlanningPolicy instance of the organization.
+        """
+
+        rules = dict(POLICY_OVERRIDES.get(organization, {}))
+        rules.update(overrides)
+
+        return cls(**rules) if rules else cls.default()
+
+
+    def convert_minutes(self, time_string):
+        """
+        Converts a string with the format "HhM" to minutes.
+
+        Args:
+            time_string (str): the string to convert.
+
+        Returns:
+            int: the total number of minutes of the string.
+        """
+
+        hours, minutes = time_string.split("h")
+
+        return int(hours) * 60 + int(minutes)
+
+
+    def get_assistance_minutes(self):
+        """
+        The duration of each assistance of the current PlanningPolicy instance.
+
+        Returns:
+            int: the duration of each assistance, in minutes.
+        """
+
+        return self._assistance_minutes
+
+
+    def get_increment_minutes(self):
+        """
+        The time increment in each update of the current PlanningPolicy instance.
+
+        Returns:
+            int: the time increment in each update, in minutes.
+        """
+
+        return self._increment_minutes
+
+
+    def get_break_minutes(self):
+        """
+        The duration of the daily break of the current PlanningPolicy instance.
+
+        Returns:
+            int: the duration of the daily break, in minutes.
+        """
+
+        return self._break_minutes
+
+
+    def get_weekly_minutes(self):
+        """
+        The maximum working time in a week of the current PlanningPolicy instance.
+
+        Returns:
+            int: the maximum working time in a week, in minutes.
+        """
+
+        return self._weekly_minutes
+
+
+    def get_opening_minutes(self):
+        """
+        The opening time of the hospital of the current PlanningPolicy instance.
+
+        Returns:
+            int: the opening time, in minutes since midnight.
+        """
+
+        return self._opening_minutes
+
+
+    def get_closing_minutes(self):
+        """
+        The closing time of the hospital of the current PlanningPolicy instance.
+
+        Returns:
+            int: the closing time, in minutes since midnight.
+        """
+
+        return self._closing_minutes
+
+
+    def get_max_daily_minutes(self):
+        """
+        The daily work minutes before the daily break of the current PlanningPolicy instance.
+
+        Returns:
+            int: the daily work minutes before the daily break.
+        """
+
+        return self._break_start
+
+
+    def get_min_category(self):
+        """
+        The minimum category of a doctor for a high risk assistance of the current PlanningPolicy instance.
+
+        Returns:
+            int: the minimum category of a doctor for a high risk assistance.
+        """
+
+        return self._min_category
+
+
+    def daily_break_check(self, minutes_today):
+        """
+        Checks whether a doctor reaches the daily work minutes of the current PlanningPolicy instance for the first
+        time.
+
+        Args:
+            minutes_today (int): the accumulated work minutes in a day of the doctor, after an assistance.
+
+        Returns:
+            bool:
+                - True if the doctor has to take the daily break.
+                - False otherwise.
+        """
+
+        return self._break_start <= minutes_today < self._break_end
+
+
+    def weekly_leave_check(self, weekly_minutes):
+        """
+        Checks whether a doctor has reached the maximum working time in a week of the current PlanningPolicy instance.
+
+        Args:
+            weekly_minutes (int): the accumulated work minutes in a week of the doctor.
+
+        Returns:
+            bool:
+                - True if the doctor has reached the maximum working time in a week.
+                - False otherwise.
+        """
+
+        return weekly_minutes >= self._weekly_minutes
+
+
+    def within_operating_time(self, minutes):
+        """
+        Checks whether a time occurs within the operating time of the hospital of the current PlanningPolicy instance.
+
+        Args:
+            minutes (int): the time, in minutes since midnight.
+
+        Returns:
+            bool:
+                - True if the time occurs after the opening time and before the closing time.
+                - False otherwise.
+        """
+
+        return self._opening_minutes < minutes < self._closing_minutes
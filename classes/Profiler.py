@@ -0,0 +1,142 @@
+#-*- coding: utf-8 -*-
+
+
+from classes.Time import Time
+from classes.Doctor import Doctor
+from classes.Mother import Mother
+from classes.Assistance import Assistance
+from classes.Schedule import Schedule
+from classes.DoctorsCollection import DoctorsCollection
+
+from constants import PROFILE_FILE_SCOPE
+
+
+class Profiler:
+    """
+    A class that profiles a tick of the birth-plan-manager tool, collecting cProfile data for the whole tick and
+    collapsed stacks of the hot paths of the planning.
+    """
+
+    # Methods wrapped while profiling, as pairs of class and method name
+    HOT_PATHS = ((Schedule, "create_next_schedule"),
+                 (DoctorsCollection, "select_doctor"),
+                 (DoctorsCollection, "sort_doctors"),
+                 (Doctor, "__lt__"),
+                 (Mother, "__lt__"),
+                 (Assistance, "__lt__"),
+                 (Time, "__lt__"))
+
+
+    def __init__(self):
+        """
+        Initializes a new Profiler.
+        """
+
+        self._profile = None
+        self._originals = []
+        self._stack = []
+        self._child_times = []
+        self._stacks = {}
+
+
+    def get_stacks(self):
+        """
+        The collapsed stacks of the hot paths collected by the current Profiler instance.
+
+        Returns:
+            dict: the self time of each stack, in microseconds, by stack of method names separated by semicolons.
+        """
+
+        return {stack: round(seconds * 1000000) for stack, seconds in self._stacks.items()}
+
+
+    def wrap(self, cls, name):
+        """
+        Replaces a method of a class with a wrapper that measures the time spent in each of its calls.
+
+        Args:
+            cls (type): the class of the method.
+            name (str): the name of the method.
+        """
+
+        from time import perf_counter
+
+        method = cls.__dict__[name]
+        label = f"{cls.__name__}.{name}"
+        stack = self._stack
+        child_times = self._child_times
+        stacks = self._stacks
+
+        def profiled(*args, **kwargs):
+            stack.append(label)
+            child_times.append(0.0)
+            start = perf_counter()
+
+            try:
+                return method(*args, **kwargs)
+
+            finally:
+                elapsed = perf_counter() - start
+                key = ";".join(stack)
+                stacks[key] = stacks.get(key, 0.0) + elapsed - child_times.pop()
+                stack.pop()
+
+                if child_times:
+                    child_times[-1] += elapsed
+
+        profiled.__doc__ = method.__doc__
+
+        self._originals.append((cls, name, method))
+        setattr(cls, name, profiled)
+
+
+    def enable(self):
+        """
+        Starts profiling with the current Profiler instance, wrapping every method in HOT_PATHS.
+        """
+
+        from cProfile import Profile
+
+        for cls, name in self.HOT_PATHS:
+            self.wrap(cls, name)
+
+        self._profile = Profile()
+        self._profile.enable()
+
+
+    def disable(self):
+        """
+        Stops profiling with the current Profiler instance, restoring every method in HOT_PATHS.
+        """
+
+        self._profile.disable()
+
+        for cls, name, method in reversed(self._originals):
+            setattr(cls, name, method)
+
+        self._originals = []
+
+
+    def write_files(self, data_manager):
+        """
+        Writes the data collected by the current Profiler instance next to the output file of a DataManager instance:
+        the cProfile statistics to a .prof file and the collapsed stacks, in the format of flame graph tools, to a
+        .folded file.
+
+        Args:
+            data_manager (DataManager): the DataManager instance whose output file is profiled, such as the next
+                                        schedule.
+
+        Example:
+            For the schedule output file schedule10h30.txt, the files profile10h30.prof and profile10h30.folded
+            are written, where each line of the latter is a stack followed by its self time in microseconds:
+            "Schedule.create_next_schedule;DoctorsCollection.select_doctor;DoctorsCollection.sort_doctors 183"
+        """
+
+        file_name = "".join((PROFILE_FILE_SCOPE.lower(), data_manager.get_header().get_time()))
+
+        self._profile.dump_stats("".join((file_name, ".prof")))
+
+        with open("".join((file_name, ".folded")), "w", encoding = "utf-8") as out_file:
+            for stack, microseconds in sorted(self.get_stacks().items()):
+                out_file.write(f"{stack} {microseconds}\n")
@@ -0,0 +1,250 @@
+#-*- coding: utf-8 -*-
+
+
+from classes.Time import Time
+from classes.PlanningObserver import PlanningObserver
+
+from constants import SERVE_HOST
+
+
+class QueryService(PlanningObserver):
+    """
+    A class to represent a local HTTP service answering JSON queries on the latest update planned by the
+    birth-plan-manager tool, from indexes kept in memory, so that the schedule is queried without reading any file.
+
+    Note:
+        The queries are GET requests on the paths:
+            - "/update": the organization, date and time of the update.
+            - "/mothers/<name>": the next assistance of a mother.
+            - "/doctors/<name>": the assistances of a doctor still to be carried out in the day.
+            - "/queue": the number of assistances in the schedule for the doctors of each category, without those of
+              the doctors missing from the roster.
+            - "/redirects": the requests redirected to another hospital network in the update.
+        Each update is published as a new snapshot of indexes, which is never modified afterwards, and replaces the
+        one before with a single assignment, so that the queries are answered from one snapshot or the other without
+        any lock and never block the planning. The requests are served by a thread each.
+    """
+
+    def __init__(self, port = 0, host = SERVE_HOST):
+        """
+        Initializes a new QueryService, bound to its address but not serving yet.
+
+        Args:
+            port (int, optional): the port of the service. Defaults to 0, which binds any free port.
+            host (str, optional): the host of the service. Defaults to SERVE_HOST, so that the service is only
+                                  reachable from the local machine.
+        """
+
+        from http.server import ThreadingHTTPServer
+
+        self._snapshot = None
+        self._redirects = []
+        self._thread = None
+        self._server = ThreadingHTTPServer((host, port), self.create_handler())
+        self._server.daemon_threads = True
+
+
+    def get_address(self):
+        """
+        The address to which the current QueryService instance is bound.
+
+        Returns:
+            tuple: the host and port of the service.
+        """
+
+        return self._server.server_address[:2]
+
+
+    def get_snapshot(self):
+        """
+        The snapshot of the update last published by the current QueryService instance.
+
+        Returns:
+            dict: the indexes of the update, or None if no update was published.
+        """
+
+        return self._snapshot
+
+
+    def create_handler(self):
+        """
+        Creates the class of the handlers of the requests of the current QueryService instance.
+
+        Returns:
+            type: a subclass of http.server.BaseHTTPRequestHandler that answers each GET request with the result of
+                  the query() method, as JSON.
+        """
+
+        from http.server import BaseHTTPRequestHandler
+        from json import dumps
+
+        service = self
+
+        class QueryHandler(BaseHTTPRequestHandler):
+
+            def do_GET(self):
+                status, result = service.query(self.path)
+                content = dumps(result).encode("utf-8")
+
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+                self.send_header("Content-Length", str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            def log_message(self, format, *args):
+                pass
+
+        return QueryHandler
+
+
+    def record_redirect(self, assistance):
+        """
+        Records a request redirected to another hospital network in the update being planned.
+
+        Args:
+            assistance (Assistance): the redirected assistance.
+        """
+
+        self._redirects.append({"time": str(assistance.get_time()), "mother": assistance.get_mother().get_name()})
+
+
+    def publish(self, schedule, doctors_collection, policy = None):
+        """
+        Publishes the snapshot of an update, with the redirects recorded since the update before, replacing the
+        snapshot of the update before.
+
+        Args:
+            schedule (Schedule): the next schedule, with its header set.
+            doctors_collection (DoctorsCollection): the next collection of doctors.
+            policy (PlanningPolicy, optional): the rules of the hospital, whose assistance duration is used to find
+                                               the assistances of each doctor still in progress or to be carried out
+                                               in the day. Defaults to the default PlanningPolicy.
+        """
+
+        header = schedule.get_header()
+        timeline = schedule.get_timeline(policy)
+        start = Time(header.get_time()).convert_time_to_minutes()
+        categories = {doctor.get_name(): doctor.get_category() for doctor in doctors_collection.doctors_items()}
+        mothers = {}
+        names = dict.fromkeys(categories)
+        queue = {}
+
+        for assistance in schedule.schedule_items():
+            time = str(assistance.get_time())
+            mother = assistance.get_mother().get_name()
+            doctor = assistance.get_doctor().get_name() if assistance.get_doctor() else None
+
+            mothers.setdefault(mother, {"mother": mother, "time": time, "doctor": doctor})
+
+            if doctor:
+                names.setdefault(doctor)
+
+            if doctor in categories:
+                category = categories[doctor]
+                queue[category] = queue.get(category, 0) + 1
+
+        doctors = {}
+
+        for name in names:
+            assistances = timeline.assistances_between(start, 24 * 60, name)
+            doctors[name] = {"doctor": name, "assistances": [{"time": str(assistance.get_time()),
+                                                              "mother": assistance.get_mother().get_name()}
+                                                             for assistance in assistances]}
+
+        self._snapshot = {"update": {"organization": header.get_organization(), "date": header.get_date(),
+                                     "time": header.get_time()},
+                          "mothers": mothers,
+                          "doctors": doctors,
+                          "queue": {"categories": {str(category): queue[category] for category in sorted(queue)},
+                                    "total": sum(queue.values())},
+                          "redirects": {"redirects": self._redirects}}
+        self._redirects = []
+
+
+    def query(self, path):
+        """
+        Answers a query from the snapshot last published by the current QueryService instance.
+
+        Args:
+            path (str): the path of the query, such as "/mothers/Barbara%20Brooks".
+
+        Returns:
+            tuple:
+                - status (int): the HTTP status of the answer: 200, 404 if the query or its mother or doctor is
+                                unknown, or 503 if no update was published.
+                - result (dict): the result of the query, or an error message under the key "error".
+        """
+
+        from urllib.parse import unquote, urlsplit
+
+        snapshot = self._snapshot
+
+        if snapshot is None:
+            return 503, {"error": "Query error: no update published yet."}
+
+        kind, _, name = unquote(urlsplit(path).path).strip("/").partition("/")
+
+        if kind in ("update", "queue", "redirects") and not name:
+            return 200, snapshot[kind]
+
+        if kind in ("mothers", "doctors") and name in snapshot[kind]:
+            return 200, snapshot[kind][name]
+
+        if kind in ("mothers", "doctors") and name:
+            return 404, {"error": f"Query error: no {kind[:-1]} '{name}' in the update."}
+
+        return 404, {"error": f"Query error: unknown query '{path}'."}
+
+
+    def start(self):
+        """
+        Starts serving the queries of the current QueryService instance in a background thread.
+        """
+
+        from threading import Thread
+
+        self._thread = Thread(target = self._server.serve_forever, daemon = True)
+        self._thread.start()
+
+
+    def wait(self):
+        """
+        Waits until the current QueryService instance stops serving, such as when the tool is interrupted.
+        """
+
+        if self._thread:
+            self._thread.join()
+
+
+    def close(self):
+        """
+        Stops serving the queries of the current QueryService instance and releases its address. Closing a
+        QueryService instance more than once has no effect.
+        """
+
+        if self._thread:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+
+        self._server.server_close()
+
+
+    def __enter__(self):
+        """
+        Supports the use of the current QueryService instance in a with statement.
+
+        Returns:
+            QueryService: the current QueryService instance.
+        """
+
+        return self
+
+
+    def __exit__(self, exception_type, exception, traceback):
+        """
+        Closes the current QueryService instance at the end of a with statement, even if an exception was raised.
+        """
+
+        self.close()
@@ -0,0 +1,296 @@
+#-*- coding: utf-8 -*-
+
+
+from classes.Time import Time
+from classes.Schedule import Schedule
+from classes.Assistance import Assistance
+from classes.PlanningPolicy import PlanningPolicy
+
+from copy import deepcopy
+from functools import cmp_to_key
+from constants import WKL_LEAVE
+
+
+class ReferencePlanner:
+    """
+    A class that plans an update of the birth-plan-manager tool with a frozen copy of the planning path of the tool
+    as it was when the differential benchmark was added, so that it serves as the oracle of the benchmark while the
+    planning classes are optimized.
+
+    Note:
+        The copy covers Schedule.create_next_schedule() and the methods it calls on the doctors, mothers and
+        assistances, including their priority comparisons, which are copied as comparison functions so that the
+        reference does not depend on the __lt__() methods it checks. The rules of the hospital are read from a
+        PlanningPolicy, as in the planner, so that both follow the same overrides.
+    """
+
+    def __init__(self, policy = None):
+        """
+        Initializes a new ReferencePlanner.
+
+        Args:
+            policy (PlanningPolicy, optional): the rules of the hospital. Defaults to the default PlanningPolicy.
+        """
+
+        self._policy = policy if policy else PlanningPolicy.default()
+
+
+    def compare_doctors(self, doctor, other_doctor):
+        """
+        Compares two doctors according to the priority criteria defined in the specification of the
+        birth-plan-manager tool, as the frozen copy of Doctor.__lt__().
+
+        Args:
+            doctor (Doctor): a doctor.
+            other_doctor (Doctor): another doctor.
+
+        Returns:
+            int: -1 if doctor should be ordered before other_doctor for an assistance, 1 otherwise.
+        """
+
+        if doctor.get_name() and doctor.get_category() and doctor.get_availability() and doctor.get_minutes_today() \
+            and doctor.get_weekly_time() and other_doctor.get_name() and other_doctor.get_category() and \
+                other_doctor.get_availability() and other_doctor.get_minutes_today() and other_doctor.get_weekly_time():
+
+            availability = Time(doctor.get_availability()).get_time_delta()
+            other_availability = Time(other_doctor.get_availability()).get_time_delta()
+
+            if availability < other_availability:
+                return -1
+            elif availability > other_availability:
+                return 1
+
+            if int(doctor.get_category()) < int(other_doctor.get_category()):
+                return 1
+            elif int(doctor.get_category()) > int(other_doctor.get_category()):
+                return -1
+
+            if int(doctor.get_minutes_today()) < int(other_doctor.get_minutes_today()):
+                return -1
+            elif int(doctor.get_minutes_today()) > int(other_doctor.get_minutes_today()):
+                return 1
+
+            weekly_time = Time(doctor.get_weekly_time()).get_time_delta()
+            other_weekly_time = Time(other_doctor.get_weekly_time()).get_time_delta()
+
+            if weekly_time < other_weekly_time:
+                return -1
+            elif weekly_time > other_weekly_time:
+                return 1
+
+        return -1 if doctor.get_name() < other_doctor.get_name() else 1
+
+
+    def compare_mothers(self, mother, other_mother):
+        """
+        Compares two mothers according to the priority criteria defined in the specification of the
+        birth-plan-manager tool, as the frozen copy of Mother.__lt__().
+
+        Args:
+            mother (Mother): a mother.
+            other_mother (Mother): another mother.
+
+        Returns:
+            int: -1 if mother should be ordered before other_mother for an assistance, 1 otherwise.
+        """
+
+        if mother.get_name() and mother.get_age() and mother.get_wristband() and mother.get_risk() and \
+            other_mother.get_name() and other_mother.get_age() and other_mother.get_wristband() and \
+                other_mother.get_risk():
+
+            if mother.map_risk() < other_mother.map_risk():
+                return 1
+            elif mother.map_risk() > other_mother.map_risk():
+                return -1
+
+            if mother.map_wristband() < other_mother.map_wristband():
+                return 1
+            elif mother.map_wristband() > other_mother.map_wristband():
+                return -1
+
+            if int(mother.get_age()) < int(other_mother.get_age()):
+                return 1
+            elif int(mother.get_age()) > int(other_mother.get_age()):
+                return -1
+
+        return -1 if mother.get_name() < other_mother.get_name() else 1
+
+
+    def compare_assistances(self, assistance, other_assistance):
+        """
+        Compares two assistances by time, then by the names of their mothers, as the frozen copy of
+        Assistance.__lt__().
+
+        Args:
+            assistance (Assistance): an assistance.
+            other_assistance (Assistance): another assistance.
+
+        Returns:
+            int: -1 if assistance should be ordered before other_assistance, 1 if after and 0 if they are tied.
+        """
+
+        if assistance.get_time().get_time_delta() < other_assistance.get_time().get_time_delta():
+            return -1
+
+        elif assistance.get_time().get_time_delta() > other_assistance.get_time().get_time_delta():
+            return 1
+
+        if assistance.get_mother().get_name() < other_assistance.get_mother().get_name():
+            return -1
+
+        elif assistance.get_mother().get_name() > other_assistance.get_mother().get_name():
+            return 1
+
+        return 0
+
+
+    def weekly_leave_check(self, doctor):
+        """
+        Checks whether a doctor has reached the maximum working time in a week.
+
+        Args:
+            doctor (Doctor): the doctor.
+
+        Returns:
+            bool:
+                - True if the doctor has reached the maximum weekly work time.
+                - False otherwise.
+        """
+
+        return self._policy.weekly_leave_check(Time(doctor.get_weekly_time()).convert_time_to_minutes())
+
+
+    def select_doctor(self, doctors, min_category = False):
+        """
+        Selects the doctor for an assistance, among the doctors not on weekly leave sorted again for every request.
+
+        Args:
+            doctors (list): the doctors of the update.
+            min_category (bool, optional): whether the doctor must have the minimum category for a high risk
+                                           assistance. Defaults to False.
+
+        Returns:
+            Doctor: the selected doctor for an assistance, or None if no doctor satisfies the criteria.
+        """
+
+        available_doctors = [doctor for doctor in doctors if not self.weekly_leave_check(doctor)]
+
+        for doctor in sorted(available_doctors, key = cmp_to_key(self.compare_doctors)):
+            if not min_category or int(doctor.get_category()) >= self._policy.get_min_category():
+                return doctor
+
+        return None
+
+
+    def adjust_availability(self, doctor, next_time):
+        """
+        Computes the time of an assistance of a doctor and the availability of the doctor after it.
+
+        Args:
+            doctor (Doctor): the doctor carrying out the assistance.
+            next_time (Time): the time of the next update of the birth-plan-manager tool.
+
+        Returns:
+            tuple:
+                - assistance_time (Time): the time of the asistance.
+                - adjusted_availability (Time): the availability of the doctor after the assistance.
+        """
+
+        availability = Time(doctor.get_availability())
+
+        if availability.get_time_delta() < next_time.get_time_delta():
+            assistance_time = Time(next_time.get_time_string())
+            adjusted_availability = Time(next_time.get_time_string())
+        else:
+            assistance_time = Time(availability.get_time_string())
+            adjusted_availability = Time(doctor.get_availability())
+
+        adjusted_availability.add_minutes(self._policy.get_assistance_minutes())
+
+        return assistance_time, adjusted_availability
+
+
+    def update_working_time(self, doctor, adjusted_availability):
+        """
+        Updates the availability, minutes in the day and weekly time of a doctor after an assistance, including the
+        daily break.
+
+        Args:
+            doctor (Doctor): the doctor carrying out the assistance.
+            adjusted_availability (Time): the availability of the doctor after the assistance.
+        """
+
+        doctor.set_availability(adjusted_availability.get_time_string())
+
+        minutes_today = int(doctor.get_minutes_today()) + self._policy.get_assistance_minutes()
+        doctor.set_minutes_today(str(minutes_today))
+
+        weekly_time = Time(doctor.get_weekly_time())
+        weekly_time.add_minutes(self._policy.get_assistance_minutes())
+        doctor.set_weekly_time(weekly_time.get_time_string())
+
+        if self._policy.daily_break_check(minutes_today):
+            availability = Time(doctor.get_availability())
+            availability.add_minutes(self._policy.get_break_minutes())
+            doctor.set_availability(availability.get_time_string())
+
+
+    def plan(self, schedule, doctors_collection, mothers_collection):
+        """
+        Plans the next schedule and doctors of an update, as the frozen copy of Schedule.create_next_schedule().
+
+        Args:
+            schedule (Schedule): the schedule of the update.
+            doctors_collection (DoctorsCollection): the doctors of the update.
+            mothers_collection (MothersCollection): the requests of the update, without the mothers already on the
+                                                    schedule.
+
+        Returns:
+            tuple:
+                - next_schedule (Schedule): the schedule of the next update.
+                - doctors (DoctorsCollection): the doctors of the next update.
+        """
+
+        doctors = deepcopy(doctors_collection)
+        mothers = sorted(deepcopy(mothers_collection).mothers_items(), key = cmp_to_key(self.compare_mothers))
+        doctors_list = list(doctors.doctors_items())
+
+        next_time = Time(doctors.get_header().get_time())
+        next_time.add_minutes(self._policy.get_increment_minutes())
+
+        assistances = []
+        scheduled_mothers = set()
+
+        for mother in mothers:
+            min_category = mother.get_risk() == "high"
+            doctor = self.select_doctor(doctors_list, min_category)
+
+            if doctor:
+                assistance_time, adjusted_availability = self.adjust_availability(doctor, next_time)
+                scheduled_mothers.add(mother.get_name())
+
+                if adjusted_availability.within_operating_time(self._policy):
+                    assistances.append(Assistance(assistance_time, mother, doctor))
+                    self.update_working_time(doctor, adjusted_availability)
+
+                else:
+                    assistances.append(Assistance(assistance_time, mother))
+
+        for doctor in doctors_list:
+            if self.weekly_leave_check(doctor):
+                doctor.set_availability(WKL_LEAVE)
+
+        for mother in mothers:
+            if mother.get_name() not in scheduled_mothers:
+                assistances.append(Assistance(next_time, mother))
+
+        for assistance in schedule.schedule_items():
+            time_delta = assistance.get_time().get_time_delta()
+
+            if not (time_delta and next_time.get_time_delta() and time_delta < next_time.get_time_delta()):
+                assistances.append(Assistance(assistance.get_time(), assistance.get_mother(), assistance.get_doctor()))
+
+        next_schedule = Schedule()
+        next_schedule.set_schedule(sorted(assistances, key = cmp_to_key(self.compare_assistances)))
+
+        return next_schedule, doctors
@@ -0,0 +1,87 @@
+#-*- coding: utf-8 -*-
+
+
+from classes.Doctor import Doctor
+from classes.Mother import Mother
+
+from sys import intern
+
+
+class Registry:
+    """
+    A class to represent a registry of the doctors and mothers of a schedule, which interns their names and links each
+    assistance to a single shared Doctor object, taken from the roster of doctors whenever possible.
+    """
+
+    def __init__(self, doctors_collection = None):
+        """
+        Initializes a new Registry.
+
+        Args:
+            doctors_collection (DoctorsCollection, optional): the roster of doctors whose Doctor objects are shared with
+                                                              the schedule. Defaults to None.
+        """
+
+        self._doctors = {}
+        self._mothers = {}
+
+        if doctors_collection:
+            for doctor in doctors_collection.doctors_items():
+                doctor.set_name(intern(doctor.get_name()))
+                self._doctors[doctor.get_name()] = doctor
+
+
+    def get_doctor(self, name):
+        """
+        The shared Doctor object of a given name in the current Registry instance.
+
+        Args:
+            name (str): the name of the doctor.
+
+        Returns:
+            Doctor: the shared Doctor object, or None if no doctor with that name is registered.
+        """
+
+        return self._doctors.get(name)
+
+
+    def intern_doctor(self, name):
+        """
+        Resolves a doctor's name to its shared Doctor object, registering a new Doctor object with only the name
+        defined if the doctor is not in the roster.
+
+        Args:
+            name (str): the name of the doctor.
+
+        Returns:
+            Doctor: the shared Doctor object of the given name, so that two doctors of the current Registry instance
+                    have the same name if and only if they are the same object.
+        """
+
+        doctor = self._doctors.get(name)
+
+        if doctor is None:
+            doctor = Doctor(intern(name))
+            self._doctors[doctor.get_name()] = doctor
+
+        return doctor
+
+
+    def intern_mother(self, name):
+        """
+        Resolves a mother's name to its shared Mother object, with only the name defined.
+
+        Args:
+            name (str): the name of the mother.
+
+        Returns:
+            Mother: the shared Mother object of the given name.
+        """
+
+        mother = self._mothers.get(name)
+
+        if mother is None:
+            mother = Mother(intern(name))
+            self._mothers[mother.get_name()] = mother
+
+        return mother
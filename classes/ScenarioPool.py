@@ -0,0 +1,264 @@
+#-*- coding: utf-8 -*-
+
+
+from classes.Time import Time
+from classes.Doctor import Doctor
+from classes.Mother import Mother
+from classes.Bundle import Bundle
+from classes.DataManager import DataManager
+from classes.PlanningPolicy import PlanningPolicy
+
+from constants import WKL_LEAVE
+
+
+class ScenarioPool:
+    """
+    A class to represent a pool of warm worker processes that plan variants of the same update, for what-if sweeps
+    and capacity forecasts.
+
+    Note:
+        The input files of the baseline update are written once into a block of shared memory. Each worker process
+        reads them from the block and parses them once, when it starts, and then plans every scenario it receives from
+        the baseline collections it keeps. A scenario is only a compact delta from the baseline, as a dictionary with
+        any of the keys:
+            - "add_doctors": the lines of the doctors added, as in a doctors file.
+            - "remove_doctors": the names of the doctors removed.
+            - "add_requests": the lines of the requests added, as in a requests file.
+            - "remove_requests": the names of the mothers whose requests are removed.
+            - "policy_overrides": the planning rules that override those of the baseline, as keyword arguments of the
+              PlanningPolicy class.
+        Each worker sends back the summary metrics of the scenario only, so that a sweep is bounded by the planning of
+        the scenarios rather than by setting up and sending the collections.
+    """
+
+    # Baseline collections of the current process, set by the load_files() method
+    _baseline = None
+
+
+    def __init__(self, doctors_file, schedule_file, requests_file, processes = None, policy_overrides = {},
+                 context = None):
+        """
+        Initializes a new ScenarioPool and starts its worker processes.
+
+        Args:
+            doctors_file (str): the doctors file of the baseline update.
+            schedule_file (str): the schedule file of the baseline update.
+            requests_file (str): the requests file of the baseline update.
+            processes (int, optional): the number of worker processes. Defaults to None, which uses one process per
+                                       processor.
+            policy_overrides (dict, optional): the planning rules that override those of the organization for every
+                                               scenario, as keyword arguments of the PlanningPolicy class. Defaults to
+                                               an empty dictionary.
+            context (multiprocessing.context.BaseContext, optional): the context of the worker processes, such as
+                                                                     the one returned by get_context("spawn").
+                                                                     Defaults to None, the default context.
+        """
+
+        from concurrent.futures import ProcessPoolExecutor
+        from io import BytesIO
+        from multiprocessing.shared_memory import SharedMemory
+
+        input_files = (doctors_file, schedule_file, requests_file)
+        bundle = BytesIO()
+
+        contents = {file_name: DataManager(file_name).open_file().read() for file_name in input_files}
+        Bundle().write(bundle, contents, Bundle.READ_ENCODING)
+        content = bundle.getvalue()
+
+        self._memory = SharedMemory(create = True, size = max(len(content), 1))
+        self._memory.buf[:len(content)] = content
+        self._closed = False
+
+        self._executor = ProcessPoolExecutor(max_workers = processes, mp_context = context,
+                                             initializer = self.load_baseline,
+                                             initargs = (self._memory.name, len(content), input_files,
+                                                         dict(policy_overrides)))
+
+
+    @classmethod
+    def load_baseline(cls, memory_name, size, input_files, policy_overrides = {}):
+        """
+        Reads and parses the input files of the baseline update from a block of shared memory, once for each worker
+        process.
+
+        Args:
+            memory_name (str): the name of the block of shared memory.
+            size (int): the size in bytes of the input files in the block.
+            input_files (tuple): the doctors, schedule and requests files of the baseline update.
+            policy_overrides (dict, optional): the planning rules that override those of the organization. Defaults to
+                                               an empty dictionary.
+        """
+
+        from io import BytesIO
+        from multiprocessing.shared_memory import SharedMemory
+
+        memory = SharedMemory(name = memory_name)
+
+        try:
+            files = Bundle().read(BytesIO(bytes(memory.buf[:size])))
+        finally:
+            memory.close()
+
+        DataManager.set_file_contents(files)
+
+        try:
+            cls.load_files(input_files, policy_overrides)
+        finally:
+            DataManager.set_file_contents({})
+
+
+    @classmethod
+    def load_files(cls, input_files, policy_overrides = {}):
+        """
+        Parses the input files of the baseline update into the baseline collections of the current process.
+
+        Args:
+            input_files (tuple): the doctors, schedule and requests files of the baseline update.
+            policy_overrides (dict, optional): the planning rules that override those of the organization. Defaults to
+                                               an empty dictionary.
+        """
+
+        from classes.DoctorsCollection import DoctorsCollection
+        from classes.MothersCollection import MothersCollection
+        from classes.Schedule import Schedule
+        from classes.Registry import Registry
+
+        doctors_file, schedule_file, requests_file = input_files
+
+        doctors_collection = DoctorsCollection(doctors_file)
+        mothers_collection = MothersCollection(requests_file)
+        schedule = Schedule(schedule_file, registry = Registry(doctors_collection))
+
+        mothers_collection.remove_scheduled_mothers(schedule)
+
+        cls._baseline = (doctors_collection, schedule, mothers_collection, dict(policy_overrides))
+
+
+    @classmethod
+    def plan_scenario(cls, scenario):
+        """
+        Plans a scenario from the baseline collections of the current process.
+
+        Args:
+            scenario (dict): the delta of the scenario from the baseline update.
+
+        Returns:
+            dict: the summary metrics of the scenario, as returned by the create_summary() method.
+        """
+
+        from classes.DoctorsCollection import DoctorsCollection
+        from classes.MothersCollection import MothersCollection
+
+        doctors_collection, schedule, mothers_collection, policy_overrides = cls._baseline
+
+        removed_doctors = set(scenario.get("remove_doctors", ()))
+        doctors = [doctor for doctor in doctors_collection.doctors_items() if doctor.get_name() not in removed_doctors]
+        doctors.extend(Doctor(*line.rstrip().split(", ")) for line in scenario.get("add_doctors", ()))
+
+        removed_mothers = set(scenario.get("remove_requests", ()))
+        mothers = [mother for mother in mothers_collection.mothers_items() if mother.get_name() not in removed_mothers]
+        mothers.extend(Mother(*line.rstrip().split(", ")) for line in scenario.get("add_requests", ()))
+
+        scenario_doctors = DoctorsCollection(header = doctors_collection.get_header(), doctors = doctors)
+        scenario_mothers = MothersCollection(header = mothers_collection.get_header(), mothers = mothers)
+        scenario_mothers.remove_scheduled_mothers(schedule)
+
+        policy = PlanningPolicy.for_organization(doctors_collection.get_header().get_organization(),
+                                                 **{**policy_overrides, **scenario.get("policy_overrides", {})})
+
+        next_schedule, next_doctors = schedule.create_next_schedule(scenario_doctors, scenario_mothers,
+                                                                    policy = policy)
+
+        return cls.create_summary(next_schedule, next_doctors, scenario_mothers,
+                                  Time(scenario_doctors.retrieve_next_time(policy)))
+
+
+    @staticmethod
+    def create_summary(next_schedule, next_doctors, mothers_collection, next_time):
+        """
+        Creates the summary metrics of a planned scenario.
+
+        Args:
+            next_schedule (Schedule): the next schedule of the scenario.
+            next_doctors (DoctorsCollection): the next doctors of the scenario.
+            mothers_collection (MothersCollection): the requests of the scenario.
+            next_time (Time): the time of the next update of the scenario.
+
+        Returns:
+            dict: the number of requests, of assigned requests, of redirected requests and of redirected high risk
+                  requests, the mean wait in minutes from the next update to the assigned assistances, and the number
+                  of doctors on weekly leave.
+        """
+
+        requested = {mother.get_name() for mother in mothers_collection.mothers_items()}
+        waits = []
+        redirected = 0
+        high_risk_redirected = 0
+
+        for assistance in next_schedule.schedule_items():
+            if assistance.get_mother().get_name() not in requested:
+                continue
+
+            if assistance.get_doctor():
+                waits.append(assistance.get_time().convert_time_to_minutes() - next_time.convert_time_to_minutes())
+            else:
+                redirected += 1
+                high_risk_redirected += assistance.get_mother().get_risk() == "high"
+
+        return {"requests": len(requested), "assigned": len(waits), "redirected": redirected,
+                "high_risk_redirected": high_risk_redirected,
+                "mean_wait": sum(waits) / len(waits) if waits else 0.0,
+                "weekly_leave": sum(1 for doctor in next_doctors.doctors_items()
+                                    if doctor.get_availability() == WKL_LEAVE)}
+
+
+    def sweep(self, scenarios):
+        """
+        Plans scenarios in the worker processes of the current ScenarioPool instance.
+
+        Args:
+            scenarios (list): the delta of each scenario from the baseline update.
+
+        Returns:
+            list: the summary metrics of each scenario, in the order of the scenarios.
+
+        Raises:
+            ValueError: if the current ScenarioPool instance is closed.
+        """
+
+        if self._closed:
+            raise ValueError("Scenario pool error: scenarios submitted after the pool was closed.")
+
+        return list(self._executor.map(self.plan_scenario, scenarios))
+
+
+    def close(self):
+        """
+        Stops the worker processes of the current ScenarioPool instance and releases its shared memory. Closing a
+        ScenarioPool instance more than once has no effect.
+        """
+
+        if not self._closed:
+            self._closed = True
+            self._executor.shutdown()
+            self._memory.close()
+            self._memory.unlink()
+
+
+    def __enter__(self):
+        """
+        Supports the use of the current ScenarioPool instance in a with statement.
+
+        Returns:
+            ScenarioPool: the current ScenarioPool instance.
+        """
+
+        return self
+
+
+    def __exit__(self, exception_type, exception, traceback):
+        """
+        Closes the current ScenarioPool instance at the end of a with statement, even if an exception was raised.
+        """
+
+        self.close()
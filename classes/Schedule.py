@@ -6,8 +6,12 @@ from classes.Mother import Mother
 from classes.Doctor import Doctor
 from classes.Assistance import Assistance
 from classes.DataManager import DataManager
+from classes.TimelineIndex import TimelineIndex
+from classes.PlanningPolicy import PlanningPolicy
+from classes.ContentDigest import ContentDigest
 
 from copy import deepcopy
+from constants import REDIRECTED_REQUEST
 
 
 class Schedule(DataManager):
@@ -15,7 +19,7 @@ class Schedule(DataManager):
     A class to represent a collection of Assistance objects.
     """
 
-    def __init__(self, file_name = None, header = None, schedule = []):
+    def __init__(self, file_name = None, header = None, schedule = [], registry = None):
         """
         Initializes a new Schedule.
 
@@ -23,6 +27,8 @@ class Schedule(DataManager):
             file_name (str, optional): the name of the file associated with the collection. Defaults to None.
             header (Header, optional): the Header object associated with the collection. Defaults to None.
             schedule (list, optional): the list of Assistance objects associated with the collection. Defaults to an empty list.
+            registry (Registry, optional): the Registry object that resolves the doctors and mothers of the collection
+                                           to shared objects. Defaults to None.
         
         Note:
             If file_name is provided and schedule is an empty list, the set_schedule() method will be called to populate
@@ -31,6 +37,12 @@ class Schedule(DataManager):
         
         super().__init__(file_name, header)
         self._schedule = deepcopy(schedule)
+        self._registry = registry
+        self._timeline = None
+        self._digest = ContentDigest()
+
+        for assistance in self._schedule:
+            self._digest.add(assistance)
          
         if self.get_file_name() and not self.get_schedule():
             self.set_schedule()
@@ -48,6 +60,18 @@ class Schedule(DataManager):
         return deepcopy(self._schedule)
     
 
+    def get_registry(self):
+        """
+        The Registry object of the current Schedule instance.
+
+        Returns:
+            Registry: the registry that resolves the doctors and mothers of the current Schedule instance, or None if
+                      the schedule has no registry.
+        """
+
+        return self._registry
+
+
     def set_schedule(self, schedule = []):
         """
         Sets the list of Assistance objects associated with the current Schedule instance.
@@ -55,18 +79,72 @@ class Schedule(DataManager):
         Args:
             schedule (list, optional): the list of Assistance objects associated with the current Schedule instance.
                                        Defaults to an empty list.
+
+        Note:
+            When read from the file, the lines of redirected requests have no doctor associated to them, and the
+            doctors and mothers of the other lines are resolved through the registry, if the current Schedule instance
+            has one.
         """
 
         if schedule == []:
 
             in_file = super().remove_header()
 
+            registry = self.get_registry()
+
             for line in in_file:
                 time, mother, doctor = line.rstrip().split(", ")
-                self.add_assistance(Time(time), Mother(mother), Doctor(doctor))
+
+                if doctor == REDIRECTED_REQUEST:
+                    doctor = None
+                elif registry:
+                    doctor = registry.intern_doctor(doctor)
+                else:
+                    doctor = Doctor(doctor)
+
+                mother = registry.intern_mother(mother) if registry else Mother(mother)
+
+                self.add_assistance(Time(time), mother, doctor)
 
         else:
             self._schedule = schedule
+            self._timeline = None
+            self._digest = ContentDigest()
+
+            for assistance in self._schedule:
+                self._digest.add(assistance)
+
+
+    def get_timeline(self, policy = None):
+        """
+        The interval index over the assistances of the current Schedule instance, built on first use and built again
+        on the next use after assistances are added, so that adding an assistance does not pay for the index.
+
+        Args:
+            policy (PlanningPolicy, optional): the rules of the hospital, whose assistance duration is the duration of
+                                               the indexed assistances. Defaults to the default PlanningPolicy.
+
+        Returns:
+            TimelineIndex: the interval index of the current Schedule instance.
+        """
+
+        duration = (policy if policy else PlanningPolicy.default()).get_assistance_minutes()
+
+        if self._timeline is None or self._timeline.get_duration() != duration:
+            self._timeline = TimelineIndex(self._schedule, duration)
+
+        return self._timeline
+
+
+    def get_digest(self):
+        """
+        The content digest of the current Schedule instance, kept up to date as assistances are added.
+
+        Returns:
+            ContentDigest: the order-independent digest of the assistances of the current Schedule instance.
+        """
+
+        return self._digest
 
 
     def schedule_items(self):
@@ -81,7 +159,8 @@ class Schedule(DataManager):
             yield assistance
 
 
-    def create_next_schedule(self, doctors_collection, mothers_collection):
+    def create_next_schedule(self, doctors_collection, mothers_collection, observers = [], policy = None,
+                             lookahead = None):
         """
         Creates the schedule attribute of the next Schedule instance according to the criteria defined in the 
         specification of the birth-plan-manager tool.
@@ -89,47 +168,157 @@ class Schedule(DataManager):
         Args:
             doctors_collection (DoctorsCollection): the list of Doctor objects associated with the current collection.
             mothers_collection (MothersCollection): the list of Mother objects associated with the current collection.
+            observers (list, optional): the PlanningObserver objects notified of each planning event. Defaults to an
+                                        empty list.
+            policy (PlanningPolicy, optional): the rules of the hospital. Defaults to the default PlanningPolicy.
+            lookahead (Lookahead, optional): the lookahead that reserves working time of the doctors for the high risk
+                                             requests forecast in the next updates. Defaults to None.
 
         Returns:
             next_schedule (list): the list of Assistance objects associated with the next collection.
         """
 
+        policy = policy if policy else PlanningPolicy.default()
+
         doctors = deepcopy(doctors_collection)
         mothers = deepcopy(mothers_collection)
         
         mothers.sort_mothers()
 
         next_schedule = Schedule()
-        next_time = Time(doctors.retrieve_next_time())
-        
-        doctors_on_leave = []
+        next_time = Time(doctors.retrieve_next_time(policy))
+
+        if lookahead:
+            lookahead.advance(next_time)
+            lookahead.synchronize(doctors)
+            observers = observers + [lookahead]
+
+        for observer in observers:
+            observer.record_phase("sort")
         
         for mother in mothers.mothers_items():
-            doctor = self.assign_doctor(mother, doctors)
+            doctor = self.assign_doctor(mother, doctors, policy, lookahead)
 
             if doctor:
-                assistance_time, adjusted_availability = doctor.adjust_availability(next_time)
+                assistance_time, adjusted_availability = doctor.adjust_availability(next_time, policy)
 
-                if adjusted_availability.within_operating_time():
-                    next_schedule.add_assistance(assistance_time, mother, doctor)
-                    doctor.update_working_time(adjusted_availability)
-                    doctor.daily_break_check()
-
-                    if doctor.weekly_leave_check():
-                        doctors_on_leave.append(doctor)
+                if adjusted_availability.within_operating_time(policy):
+                    next_schedule.add_assigned_assistance(assistance_time, adjusted_availability, mother, doctor,
+                                                          doctors, observers, policy)
 
                 else:
-                    next_schedule.add_assistance(assistance_time, mother)
+                    assistance = next_schedule.add_assistance(assistance_time, mother)
+
+                    for observer in observers:
+                        observer.record_redirect(assistance)
+
+        doctors_on_leave = doctors.add_weekly_leave(policy)
 
-        doctors.add_weekly_leave()
-        next_schedule.add_unassigned_requests(next_time, mothers)
-        self.add_pending_assistances(next_time, next_schedule)
+        if lookahead:
+            lookahead.mark_synchronized(doctors)
+
+        for doctor in doctors_on_leave:
+            for observer in observers:
+                observer.record_weekly_leave(doctor)
+
+        for observer in observers:
+            observer.record_phase("assign")
+
+        next_schedule.add_unassigned_requests(next_time, mothers, observers)
+        self.add_pending_assistances(next_time, next_schedule, observers)
         next_schedule.sort_schedule()
 
+        for observer in observers:
+            observer.record_phase("merge")
+
         return next_schedule, doctors
     
 
-    def assign_doctor(self, mother, doctors_collection):
+    def create_batch_schedule(self, doctors_collection, mothers_collection, observers = [], policy = None):
+        """
+        Creates the schedule attribute of the next Schedule instance as the create_next_schedule() method does, but
+        assigning all the requests at once, as a minimum cost assignment of the requests to the slots of the doctors,
+        instead of one request after the other.
+
+        Args:
+            doctors_collection (DoctorsCollection): the list of Doctor objects associated with the current collection.
+            mothers_collection (MothersCollection): the list of Mother objects associated with the current collection.
+            observers (list, optional): the PlanningObserver objects notified of each planning event. Defaults to an
+                                        empty list.
+            policy (PlanningPolicy, optional): the rules of the hospital. Defaults to the default PlanningPolicy.
+
+        Returns:
+            next_schedule (list): the list of Assistance objects associated with the next collection.
+        """
+
+        from classes.BatchAssignment import BatchAssignment
+
+        policy = policy if policy else PlanningPolicy.default()
+
+        doctors = deepcopy(doctors_collection)
+        mothers = deepcopy(mothers_collection)
+
+        mothers.sort_mothers()
+
+        next_schedule = Schedule()
+        next_time = Time(doctors.retrieve_next_time(policy))
+
+        for observer in observers:
+            observer.record_phase("sort")
+
+        for mother, doctor in BatchAssignment(policy).assign(list(mothers.mothers_items()),
+                                                             list(doctors.doctors_items()), next_time):
+            assistance_time, adjusted_availability = doctor.adjust_availability(next_time, policy)
+            next_schedule.add_assigned_assistance(assistance_time, adjusted_availability, mother, doctor, doctors,
+                                                  observers, policy)
+
+        doctors_on_leave = doctors.add_weekly_leave(policy)
+
+        for doctor in doctors_on_leave:
+            for observer in observers:
+                observer.record_weekly_leave(doctor)
+
+        for observer in observers:
+            observer.record_phase("assign")
+
+        next_schedule.add_unassigned_requests(next_time, mothers, observers)
+        self.add_pending_assistances(next_time, next_schedule, observers)
+        next_schedule.sort_schedule()
+
+        for observer in observers:
+            observer.record_phase("merge")
+
+        return next_schedule, doctors
+
+
+    def add_assigned_assistance(self, assistance_time, adjusted_availability, mother, doctor, doctors_collection,
+                                observers = [], policy = None):
+        """
+        Adds the assistance of a doctor to a mother to the current Schedule instance and updates the working time of
+        the doctor.
+
+        Args:
+            assistance_time (Time): the time of the assistance.
+            adjusted_availability (Time): the availability of the doctor after the assistance.
+            mother (Mother): the mother of the assistance.
+            doctor (Doctor): the doctor of the assistance, from doctors_collection.
+            doctors_collection (DoctorsCollection): the collection of doctors, whose content digest is refreshed.
+            observers (list, optional): the PlanningObserver objects notified of the assistance. Defaults to an empty
+                                        list.
+            policy (PlanningPolicy, optional): the rules of the hospital. Defaults to the default PlanningPolicy.
+        """
+
+        assistance = self.add_assistance(assistance_time, mother, doctor)
+        previous_doctor = str(doctor)
+        doctor.update_working_time(adjusted_availability, policy)
+        doctor.daily_break_check(policy)
+        doctors_collection.refresh_digest(previous_doctor, doctor)
+
+        for observer in observers:
+            observer.record_assistance(assistance, doctor)
+
+
+    def assign_doctor(self, mother, doctors_collection, policy = None, lookahead = None):
         """
         Assigns the most appropriate doctor to a mother, according to the criteria defined in the specification
         of the birth-plan-manager tool.
@@ -137,15 +326,18 @@ class Schedule(DataManager):
         Args:
             mother (Mother): the mother that needs an assistance.
             doctors_collection (DoctorsCollection): the collection of available doctors.
+            policy (PlanningPolicy, optional): the rules of the hospital. Defaults to the default PlanningPolicy.
+            lookahead (Lookahead, optional): the lookahead that reserves working time of the doctors for the high risk
+                                             requests forecast in the next updates. Defaults to None.
         
         Returns:
             Doctor: the selected doctor for an assistance to a given mother or None if no doctor is available.
         """
 
         if mother.get_risk() == "high":
-            return doctors_collection.select_doctor(min_category=True)
+            return doctors_collection.select_doctor(min_category=True, policy=policy)
         else:
-            return doctors_collection.select_doctor()
+            return doctors_collection.select_doctor(policy=policy, lookahead=lookahead)
     
 
     def add_assistance(self, time, mother, doctor=None):
@@ -157,15 +349,24 @@ class Schedule(DataManager):
             time (Time): the time of an Assistance.
             mother (Mother): the mother of an Assistance.
             doctor (Doctor, optional): the doctor of an Assistance. Defaults to None.
+
+        Returns:
+            Assistance: the Assistance object added to the current Schedule instance.
         """
 
         if doctor:
-            self._schedule.append(Assistance(time, mother, doctor))
+            assistance = Assistance(time, mother, doctor)
         else:
-            self._schedule.append(Assistance(time, mother))
+            assistance = Assistance(time, mother)
+
+        self._schedule.append(assistance)
+        self._timeline = None
+        self._digest.add(assistance)
+
+        return assistance
         
 
-    def add_unassigned_requests(self, next_time, mothers_collection):
+    def add_unassigned_requests(self, next_time, mothers_collection, observers = []):
         """
         Retrieves the requests to which it was not possible to assign any doctor and adds them to the collection
         of Assistance objects associated with the next update of the birth-plan-manager tool.
@@ -173,28 +374,44 @@ class Schedule(DataManager):
         Args:
             next_time (Time): the time of the next update of the birth-plan-manager tool.
             mothers_collection (MothersCollection): the collection of mothers that need an assistance.
+            observers (list, optional): the PlanningObserver objects notified of each redirected request. Defaults to
+                                        an empty list.
         """
 
-        scheduled_mothers = [assistance.get_mother() for assistance in self.schedule_items()]
+        scheduled_mothers = {assistance.get_mother().equality_key() for assistance in self.schedule_items()}
         
         for mother in mothers_collection.mothers_items():
-            if mother not in scheduled_mothers:
-                self.add_assistance(next_time, mother)
+            if mother.equality_key() not in scheduled_mothers:
+                assistance = self.add_assistance(next_time, mother)
+
+                for observer in observers:
+                    observer.record_redirect(assistance)
         
 
-    def add_pending_assistances(self, next_time, next_schedule):
+    def add_pending_assistances(self, next_time, next_schedule, observers = []):
         """
         Retrieves the assistances that are yet to be carried out at the current Schedule instance and adds them
         to the collection of Assistance objects associated with the next update of the birth-plan-manager tool.
         
         Args:
+            next_time (Time): the time of the next update of the birth-plan-manager tool.
             next_schedule (list): the list of Assistance objects associated with the Schedule instance at the 
                                   next update of the birth-plan-manager tool.
+            observers (list, optional): the PlanningObserver objects notified of each pending and completed
+                                        assistance. Defaults to an empty list.
         """
                 
         for assistance in self.schedule_items():
             if not assistance.get_time() < next_time:
-                next_schedule.add_assistance(assistance.get_time(), assistance.get_mother(), assistance.get_doctor())
+                pending_assistance = next_schedule.add_assistance(assistance.get_time(), assistance.get_mother(),
+                                                                  assistance.get_doctor())
+
+                for observer in observers:
+                    observer.record_pending(pending_assistance)
+
+            else:
+                for observer in observers:
+                    observer.record_completed(assistance)
         
         
     def sort_schedule(self):
@@ -232,15 +449,14 @@ class Schedule(DataManager):
 
         Returns:
             bool:
-                - True if both instances have the same Assistance objects in their schedule attribute.
+                - True if both instances have the same assistances in their schedule attribute, in any order.
                 - False otherwise.
+
+        Note:
+            The content digests of both instances are compared, so the comparison takes constant time.
         """
 
-        if len(self.get_schedule()) != len(other_schedule.get_schedule()):
-            return False
-        
-        return all(x == y for x, y in zip(sorted(self.get_schedule()), 
-                                          sorted(other_schedule.get_schedule())))
+        return self.get_digest() == other_schedule.get_digest()
 
 
     def __str__(self):
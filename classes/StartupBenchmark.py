@@ -0,0 +1,166 @@
+#-*- coding: utf-8 -*-
+
+
+from constants import STARTUP_BENCHMARK_RUNS, IMPORT_TIME_BUDGET, FIRST_OUTPUT_TIME_BUDGET
+
+
+class StartupBenchmark:
+    """
+    A class that measures the startup cost of a tick of the birth-plan-manager tool.
+    """
+
+    def __init__(self, doctors_file, schedule_file, requests_file, runs = STARTUP_BENCHMARK_RUNS):
+        """
+        Initializes a new StartupBenchmark.
+
+        Args:
+            doctors_file (str): the doctors file used to run the benchmarked tick.
+            schedule_file (str): the schedule file used to run the benchmarked tick.
+            requests_file (str): the requests file used to run the benchmarked tick.
+            runs (int, optional): the number of times each measurement is repeated. Defaults to STARTUP_BENCHMARK_RUNS.
+        """
+
+        self._input_files = [doctors_file, schedule_file, requests_file]
+        self._runs = runs
+
+
+    def get_input_files(self):
+        """
+        The input files used to run the benchmarked tick of the current StartupBenchmark instance.
+
+        Returns:
+            list: the names of the doctors, schedule and requests files, in this order.
+        """
+
+        return list(self._input_files)
+
+
+    def get_runs(self):
+        """
+        The number of times each measurement of the current StartupBenchmark instance is repeated.
+
+        Returns:
+            int: the number of times each measurement is repeated.
+        """
+
+        return self._runs
+
+
+    def time_command(self, command, working_directory):
+        """
+        Measures the median wall time of a command over the runs of the current StartupBenchmark instance.
+
+        Args:
+            command (list): the command to run, in the format of the subprocess module.
+            working_directory (str): the directory where the command is run.
+
+        Returns:
+            float: the median wall time of the command, in seconds.
+        """
+
+        from statistics import median
+        from subprocess import run, DEVNULL
+        from time import perf_counter
+
+        timings = []
+
+        for _ in range(self.get_runs()):
+            start = perf_counter()
+            run(command, cwd = working_directory, stdout = DEVNULL, check = True)
+            timings.append(perf_counter() - start)
+
+        return median(timings)
+
+
+    def measure_interpreter_startup(self):
+        """
+        Measures the time that the Python interpreter takes to start and exit without doing any work.
+
+        Returns:
+            float: the median interpreter startup time, in seconds.
+        """
+
+        from os import getcwd
+        from sys import executable
+
+        return self.time_command([executable, "-c", "pass"], getcwd())
+
+
+    def measure_import_time(self):
+        """
+        Measures the time that importing the main module of the birth-plan-manager tool takes in a fresh interpreter.
+
+        Returns:
+            float: the median import time, in seconds.
+        """
+
+        from os.path import dirname, abspath
+        from statistics import median
+        from subprocess import run
+        from sys import executable
+
+        root_directory = dirname(dirname(abspath(__file__)))
+        code = "from time import perf_counter; start = perf_counter(); import main; print(perf_counter() - start)"
+
+        timings = []
+
+        for _ in range(self.get_runs()):
+            result = run([executable, "-c", code], cwd = root_directory, capture_output = True, text = True, check = True)
+            timings.append(float(result.stdout))
+
+        return median(timings)
+
+
+    def measure_first_output_time(self):
+        """
+        Measures the time that a fresh run of the birth-plan-manager tool takes to write its output files, starting
+        from the interpreter launch.
+
+        Returns:
+            float: the median time to first output, in seconds.
+
+        Note:
+            The tick is run in a temporary directory containing copies of the input files, so that the output files
+            do not land in the current directory.
+        """
+
+        from os.path import dirname, abspath, basename, join
+        from shutil import copy
+        from sys import executable
+        from tempfile import TemporaryDirectory
+
+        main_file = join(dirname(dirname(abspath(__file__))), "main.py")
+
+        with TemporaryDirectory() as working_directory:
+            for input_file in self.get_input_files():
+                copy(input_file, working_directory)
+
+            command = [executable, main_file] + [basename(input_file) for input_file in self.get_input_files()]
+
+            return self.time_command(command, working_directory)
+
+
+    def create_report(self):
+        """
+        Runs every measurement of the current StartupBenchmark instance and compares them with the startup budget of
+        the birth-plan-manager tool.
+
+        Returns:
+            tuple:
+                - lines (list): the lines of the report, one for each measurement.
+                - within_budget (bool): True if every budgeted measurement is within its budget, False otherwise.
+        """
+
+        interpreter_time = self.measure_interpreter_startup()
+        import_time = self.measure_import_time()
+        first_output_time = self.measure_first_output_time()
+
+        within_budget = import_time <= IMPORT_TIME_BUDGET and \
+            first_output_time - interpreter_time <= FIRST_OUTPUT_TIME_BUDGET
+
+        lines = [f"interpreter startup: {interpreter_time * 1000:.1f} ms",
+                 f"import main: {import_time * 1000:.1f} ms (budget {IMPORT_TIME_BUDGET * 1000:.1f} ms)",
+                 f"time to first output: {first_output_time * 1000:.1f} ms "
+                 f"(budget {FIRST_OUTPUT_TIME_BUDGET * 1000:.1f} ms over interpreter startup)"]
+
+        return lines, within_budget
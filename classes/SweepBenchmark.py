@@ -0,0 +1,195 @@
+#-*- coding: utf-8 -*-
+
+
+from classes.ScenarioPool import ScenarioPool
+from classes.DifferentialBenchmark import DifferentialBenchmark
+
+from constants import SWEEP_SCENARIOS, SWEEP_DOCTORS, SWEEP_REQUESTS, SWEEP_SEED
+from constants import SWEEP_FRESH_SCENARIOS, SWEEP_EFFICIENCY_TARGET
+
+
+class SweepBenchmark:
+    """
+    A class that plans a sweep of randomized scenarios of a generated update with a warm ScenarioPool and compares its
+    throughput with a fresh process for each scenario and with the planning of the scenarios alone.
+
+    Note:
+        The fresh processes are started with the "spawn" method, so that each one imports the modules and parses the
+        input files again, as a separate run of the tool for each scenario would.
+    """
+
+    def __init__(self, scenarios = SWEEP_SCENARIOS, doctors = SWEEP_DOCTORS, requests = SWEEP_REQUESTS,
+                 seed = SWEEP_SEED):
+        """
+        Initializes a new SweepBenchmark.
+
+        Args:
+            scenarios (int, optional): the number of generated scenarios. Defaults to SWEEP_SCENARIOS.
+            doctors (int, optional): the number of doctors of the generated update. Defaults to SWEEP_DOCTORS.
+            requests (int, optional): the number of requests of the generated update. Defaults to SWEEP_REQUESTS.
+            seed (int, optional): the seed of the generated update and scenarios. Defaults to SWEEP_SEED.
+        """
+
+        self._scenarios = scenarios
+        self._doctors = doctors
+        self._requests = requests
+        self._seed = seed
+
+
+    def create_scenarios(self, generator, doctors, requests):
+        """
+        Generates the scenarios of the sweep, each one removing and adding doctors and requests or moving the closing
+        time of the hospital.
+
+        Args:
+            generator (random.Random): the seeded generator of the scenarios.
+            doctors (list): the lines of content of the doctors file of the baseline update.
+            requests (list): the lines of content of the requests file of the baseline update.
+
+        Returns:
+            list: the delta of each scenario from the baseline update.
+        """
+
+        doctor_names = [line.split(", ")[0] for line in doctors]
+        mother_names = [line.split(", ")[0] for line in requests]
+        scenarios = []
+
+        for i in range(self._scenarios):
+            scenario = {"remove_doctors": generator.sample(doctor_names, generator.randrange(0, 4)),
+                        "add_doctors": [f"Extra Doctor {i:04d}{j}, {generator.choice('123')}, 12h00, 0, 0h00"
+                                        for j in range(generator.randrange(0, 3))],
+                        "remove_requests": generator.sample(mother_names, generator.randrange(0, 4)),
+                        "add_requests": [f"Extra Mother {i:04d}{j}, 30, {generator.choice(('green', 'red'))}, "
+                                         f"{generator.choice(('low', 'high'))}" for j in range(generator.randrange(0, 6))]}
+
+            if generator.random() < 0.2:
+                scenario["policy_overrides"] = {"closing_time": generator.choice(("18h00", "19h00", "21h00"))}
+
+            scenarios.append(scenario)
+
+        return scenarios
+
+
+    def time_fresh(self, input_files, scenarios):
+        """
+        Measures the time to plan scenarios with a fresh process for each one.
+
+        Args:
+            input_files (tuple): the doctors, schedule and requests files of the baseline update.
+            scenarios (list): the scenarios to plan.
+
+        Returns:
+            float: the planning time, in seconds.
+        """
+
+        from multiprocessing import get_context
+        from time import perf_counter
+
+        context = get_context("spawn")
+        start = perf_counter()
+
+        for scenario in scenarios:
+            with ScenarioPool(*input_files, processes = 1, context = context) as pool:
+                pool.sweep([scenario])
+
+        return perf_counter() - start
+
+
+    def time_warm(self, input_files, scenarios, processes):
+        """
+        Measures the time to start a warm ScenarioPool and plan every scenario with it.
+
+        Args:
+            input_files (tuple): the doctors, schedule and requests files of the baseline update.
+            scenarios (list): the scenarios to plan.
+            processes (int): the number of worker processes.
+
+        Returns:
+            tuple:
+                - elapsed (float): the planning time, pool start included, in seconds.
+                - summaries (list): the summary metrics of each scenario.
+        """
+
+        from time import perf_counter
+
+        start = perf_counter()
+
+        with ScenarioPool(*input_files, processes = processes) as pool:
+            summaries = pool.sweep(scenarios)
+
+        return perf_counter() - start, summaries
+
+
+    def time_planning(self, input_files, scenarios):
+        """
+        Measures the time to plan every scenario in the current process, from baseline collections already parsed.
+
+        Args:
+            input_files (tuple): the doctors, schedule and requests files of the baseline update.
+            scenarios (list): the scenarios to plan.
+
+        Returns:
+            tuple:
+                - elapsed (float): the planning time, in seconds.
+                - summaries (list): the summary metrics of each scenario.
+        """
+
+        from time import perf_counter
+
+        ScenarioPool.load_files(input_files)
+
+        start = perf_counter()
+        summaries = [ScenarioPool.plan_scenario(scenario) for scenario in scenarios]
+        elapsed = perf_counter() - start
+
+        return elapsed, summaries
+
+
+    def create_report(self):
+        """
+        Plans the generated scenarios with fresh processes, with a warm ScenarioPool and in the current process, and
+        compares their throughputs.
+
+        Returns:
+            tuple:
+                - lines (list): the lines of the report.
+                - on_target (bool): True if the warm pool returns the same summaries as the planning in the current
+                                    process and reaches SWEEP_EFFICIENCY_TARGET of its throughput on each worker
+                                    process, False otherwise.
+        """
+
+        from os import cpu_count
+        from random import Random
+        from tempfile import TemporaryDirectory
+
+        generator = Random(self._seed)
+        differential = DifferentialBenchmark(1, self._doctors, self._requests, self._seed)
+        processes = min(cpu_count() or 1, self._scenarios)
+
+        with TemporaryDirectory() as directory:
+            time, doctors, schedule, requests = differential.create_inputs(generator)
+            input_files = differential.write_inputs(directory, time, doctors, schedule, requests)
+            scenarios = self.create_scenarios(generator, doctors, requests)
+
+            fresh_scenarios = scenarios[:SWEEP_FRESH_SCENARIOS]
+            fresh_time = self.time_fresh(input_files, fresh_scenarios)
+            warm_time, warm_summaries = self.time_warm(input_files, scenarios, processes)
+            planning_time, planning_summaries = self.time_planning(input_files, scenarios)
+
+        fresh_rate = len(fresh_scenarios) / fresh_time
+        warm_rate = len(scenarios) / warm_time
+        planning_rate = len(scenarios) / planning_time
+        efficiency = warm_rate / (planning_rate * processes)
+
+        lines = [f"{len(scenarios)} scenarios of {self._doctors} doctors and {self._requests} requests",
+                 f"Fresh process per scenario: {fresh_rate:,.1f} scenarios/s",
+                 f"Warm pool of {processes} process{'es' if processes > 1 else ''}: {warm_rate:,.1f} scenarios/s "
+                 f"({warm_rate / fresh_rate:.1f}x), {efficiency:.0%} of the planning throughput per process",
+                 f"Planning alone: {planning_rate:,.1f} scenarios/s"]
+
+        identical = warm_summaries == planning_summaries
+
+        if not identical:
+            lines.append("Warm pool summaries differ from the planning in the current process")
+
+        return lines, identical and efficiency >= SWEEP_EFFICIENCY_TARGET
@@ -0,0 +1,198 @@
+#-*- coding: utf-8 -*-
+
+
+from classes.DataManager import DataManager
+
+from constants import TICK_ARCHIVE_INDEX_EXTENSION, COMPRESSION_EXTENSIONS
+
+
+class TickArchive:
+    """
+    A class to represent an archive that packs the files of many ticks, such as those of a whole day, into a single
+    compressed container, with an index of the byte offset of each file for random access to a single tick.
+
+    Note:
+        Each file is compressed on its own, as a complete gzip, bz2 or xz stream appended to the container, so that
+        reading a file only seeks to its offset and decompresses its own stream. The index, in a file with the same
+        name followed by TICK_ARCHIVE_INDEX_EXTENSION, has a line with the name, byte offset and length of each file,
+        in the order they were packed. Packing a file with the name of a file already in the archive replaces it in the
+        index, so that a day can be packed again tick by tick.
+    """
+
+    def __init__(self, file_name, compression = ".gz"):
+        """
+        Initializes a new TickArchive.
+
+        Args:
+            file_name (str): the name of the container, by convention with the TICK_ARCHIVE_EXTENSION extension.
+            compression (str, optional): the extension of the compression of the files packed, one of
+                                         COMPRESSION_EXTENSIONS. Defaults to ".gz".
+
+        Raises:
+            ValueError: if the compression is not one of COMPRESSION_EXTENSIONS.
+        """
+
+        if compression not in COMPRESSION_EXTENSIONS:
+            raise ValueError(f"Compression error: unknown compression extension '{compression}'.")
+
+        self._file_name = file_name
+        self._compression = COMPRESSION_EXTENSIONS[compression]
+
+
+    def get_file_name(self):
+        """
+        The name of the container of the current TickArchive instance.
+
+        Returns:
+            str: the name of the container.
+        """
+
+        return self._file_name
+
+
+    def get_index_file_name(self):
+        """
+        The name of the index file of the current TickArchive instance.
+
+        Returns:
+            str: the name of the index file.
+        """
+
+        return "".join((self.get_file_name(), TICK_ARCHIVE_INDEX_EXTENSION))
+
+
+    def get_index(self):
+        """
+        The index of the files of the current TickArchive instance.
+
+        Returns:
+            dict: the byte offset and length of the compressed stream of each file, as tuples, by file name, in the
+                  order they were packed.
+        """
+
+        from os.path import exists
+
+        index = {}
+
+        if exists(self.get_index_file_name()):
+            with open(self.get_index_file_name(), "r", encoding = "utf-8") as in_file:
+                for line in in_file:
+                    file_name, offset, length = line.rstrip("\n").rsplit(", ", 2)
+                    index.pop(file_name, None)
+                    index[file_name] = (int(offset), int(length))
+
+        return index
+
+
+    def compress(self, content):
+        """
+        Compresses the content of a file with the compression of the current TickArchive instance.
+
+        Args:
+            content (bytes): the content of the file.
+
+        Returns:
+            bytes: the complete compressed stream of the content.
+        """
+
+        from importlib import import_module
+
+        if self._compression == "gzip":
+            from gzip import compress
+            return compress(content, mtime = 0)
+
+        return import_module(self._compression).compress(content)
+
+
+    def pack(self, file_names):
+        """
+        Appends files to the container of the current TickArchive instance, each one under the name of the file
+        without its directory and without the extension of its compression, if it is compressed.
+
+        Args:
+            file_names (list): the names of the files to pack, compressed or not.
+
+        Returns:
+            int: the number of files packed.
+        """
+
+        from os import fsync
+        from os.path import basename, splitext
+
+        entries = []
+
+        with open(self.get_file_name(), "ab") as out_file:
+            offset = out_file.seek(0, 2)
+
+            for file_name in file_names:
+                with DataManager(file_name).open_file() as in_file:
+                    stream = self.compress(in_file.read().encode("utf-8"))
+
+                name = basename(file_name)
+
+                if DataManager.detect_compression(name):
+                    name = splitext(name)[0]
+
+                out_file.write(stream)
+                entries.append((name, offset, len(stream)))
+                offset += len(stream)
+
+            out_file.flush()
+            fsync(out_file.fileno())
+
+        with open(self.get_index_file_name(), "a", encoding = "utf-8") as out_file:
+            for name, offset, length in entries:
+                out_file.write(f"{name}, {offset}, {length}\n")
+
+        return len(entries)
+
+
+    def read(self, file_name, index = None):
+        """
+        Reads a single file of the current TickArchive instance, decompressing its stream only.
+
+        Args:
+            file_name (str): the name of the file in the archive.
+            index (dict, optional): the index of the archive, as returned by the get_index() method, when many files
+                                    are read. Defaults to None, which reads the index.
+
+        Returns:
+            str: the content of the file.
+
+        Raises:
+            KeyError: if the archive has no file with the given name.
+        """
+
+        from importlib import import_module
+
+        index = index if index is not None else self.get_index()
+
+        if file_name not in index:
+            raise KeyError(f"Archive error: no file '{file_name}' in the archive '{self.get_file_name()}'.")
+
+        offset, length = index[file_name]
+
+        with open(self.get_file_name(), "rb") as in_file:
+            in_file.seek(offset)
+            stream = in_file.read(length)
+
+        compression = DataManager.detect_compression("", stream) or self._compression
+
+        return import_module(compression).decompress(stream).decode("utf-8")
+
+
+    def read_files(self, file_names):
+        """
+        Reads files of the current TickArchive instance, so that they can be read from memory by the collections of
+        the birth-plan-manager tool, through the set_file_contents() method of the DataManager class.
+
+        Args:
+            file_names (list): the names of the files in the archive.
+
+        Returns:
+            dict: the content of each file, by file name.
+        """
+
+        index = self.get_index()
+
+        return {file_name: self.read(file_name, index) for file_name in file_names}
@@ -3,7 +3,7 @@
 
 from datetime import timedelta
 
-from constants import CLOSING_TIME, OPENING_TIME
+from classes.PlanningPolicy import PlanningPolicy
 
 
 class Time:
@@ -192,6 +192,17 @@ class Time:
         return int(self.get_time_string().split("h")[1])
     
 
+    def convert_time_to_minutes(self):
+        """
+        Uses the hours and minutes attributes of the current Time instance to retrieve its total number of minutes.
+
+        Returns:
+            int: the total number of minutes of the current Time instance.
+        """
+
+        return self.get_hours() * 60 + self.get_minutes()
+
+
     def convert_time_to_string(self):
         """
         Uses the hours and minutes attributes of the current Time instance to set its time_string attribute.
@@ -228,47 +239,71 @@ class Time:
         self.convert_time_to_string()
 
 
-    def min_operating_time_check(self):
+    def add_minutes(self, minutes):
+        """
+        Updates the attributes of the current Time instance after incrementing it with a given number of minutes.
+
+        Args:
+            minutes (int): the number of minutes to add.
+        """
+
+        self.set_time_delta(self.get_time_delta() + timedelta(minutes=minutes))
+        self.convert_time_delta_to_time()
+        self.convert_time_to_string()
+
+
+    def min_operating_time_check(self, policy = None):
         """
         Checks whether the current Time instance occurs after the hospital's opening time.
 
+        Args:
+            policy (PlanningPolicy, optional): the rules of the hospital. Defaults to the default PlanningPolicy.
+
         Returns:
             bool:
                 - True if the current Time instance occurs after the hospital's opening time.
                 - False otherwise.
         """
 
-        opening_time = Time(OPENING_TIME).get_time_delta()
+        policy = policy if policy else PlanningPolicy.default()
 
-        return self.get_time_delta() > opening_time
+        return self.convert_time_to_minutes() > policy.get_opening_minutes()
 
 
-    def max_operating_time_check(self):
+    def max_operating_time_check(self, policy = None):
         """
         Checks whether the current Time instance occurs before the hospital's closing time.
 
+        Args:
+            policy (PlanningPolicy, optional): the rules of the hospital. Defaults to the default PlanningPolicy.
+
         Returns:
             bool:
                 - True if the current Time instance occurs before the hospital's closing time.
                 - False otherwise.
         """
 
-        closing_time = Time(CLOSING_TIME).get_time_delta() 
+        policy = policy if policy else PlanningPolicy.default()
 
-        return self.get_time_delta() < closing_time 
+        return self.convert_time_to_minutes() < policy.get_closing_minutes()
 
 
-    def within_operating_time(self):
+    def within_operating_time(self, policy = None):
         """
         Checks whether the current Time instance occurs within the hospital's operating time.
 
+        Args:
+            policy (PlanningPolicy, optional): the rules of the hospital. Defaults to the default PlanningPolicy.
+
         Returns:
             bool:
                 - True if the current Time instance occurs within the hospital's operating time.
                 - False otherwise.
         """
 
-        return (self.min_operating_time_check() and self.max_operating_time_check())
+        policy = policy if policy else PlanningPolicy.default()
+
+        return policy.within_operating_time(self.convert_time_to_minutes())
 
 
     def __lt__(self, other_time):
@@ -0,0 +1,158 @@
+#-*- coding: utf-8 -*-
+
+
+from bisect import bisect_left, bisect_right
+
+
+class TimelineIndex:
+    """
+    A class to represent an interval index over the assistances of a schedule, kept in sorted arrays by start time,
+    both for the whole schedule and for each doctor.
+
+    Note:
+        Times are indexed as minutes since midnight, and each assistance lasts the assistance duration of the planning
+        policy from its start. The index is built at once from the assistances of a schedule, sorting them in
+        O(n log n), and is not modified afterwards, so that each query is a binary search in O(log n).
+    """
+
+    def __init__(self, assistances, duration):
+        """
+        Initializes a new TimelineIndex.
+
+        Args:
+            assistances (list): the Assistance objects to index, each one indexed only by start time if it has no
+                                doctor associated to it.
+            duration (int): the duration of each assistance, in minutes, such as the assistance minutes of the
+                            PlanningPolicy.
+        """
+
+        self._duration = duration
+        self._starts = []
+        self._assistances = []
+        self._doctor_starts = {}
+        self._doctor_assistances = {}
+
+        for start, assistance in sorted(((assistance.get_time().convert_time_to_minutes(), assistance)
+                                         for assistance in assistances), key = lambda entry: entry[0]):
+            self._starts.append(start)
+            self._assistances.append(assistance)
+
+            if assistance.get_doctor():
+                name = assistance.get_doctor().get_name()
+                self._doctor_starts.setdefault(name, []).append(start)
+                self._doctor_assistances.setdefault(name, []).append(assistance)
+
+
+    def get_duration(self):
+        """
+        The duration of each assistance of the current TimelineIndex instance.
+
+        Returns:
+            int: the duration of each assistance, in minutes.
+        """
+
+        return self._duration
+
+
+    def assistances_between(self, start, end, name = None):
+        """
+        The assistances of the current TimelineIndex instance that overlap a time range.
+
+        Args:
+            start (int): the start of the range, in minutes.
+            end (int): the end of the range, in minutes (exclusive).
+            name (str, optional): the name of the doctor whose assistances are searched. Defaults to None, which
+                                  searches every assistance.
+
+        Returns:
+            list: the Assistance objects overlapping the range, sorted by start time.
+        """
+
+        if name is None:
+            starts, assistances = self._starts, self._assistances
+        else:
+            starts, assistances = self._doctor_starts.get(name, []), self._doctor_assistances.get(name, [])
+
+        first = bisect_right(starts, start - self.get_duration())
+        last = bisect_left(starts, end)
+
+        return assistances[first:last]
+
+
+    def conflicts(self, name):
+        """
+        The pairs of assistances of a doctor whose time ranges overlap.
+
+        Args:
+            name (str): the name of the doctor.
+
+        Returns:
+            list: the pairs of overlapping Assistance objects, sorted by the start time of the first one.
+        """
+
+        starts = self._doctor_starts.get(name, [])
+        assistances = self._doctor_assistances.get(name, [])
+        pairs = []
+
+        for i, start in enumerate(starts):
+            last = bisect_left(starts, start + self.get_duration(), i + 1)
+
+            for j in range(i + 1, last):
+                pairs.append((assistances[i], assistances[j]))
+
+        return pairs
+
+
+    def conflict_check(self, name, start):
+        """
+        Checks whether an assistance of a doctor starting at a given time would overlap the doctor's assistances.
+
+        Args:
+            name (str): the name of the doctor.
+            start (int): the start of the assistance, in minutes.
+
+        Returns:
+            bool:
+                - True if the assistance would overlap an assistance of the doctor.
+                - False otherwise.
+        """
+
+        starts = self._doctor_starts.get(name, [])
+        position = bisect_right(starts, start - self.get_duration())
+
+        return position < len(starts) and starts[position] < start + self.get_duration()
+
+
+    def next_free_slot(self, name, after):
+        """
+        The earliest time, at or after a given time, at which a doctor can start an assistance without overlapping
+        the doctor's assistances.
+
+        Args:
+            name (str): the name of the doctor.
+            after (int): the earliest start of the assistance, in minutes.
+
+        Returns:
+            int: the start of the earliest free slot, in minutes.
+        """
+
+        starts = self._doctor_starts.get(name, [])
+        slot = after
+        position = bisect_right(starts, slot - self.get_duration())
+
+        while position < len(starts) and starts[position] < slot + self.get_duration():
+            slot = max(slot, starts[position] + self.get_duration())
+            position += 1
+
+        return slot
+
+
+    def __len__(self):
+        """
+        The number of assistances of the current TimelineIndex instance.
+
+        Returns:
+            int: the number of indexed assistances.
+        """
+
+        return len(self._starts)
@@ -0,0 +1,217 @@
+#-*- coding: utf-8 -*-
+
+
+from classes.Time import Time
+from classes.DataManager import DataManager
+from classes.PlanningObserver import PlanningObserver
+from classes.PlanningPolicy import PlanningPolicy
+
+from constants import UTILIZATION_BUCKETS, WORKLOAD_FILE_SCOPE
+
+
+class WorkloadReport(DataManager, PlanningObserver):
+    """
+    A class to represent the workload of the doctors at the next update of the birth-plan-manager tool, updated
+    incrementally with the events of the planning of the next schedule.
+    """
+
+    def __init__(self, doctors_collection, policy = None):
+        """
+        Initializes a new WorkloadReport.
+
+        Args:
+            doctors_collection (DoctorsCollection): the collection of doctors at the current update of the
+                                                    birth-plan-manager tool.
+            policy (PlanningPolicy, optional): the rules of the hospital. Defaults to the default PlanningPolicy.
+
+        Note:
+            The header of the report is the header of the doctors collection at the next update, with the workload
+            scope.
+        """
+
+        self._policy = policy if policy else PlanningPolicy.default()
+
+        header = doctors_collection.create_header(self._policy)
+        header.set_scope(WORKLOAD_FILE_SCOPE)
+
+        super().__init__("".join((WORKLOAD_FILE_SCOPE.lower(), header.get_time())), header)
+
+        self._workload = {}
+        self._queue_depth = {}
+        self._redirects = 0
+
+        for doctor in doctors_collection.doctors_items():
+            self._workload[doctor.get_name()] = [doctor.get_category(), int(doctor.get_minutes_today()),
+                                                 Time(doctor.get_weekly_time()).convert_time_to_minutes(), 0]
+
+
+    def get_workload(self, name):
+        """
+        The workload of a doctor in the current WorkloadReport instance.
+
+        Args:
+            name (str): the name of the doctor.
+
+        Returns:
+            tuple: the category, the accumulated minutes in the day, the accumulated minutes in the week and the number
+                   of assistances assigned at the next update of the doctor, or None if the doctor is not in the report.
+        """
+
+        workload = self._workload.get(name)
+
+        return tuple(workload) if workload else None
+
+
+    def get_queue_depth(self, category):
+        """
+        The number of assistances in the next schedule for the doctors of a given category.
+
+        Args:
+            category (str): the category of the doctors.
+
+        Returns:
+            int: the number of assistances in the next schedule carried out by doctors of the given category.
+        """
+
+        return self._queue_depth.get(category, 0)
+
+
+    def get_redirects(self):
+        """
+        The number of requests redirected to another hospital network at the next update.
+
+        Returns:
+            int: the number of redirected requests.
+        """
+
+        return self._redirects
+
+
+    def add_to_queue(self, name):
+        """
+        Adds an assistance of a given doctor to the queue of the doctor's category.
+
+        Args:
+            name (str): the name of the doctor carrying out the assistance.
+        """
+
+        workload = self._workload.get(name)
+
+        if workload:
+            self._queue_depth[workload[0]] = self._queue_depth.get(workload[0], 0) + 1
+
+
+    def record_assistance(self, assistance, doctor):
+        """
+        Updates the workload of the doctor to whom an assistance has been assigned.
+
+        Args:
+            assistance (Assistance): the newly assigned assistance.
+            doctor (Doctor): the doctor carrying out the assistance, with its working time already updated.
+        """
+
+        workload = self._workload[doctor.get_name()]
+        workload[1] = int(doctor.get_minutes_today())
+        workload[2] = Time(doctor.get_weekly_time()).convert_time_to_minutes()
+        workload[3] += 1
+
+        self.add_to_queue(doctor.get_name())
+
+
+    def record_redirect(self, assistance):
+        """
+        Counts a request redirected to another hospital network.
+
+        Args:
+            assistance (Assistance): the redirected assistance.
+        """
+
+        self._redirects += 1
+
+
+    def record_pending(self, assistance):
+        """
+        Adds an assistance carried over to the next schedule to the queue of its doctor's category. A redirected
+        assistance carried over has no doctor and is not queued.
+
+        Args:
+            assistance (Assistance): the assistance that is yet to be carried out.
+        """
+
+        if assistance.get_doctor():
+            self.add_to_queue(assistance.get_doctor().get_name())
+
+
+    def create_utilization_histogram(self):
+        """
+        Creates the distribution of the weekly utilization of the doctors in the current WorkloadReport instance, as
+        the share of the maximum weekly working time accumulated by each doctor.
+
+        Returns:
+            list: the number of doctors in each of the UTILIZATION_BUCKETS equal-width buckets, from the lowest to the
+                  highest utilization, with the doctors over the maximum weekly working time in the last bucket.
+        """
+
+        max_weekly_minutes = self._policy.get_weekly_minutes()
+        histogram = [0] * UTILIZATION_BUCKETS
+
+        for _, _, weekly_minutes, _ in self._workload.values():
+            bucket = min(weekly_minutes * UTILIZATION_BUCKETS // max_weekly_minutes, UTILIZATION_BUCKETS - 1)
+            histogram[bucket] += 1
+
+        return histogram
+
+
+    def __str__(self):
+        """
+        The string representation of the current WorkloadReport instance.
+
+        Each doctor line shows the name, category, accumulated minutes in the day, minutes left before the daily break,
+        accumulated time in the week, minutes left before the maximum weekly working time and number of assistances
+        assigned at the next update of a doctor.
+
+        Returns:
+            str: the current WorkloadReport instance as a string.
+
+        Example:
+            >>> str(workloadreport)
+            "Filename:
+             workload10h30
+             Organization:
+             SmartMaternityCare
+             Time:
+             10h30
+             Date:
+             10:12:2023
+             Workload:
+             Andrew Davies, 1, 180, 60, 28h00, 720, 0
+             Brian Cooper, 3, 100, 140, 7h40, 1940, 1
+             utilization 0%-25%, 1
+             utilization 25%-50%, 0
+             utilization 50%-75%, 1
+             utilization 75%-100%, 0
+             queue category 1, 1
+             queue category 3, 1
+             redirected, 0"
+        """
+
+        max_weekly_minutes = self._policy.get_weekly_minutes()
+        lines = []
+
+        for name, (category, minutes_today, weekly_minutes, assistances) in self._workload.items():
+            weekly_time = Time(hours = weekly_minutes // 60, minutes = weekly_minutes % 60)
+            weekly_time.convert_time_to_string()
+
+            lines.append(f"{name}, {category}, {minutes_today}, {max(self._policy.get_max_daily_minutes() - minutes_today, 0)}, "
+                         f"{weekly_time}, {max(max_weekly_minutes - weekly_minutes, 0)}, {assistances}")
+
+        for bucket, count in enumerate(self.create_utilization_histogram()):
+            lines.append(f"utilization {bucket * 100 // UTILIZATION_BUCKETS}%-"
+                         f"{(bucket + 1) * 100 // UTILIZATION_BUCKETS}%, {count}")
+
+        for category in sorted(self._queue_depth):
+            lines.append(f"queue category {category}, {self._queue_depth[category]}")
+
+        lines.append(f"redirected, {self.get_redirects()}")
+
+        return super().__str__() + '\n' + '\n'.join(lines)
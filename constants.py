@@ -23,6 +23,12 @@ MAX_WORK_TIME = '40h00'
 # Value when a request is redirected to another hospital network
 REDIRECTED_REQUEST = 'redirected to other network'
 
+# Value when a request is merged with an earlier request for the same mother
+MERGED_REQUEST = 'merged with previous request'
+
+# Value when a request is rejected because the mother is already on the schedule
+SCHEDULED_REQUEST = 'already on schedule'
+
 # Value for the closing time of the hospital
 CLOSING_TIME = '20h00'
 
@@ -42,6 +48,76 @@ SCHEDULE_FILE_INDEX = 2
 REQUESTS_FILE_INDEX = 3
 
 
+# Constants related to command line options
+
+# Option to write the workload report of the doctors
+REPORT_OPTION = 'report'
+
+# Option to profile the tick
+PROFILE_OPTION = 'profile'
+
+# Environment variable that profiles the tick when set to a non-empty value
+PROFILE_VARIABLE = 'BIRTH_PLAN_PROFILE'
+
+# Option with the journal file to which the changes of the tick are appended
+JOURNAL_OPTION = 'journal'
+
+# Option with the date and time, separated by a comma, of a journaled tick whose output files are recovered
+RECOVER_OPTION = 'recover'
+
+# Option to also write the content digest of each output file
+DIGEST_OPTION = 'digest'
+
+# Option that overrides the closing time of the hospital
+CLOSING_TIME_OPTION = 'closing-time'
+
+# Option that overrides the duration of each assistance
+ASSISTANCE_DURATION_OPTION = 'assistance-duration'
+
+# Option that overrides the maximum working time in a week
+MAX_WORK_TIME_OPTION = 'max-work-time'
+
+# Option to read the input files from stdin and write the output files to stdout, as bundles of frames
+PIPE_OPTION = 'pipe'
+
+# Option with the number of consecutive updates planned, each one from the output files of the one before
+TICKS_OPTION = 'ticks'
+
+# Option to plan a network of hospitals, given as consecutive doctors, schedule and requests files of each hospital,
+# with an optional number of processes planning them in parallel
+NETWORK_OPTION = 'network'
+
+# Option to assign the requests of each update all at once, as a minimum cost assignment
+BATCH_OPTION = 'batch'
+
+# Option with the forecast file of the requests of the next updates, for the lookahead of the planning
+FORECAST_OPTION = 'forecast'
+
+# Option with the number of updates of the horizon of the lookahead
+LOOKAHEAD_OPTION = 'lookahead'
+
+# Option to account for the memory allocated by each phase of the planning, with an optional budget in MiB
+MEMORY_OPTION = 'memory'
+
+# Option with the extension of the compression of the output files, such as gz, bz2 or xz
+COMPRESS_OPTION = 'compress'
+
+# Option with the tick archive into which the given files are packed
+PACK_OPTION = 'pack'
+
+# Option with the tick archive from which the input files are read
+ARCHIVE_OPTION = 'archive'
+
+# Option with the directory watched for requests files, each one planned as soon as it is complete
+WATCH_OPTION = 'watch'
+
+# Option to also write the delta file of each update, with only the changes from the update before
+DELTA_OPTION = 'delta'
+
+# Option with the port of the local query service on the updates planned, any free port if there is none
+SERVE_OPTION = 'serve'
+
+
 # Constants related to the headers of files
 
 # Scope of the doctors file
@@ -53,11 +129,169 @@ SCHEDULE_FILE_SCOPE = 'Schedule'
 # Scope of the requests file
 REQUESTS_FILE_SCOPE = 'Mothers'
 
+# Prefix of the name of the requests files, which is not their scope in lower case as for the other files
+REQUESTS_FILE_PREFIX = 'requests'
+
+# Scope of the forecast file
+FORECAST_FILE_SCOPE = 'Forecast'
+
+# Scope of the workload report file
+WORKLOAD_FILE_SCOPE = 'Workload'
+
+# Scope of the profiling files
+PROFILE_FILE_SCOPE = 'Profile'
+
+# Scope of the delta file
+DELTA_FILE_SCOPE = 'Delta'
+
 # Number of header's lines
 NUM_HEADER_LINES = 7
 
+# Extension appended to the name of an output file for the file with its content digest
+DIGEST_EXTENSION = '.digest'
+
 
 # Constants related to doctors
 
 # Minimum required category for a doctor to be assigned to a high risk assistance
-MIN_CATEG = 2
\ No newline at end of file
+MIN_CATEG = 2
+
+# Maximum number of daily work minutes before a doctor has to take the daily break
+MAX_DAILY_MINUTES = 240
+
+
+# Constants related to the planning policy
+
+# Overrides of the planning rules for each organization, as keyword arguments of the PlanningPolicy class by the name
+# of the organization in the headers of its files, such as {'SmartMaternityCare': {'closing_time': '19h00'}}
+POLICY_OVERRIDES = {}
+
+
+# Constants related to the lookahead
+
+# Number of updates of the horizon of the lookahead
+LOOKAHEAD_TICKS = 4
+
+
+# Constants related to reports
+
+# Number of equal-width buckets of the weekly utilization histogram in the workload report
+UTILIZATION_BUCKETS = 4
+
+
+# Constants related to the journal
+
+# Number of ticks between full snapshots in the journal
+JOURNAL_SNAPSHOT_INTERVAL = 8
+
+# Extension appended to the name of the journal file for its index
+JOURNAL_INDEX_EXTENSION = '.index'
+
+
+# Constants related to the memory accounting
+
+# Number of frames stored in the traceback of each traced memory allocation
+MEMORY_TRACE_FRAMES = 16
+
+# Number of modules with the largest net allocations reported for each phase
+MEMORY_REPORT_MODULES = 3
+
+
+# Constants related to the compressed files
+
+# Compression module of each extension of the compressed files
+COMPRESSION_EXTENSIONS = {'.gz': 'gzip', '.bz2': 'bz2', '.xz': 'lzma', '.lzma': 'lzma'}
+
+# Compression module of the first bytes of the content of each kind of compressed files
+COMPRESSION_MAGIC_NUMBERS = {b'\x1f\x8b': 'gzip', b'BZh': 'bz2', b'\xfd7zXZ\x00': 'lzma'}
+
+# Size in bytes of the buffers of the compressed files, so that they are decompressed in large blocks
+COMPRESSION_BUFFER_SIZE = 1024 * 1024
+
+# Extension of the tick archives, which pack the files of many ticks into a single compressed container
+TICK_ARCHIVE_EXTENSION = '.ticks'
+
+# Extension appended to the name of a tick archive for its index
+TICK_ARCHIVE_INDEX_EXTENSION = '.index'
+
+
+# Constants related to the directory watcher
+
+# Time, in seconds, between two polls of the watched directory
+WATCH_POLL_INTERVAL = 0.02
+
+
+# Constants related to the query service
+
+# Host of the query service, so that it is only reachable from the local machine
+SERVE_HOST = '127.0.0.1'
+
+
+# Constants related to the output files
+
+# Maximum number of output files waiting to be written by the background writer
+OUTPUT_QUEUE_SIZE = 8
+
+
+# Constants related to benchmarks
+
+# Number of times each startup measurement is repeated
+STARTUP_BENCHMARK_RUNS = 10
+
+# Maximum time, in seconds, for importing the main module
+IMPORT_TIME_BUDGET = 0.005
+
+# Maximum time, in seconds, from the interpreter startup to the output files of a tick
+FIRST_OUTPUT_TIME_BUDGET = 0.03
+
+# Number of lines of content of the files generated by the parsing benchmark
+PARSING_BENCHMARK_ROWS = 100000
+
+# Minimum ratio between the rows per second parsed in bulk into typed records and by the collections, below the 5x
+# first aimed at, since splitting the fields of a doctors file already takes a third of the line-by-line time
+PARSING_SPEEDUP_TARGET = 2.5
+
+# Number of randomized updates planned by the differential benchmark
+DIFFERENTIAL_CASES = 5
+
+# Number of doctors of each update of the differential benchmark
+DIFFERENTIAL_DOCTORS = 200
+
+# Number of requests of each update of the differential benchmark
+DIFFERENTIAL_REQUESTS = 1000
+
+# Seed of the randomized updates of the differential benchmark
+DIFFERENTIAL_SEED = 2023
+
+# Minimum ratio between the planning times of the reference planner and of the planner of the differential benchmark
+DIFFERENTIAL_SPEEDUP_TARGET = 1
+
+# Number of requests booked by the concurrency benchmark
+CONCURRENCY_REQUESTS = 2000
+
+# Number of doctors of the concurrency benchmark
+CONCURRENCY_DOCTORS = 100
+
+# Largest number of submitter threads of the concurrency benchmark
+CONCURRENCY_SUBMITTERS = 8
+
+# Seed of the doctors and requests of the concurrency benchmark
+CONCURRENCY_SEED = 2023
+
+# Number of scenarios planned by the sweep benchmark
+SWEEP_SCENARIOS = 50
+
+# Number of doctors of the update of the sweep benchmark
+SWEEP_DOCTORS = 30
+
+# Number of requests of the update of the sweep benchmark
+SWEEP_REQUESTS = 60
+
+# Seed of the update and scenarios of the sweep benchmark
+SWEEP_SEED = 2023
+
+# Number of scenarios planned with a fresh process for each one by the sweep benchmark
+SWEEP_FRESH_SCENARIOS = 10
+
+# Minimum ratio between the throughput of each process of a warm scenario pool and the throughput of the planning alone
+SWEEP_EFFICIENCY_TARGET = 0.8
@@ -1,58 +1,606 @@
 #-*- coding: utf-8 -*-
 
 
-from classes.DoctorsCollection import DoctorsCollection
-from classes.MothersCollection import MothersCollection
-from classes.Schedule import Schedule
-from classes.DataManager import DataManager
-from classes.Header import Header
+from sys import argv, exit
 
-from sys import argv
+from constants import DOCTORS_FILE_INDEX, SCHEDULE_FILE_INDEX, REQUESTS_FILE_INDEX, REQUESTS_FILE_SCOPE
+from constants import REPORT_OPTION, PROFILE_OPTION, PROFILE_VARIABLE, JOURNAL_OPTION, RECOVER_OPTION, DIGEST_OPTION
+from constants import CLOSING_TIME_OPTION, ASSISTANCE_DURATION_OPTION, MAX_WORK_TIME_OPTION, PIPE_OPTION
+from constants import TICKS_OPTION, NETWORK_OPTION, BATCH_OPTION, FORECAST_OPTION, LOOKAHEAD_OPTION
+from constants import MEMORY_OPTION, COMPRESS_OPTION, PACK_OPTION, ARCHIVE_OPTION, COMPRESSION_EXTENSIONS
+from constants import WATCH_OPTION, DELTA_OPTION, SERVE_OPTION
+from constants import FORECAST_FILE_SCOPE, REQUESTS_FILE_PREFIX, LOOKAHEAD_TICKS, WATCH_POLL_INTERVAL
 
-from constants import DOCTORS_FILE_INDEX, SCHEDULE_FILE_INDEX, REQUESTS_FILE_INDEX
 
-
-def plan(doctors_file, schedule_file, requests_file):
+def plan(doctors_file, schedule_file, requests_file, report = False, profile = False, journal_file = None,
+         policy_overrides = {}, digest = False, messages = None, outputs = None, ticks = 1, batch = False,
+         forecast_file = None, horizon = LOOKAHEAD_TICKS, memory = False, memory_budget = None, delta = False,
+         service = None):
     """
-    Reads the three input files, assigns doctors to birth assistance requests, according to the criteria defined 
+    Reads the three input files, assigns doctors to birth assistance requests, according to the criteria defined
     in the specification of the birth-plan-manager tool, and writes the two output files.
 
     Args:
         doctors_file (str): the doctors file containing the doctors available for an assistance.
         schedule_file (str): the schedule file containing the planed assistances.
         requests_file (str): the requests file containing the mothers that need an assistance.
+        report (bool, optional): whether the workload report of the doctors is also written. Defaults to False.
+        profile (bool, optional): whether each tick is profiled, with the profiling data of each tick written next to
+                                  its output files. Defaults to False.
+        journal_file (str, optional): the journal file to which the changes of the tick are appended. Defaults to None.
+        policy_overrides (dict, optional): the planning rules that override those of the organization, as keyword
+                                           arguments of the PlanningPolicy class. Defaults to an empty dictionary.
+        digest (bool, optional): whether the content digest of each output file is also written. Defaults to False.
+        messages (file, optional): the text stream to which the errors, inconsistencies and duplicates are printed.
+                                   Defaults to None, which prints them to sys.stdout.
+        outputs (dict, optional): the dictionary to which the name and content of each output file are added, instead
+                                  of writing the output files. Defaults to None, which writes them.
+        ticks (int, optional): the number of consecutive updates planned, each one from the output files of the one
+                               before. Defaults to 1.
+        batch (bool, optional): whether the requests of each update are assigned all at once, as a minimum cost
+                                assignment, instead of one after the other, with the requests assigned by both
+                                assignments printed. Defaults to False.
+        forecast_file (str, optional): the forecast file of the requests of the next updates, whose high risk requests
+                                       are reserved working time of the doctors with the minimum category. Defaults
+                                       to None.
+        horizon (int, optional): the number of updates of the horizon of the forecast. Defaults to LOOKAHEAD_TICKS.
+        memory (bool, optional): whether the memory allocated by each phase of the planning is accounted, with the
+                                 report printed at the end. Defaults to False.
+        memory_budget (int, optional): the highest peak of traced memory allowed in a phase, in bytes, when the
+                                       memory is accounted. Defaults to None, which allows any peak.
+        delta (bool, optional): whether the delta file of each update, with only the changes from the update before,
+                                is also written. Defaults to False.
+        service (QueryService, optional): the query service to which each update is published once planned. Defaults
+                                          to None.
+
+    Returns:
+        bool: False if the memory budget was exceeded, True otherwise.
+
+    Note:
+        The classes of the birth-plan-manager tool are imported when planning starts, so that importing this module
+        has no side effects and does not pay for their import. Every inconsistency between the doctors and schedule
+        files is printed, with its line, before planning.
+        When more than one update is planned, each update is planned from the output collections of the one before,
+        in memory, with the requests file of its time in the directory of requests_file, or no requests if there is
+        none, until ticks updates are planned or an update is no longer within the operating time. The output files
+        are then written by an OutputWriter in the background, while the next update is planned.
     """
-    
+
+    from classes.DoctorsCollection import DoctorsCollection
+    from classes.MothersCollection import MothersCollection
+    from classes.Schedule import Schedule
+    from classes.Registry import Registry
+    from classes.DataManager import DataManager
+    from classes.ConsistencyValidator import ConsistencyValidator
+    from classes.PlanningPolicy import PlanningPolicy
+    from classes.Time import Time
+
     try:
-        for file_position in [DOCTORS_FILE_INDEX, SCHEDULE_FILE_INDEX, REQUESTS_FILE_INDEX]:
-            file_name = argv[file_position]
+        input_files = {DOCTORS_FILE_INDEX: doctors_file, SCHEDULE_FILE_INDEX: schedule_file,
+                       REQUESTS_FILE_INDEX: requests_file}
+
+        for file_position, file_name in input_files.items():
             collection = DataManager(file_name)
-            file_scope = collection.retrieve_file_scope(file_position)
-            
-            actual_header = collection.get_header()
 
-            expected_header_from_file_name = Header(actual_header.get_organization(), actual_header.get_time(), 
-                                                    actual_header.get_date(), file_scope)
-            
             error_message = f"File head error: scope inconsistency between name and header in file '{file_name}'."
-            assert expected_header_from_file_name == actual_header, error_message
-    
+            assert collection.scope_consistency_check(file_position), error_message
+
+        if forecast_file:
+            error_message = f"File head error: scope inconsistency between name and header in file '{forecast_file}'."
+            assert DataManager(forecast_file).get_header().get_scope() == FORECAST_FILE_SCOPE, error_message
+
     except AssertionError as error_message:
-        print(error_message)
-    
+        print(error_message, file = messages)
+
     else:
+        if profile:
+            from classes.Profiler import Profiler
+            profiler = Profiler()
+            profiler.enable()
+
+        if memory:
+            from classes.MemoryAccountant import MemoryAccountant
+            accountant = MemoryAccountant(memory_budget)
+            accountant.start()
+
         doctors_collection = DoctorsCollection(doctors_file)
+        policy = PlanningPolicy.for_organization(doctors_collection.get_header().get_organization(), **policy_overrides)
+
+        for violation in ConsistencyValidator(doctors_file, schedule_file, policy).validate():
+            print(violation, file = messages)
+
         mothers_collection = MothersCollection(requests_file)
-        schedule = Schedule(schedule_file)
-
-        next_schedule, next_doctors = schedule.create_next_schedule(doctors_collection, mothers_collection)
-        next_schedule.set_file_name(schedule.create_file_name())
-        next_schedule.set_header(schedule.create_header())
-        next_schedule.write_file()
-
-        next_doctors_collection = DoctorsCollection(doctors = next_doctors.get_doctors())
-        next_doctors_collection.set_file_name(doctors_collection.create_file_name())
-        next_doctors_collection.set_header(doctors_collection.create_header())
-        next_doctors_collection.write_file()
-        
-plan(argv[DOCTORS_FILE_INDEX], argv[SCHEDULE_FILE_INDEX], argv[REQUESTS_FILE_INDEX])
\ No newline at end of file
+        schedule = Schedule(schedule_file, registry = Registry(doctors_collection))
+
+        mothers_collection.remove_scheduled_mothers(schedule)
+
+        for duplicate in mothers_collection.create_duplicates_report():
+            print(duplicate, file = messages)
+
+        if memory:
+            accountant.record_phase("load")
+
+        writer = None
+        lookahead = None
+
+        if forecast_file:
+            from classes.Lookahead import Lookahead
+            lookahead = Lookahead(forecast_file, horizon = horizon, policy = policy)
+
+        if journal_file:
+            from classes.Journal import Journal
+            journal = Journal(journal_file, policy_overrides = policy_overrides)
+
+        if ticks > 1 and outputs is None:
+            from classes.OutputWriter import OutputWriter
+            writer = OutputWriter()
+
+        try:
+            for tick in range(ticks):
+                observers = []
+
+                if report:
+                    from classes.WorkloadReport import WorkloadReport
+                    workload_report = WorkloadReport(doctors_collection, policy)
+                    observers.append(workload_report)
+
+                if delta:
+                    from classes.DeltaOutput import DeltaOutput
+                    delta_output = DeltaOutput(doctors_collection, policy)
+                    observers.append(delta_output)
+
+                if journal_file:
+                    observers.append(journal)
+
+                if memory:
+                    observers.append(accountant)
+
+                if service:
+                    observers.append(service)
+
+                if batch:
+                    from classes.BatchAssignment import BatchAssignment
+                    next_schedule, next_doctors = schedule.create_batch_schedule(doctors_collection,
+                                                                                 mothers_collection, observers, policy)
+
+                    greedy_schedule, _ = schedule.create_next_schedule(doctors_collection, mothers_collection,
+                                                                       policy = policy)
+                    batch_assigned = BatchAssignment(policy).count_assigned(next_schedule, mothers_collection)
+                    greedy_assigned = BatchAssignment(policy).count_assigned(greedy_schedule, mothers_collection)
+
+                    print(f"Batch assignment: {batch_assigned} of {len(mothers_collection.get_mothers())} requests "
+                          f"assigned, {greedy_assigned} with the greedy assignment "
+                          f"({batch_assigned - greedy_assigned:+d}).", file = messages)
+
+                else:
+                    next_schedule, next_doctors = schedule.create_next_schedule(doctors_collection,
+                                                                                mothers_collection, observers, policy,
+                                                                                lookahead)
+                next_schedule.set_file_name(schedule.create_file_name(policy))
+                next_schedule.set_header(schedule.create_header(policy))
+
+                next_doctors_collection = DoctorsCollection(doctors = next_doctors.get_doctors())
+                next_doctors_collection.set_file_name(doctors_collection.create_file_name(policy))
+                next_doctors_collection.set_header(doctors_collection.create_header(policy))
+
+                output_files = [next_schedule, next_doctors_collection] + ([workload_report] if report else []) + \
+                    ([delta_output] if delta else [])
+
+                for output_file in output_files:
+                    if outputs is not None:
+                        file_name, content = output_file.create_file_content(policy)
+
+                        if file_name:
+                            outputs[file_name] = content
+
+                    elif writer:
+                        writer.submit(output_file, policy, digest)
+
+                    else:
+                        output_file.write_file(policy, digest)
+
+                if journal_file:
+                    journal.commit(next_schedule, next_doctors_collection)
+
+                if service:
+                    service.publish(next_schedule, next_doctors_collection, policy)
+
+                if memory:
+                    accountant.record_phase("write")
+
+                if profile:
+                    profiler.disable()
+                    profiler.write_files(next_schedule)
+
+                next_time = Time(next_doctors_collection.retrieve_next_time(policy))
+
+                if tick + 1 == ticks or not next_time.within_operating_time(policy):
+                    break
+
+                if profile:
+                    profiler = Profiler()
+                    profiler.enable()
+
+                doctors_collection, schedule = next_doctors_collection, next_schedule
+                mothers_collection = create_next_requests(requests_file, next_doctors_collection, policy)
+                mothers_collection.remove_scheduled_mothers(schedule)
+
+                for duplicate in mothers_collection.create_duplicates_report():
+                    print(duplicate, file = messages)
+
+                if memory:
+                    accountant.record_phase("load")
+
+        finally:
+            if writer:
+                writer.close()
+
+        if memory:
+            accountant.stop()
+
+            for line in accountant.create_report():
+                print(line, file = messages)
+
+            return accountant.within_budget_check()
+
+    return True
+
+
+def create_next_requests(requests_file, doctors_collection, policy):
+    """
+    Creates the requests of the update after a given one, read from the requests file of its time in the directory of
+    the requests file of the first update.
+
+    Args:
+        requests_file (str): the requests file of the first update.
+        doctors_collection (DoctorsCollection): the doctors collection of the update, with its header set.
+        policy (PlanningPolicy): the rules of the hospital.
+
+    Returns:
+        MothersCollection: the requests of the update after the given one, with no mothers if there is no requests
+                           file of its time.
+
+    Note:
+        The requests file may also be compressed, with the extension of its compression appended to its name.
+    """
+
+    from classes.MothersCollection import MothersCollection
+    from classes.Header import Header
+    from os.path import dirname, exists, join
+
+    header = doctors_collection.create_header(policy)
+    file_name = join(dirname(requests_file), "".join((REQUESTS_FILE_PREFIX, header.get_time(), ".txt")))
+
+    for extension in [""] + list(COMPRESSION_EXTENSIONS):
+        if exists("".join((file_name, extension))):
+            return MothersCollection("".join((file_name, extension)))
+
+    return MothersCollection(header = Header(header.get_organization(), header.get_time(), header.get_date(),
+                                             REQUESTS_FILE_SCOPE))
+
+
+def pipe(in_stream, out_stream, messages, report = False, policy_overrides = {}):
+    """
+    Reads the three input files as a bundle of frames from a binary stream, assigns doctors to birth assistance
+    requests as the plan() function does, and writes the output files as a bundle of frames to another binary stream,
+    without reading or writing any file on the disk.
+
+    Args:
+        in_stream (file): the binary stream with the frames of the doctors, schedule and requests files, in this
+                          order, such as sys.stdin.buffer.
+        out_stream (file): the binary stream to which the frames of the output files are written, such as
+                           sys.stdout.buffer.
+        messages (file): the text stream to which the errors, inconsistencies and duplicates are printed, such as
+                         sys.stderr.
+        report (bool, optional): whether the workload report of the doctors is also written. Defaults to False.
+        policy_overrides (dict, optional): the planning rules that override those of the organization, as keyword
+                                           arguments of the PlanningPolicy class. Defaults to an empty dictionary.
+
+    Note:
+        The headers of the input files are checked against their positions in the bundle, as the headers of the input
+        files are checked against their positions in the command line.
+    """
+
+    from classes.Bundle import Bundle
+    from classes.DataManager import DataManager
+
+    bundle = Bundle()
+
+    try:
+        input_files = bundle.read(in_stream)
+
+        error_message = f"Bundle error: {len(input_files)} frames instead of 3 (doctors, schedule and requests)."
+        assert len(input_files) == 3, error_message
+
+    except (AssertionError, ValueError) as error_message:
+        print(error_message, file = messages)
+
+    else:
+        outputs = {}
+        DataManager.set_file_contents(input_files)
+
+        try:
+            plan(*input_files, report = report, policy_overrides = policy_overrides, messages = messages,
+                 outputs = outputs)
+        finally:
+            DataManager.set_file_contents({})
+
+        bundle.write(out_stream, outputs)
+
+
+def network(unit_files, processes = None, messages = None, policy_overrides = {}):
+    """
+    Reads the three input files of each hospital of a network, plans the update of the network, routing the requests
+    that a hospital redirects to the other hospitals of the network, and writes the two output files of each hospital
+    in the directory of its doctors file.
+
+    Args:
+        unit_files (list): the doctors, schedule and requests files of each hospital, as tuples.
+        processes (int, optional): the number of processes planning the hospitals in parallel. Defaults to None, which
+                                   uses one process per hospital, up to the number of processors.
+        messages (file, optional): the text stream to which the errors, inconsistencies, duplicates and the number
+                                   of redirected requests kept inside and sent outside the network are printed.
+                                   Defaults to None, which prints them to sys.stdout.
+        policy_overrides (dict, optional): the rules that override those of the organization of every hospital, as
+                                           keyword arguments of the PlanningPolicy class. Defaults to an empty
+                                           dictionary.
+    """
+
+    from classes.ConsistencyValidator import ConsistencyValidator
+    from classes.DoctorsCollection import DoctorsCollection
+    from classes.MothersCollection import MothersCollection
+    from classes.Schedule import Schedule
+    from classes.Registry import Registry
+    from classes.DataManager import DataManager
+    from classes.NetworkPlanner import NetworkPlanner
+    from os.path import dirname, join
+
+    try:
+        for doctors_file, schedule_file, requests_file in unit_files:
+            input_files = {DOCTORS_FILE_INDEX: doctors_file, SCHEDULE_FILE_INDEX: schedule_file,
+                           REQUESTS_FILE_INDEX: requests_file}
+
+            for file_position, file_name in input_files.items():
+                collection = DataManager(file_name)
+
+                error_message = f"File head error: scope inconsistency between name and header in file '{file_name}'."
+                assert collection.scope_consistency_check(file_position), error_message
+
+    except AssertionError as error_message:
+        print(error_message, file = messages)
+
+    else:
+        units = []
+
+        for doctors_file, schedule_file, requests_file in unit_files:
+            doctors_collection = DoctorsCollection(doctors_file)
+            mothers_collection = MothersCollection(requests_file)
+            schedule = Schedule(schedule_file, registry = Registry(doctors_collection))
+
+            mothers_collection.remove_scheduled_mothers(schedule)
+
+            for duplicate in mothers_collection.create_duplicates_report():
+                print(duplicate, file = messages)
+
+            units.append((doctors_collection, schedule, mothers_collection))
+
+        planner = NetworkPlanner(units, processes, policy_overrides)
+
+        for (doctors_file, schedule_file, _), policy in zip(unit_files, planner.get_policies()):
+            for violation in ConsistencyValidator(doctors_file, schedule_file, policy).validate():
+                print(violation, file = messages)
+
+        planned_units = planner.plan()
+
+        for (doctors_file, _, _), output_files, policy in zip(unit_files, planned_units, planner.get_policies()):
+            for output_file in output_files:
+                output_file.set_file_name(join(dirname(doctors_file), output_file.get_file_name()))
+                output_file.write_file(policy)
+
+        kept, sent = planner.count_redirects(planned_units)
+
+        print(f"Network redirects: {kept} requests kept inside the network, {sent} sent outside the network.",
+              file = messages)
+
+
+def watch(directory, report = False, policy_overrides = {}, messages = None, polls = None, service = None):
+    """
+    Watches a directory for requests files and plans the update of each one as soon as it is complete, from the doctors
+    and schedule files of the directory one time increment before its time, writing the output files to the directory,
+    so that they are the doctors and schedule files of the next update.
+
+    Args:
+        directory (str): the watched directory.
+        report (bool, optional): whether the workload report of the doctors is also written. Defaults to False.
+        policy_overrides (dict, optional): the planning rules that override those of the organization, as keyword
+                                           arguments of the PlanningPolicy class. Defaults to an empty dictionary.
+        messages (file, optional): the text stream to which the errors, inconsistencies, duplicates and planned
+                                   updates are printed. Defaults to None, which prints them to sys.stdout.
+        polls (int, optional): the number of polls of the directory. Defaults to None, which watches the directory
+                               until the tool is interrupted.
+        service (QueryService, optional): the query service to which each update is published once planned. Defaults
+                                          to None.
+
+    Note:
+        For each planned update, the time from the last write of its requests file to the last write of its output
+        files is printed. A requests file without its doctors and schedule files is reported once and left pending
+        until they are written to the directory.
+    """
+
+    from classes.DataManager import DataManager
+    from classes.DirectoryWatcher import DirectoryWatcher
+    from os import stat
+    from os.path import basename, join
+    from time import sleep, time_ns
+
+    watcher = DirectoryWatcher(directory, policy_overrides)
+    poll = 0
+
+    try:
+        while polls is None or poll < polls:
+            for requests_file in watcher.poll():
+                doctors_file, schedule_file = watcher.find_inputs(requests_file)
+
+                if not doctors_file or not schedule_file:
+                    if watcher.defer(requests_file):
+                        print(f"Input error: no doctors or schedule file of the update before the requests file "
+                              f"'{requests_file}', pending until they are written.", file = messages)
+                    continue
+
+                watcher.resume(requests_file)
+
+                outputs = {}
+                plan(doctors_file, schedule_file, requests_file, report = report, policy_overrides = policy_overrides,
+                     messages = messages, outputs = outputs, service = service)
+
+                for file_name, content in outputs.items():
+                    DataManager.write_snapshot((join(directory, file_name), content, None))
+
+                latency = (time_ns() - stat(requests_file).st_mtime_ns) / 1e6
+
+                print(f"Watch: '{basename(requests_file)}' planned from '{basename(doctors_file)}' and "
+                      f"'{basename(schedule_file)}', {latency:,.1f} ms after its last write.", file = messages)
+
+            poll += 1
+            sleep(WATCH_POLL_INTERVAL)
+
+    except KeyboardInterrupt:
+        pass
+
+
+def parse_options(args):
+    """
+    Separates the options from the positional arguments of the command line.
+
+    Args:
+        args (list): the command line arguments, in the format of the sys.argv list.
+
+    Returns:
+        tuple:
+            - positional (list): the arguments that are not options, at the same positions as in the sys.argv list
+                                 without options.
+            - options (dict): the value of each option given as --name=value, or True for each option given as --name.
+    """
+
+    positional = []
+    options = {}
+
+    for arg in args:
+        if arg.startswith("--"):
+            name, _, value = arg[2:].partition("=")
+            options[name] = value if value else True
+        else:
+            positional.append(arg)
+
+    return positional, options
+
+
+def parse_policy_overrides(options):
+    """
+    Selects the rules of the hospital given as options of the command line.
+
+    Args:
+        options (dict): the options of the command line, as returned by the parse_options() function.
+
+    Returns:
+        dict: the rules that override those of the organization, as keyword arguments of the PlanningPolicy class.
+    """
+
+    policy_options = {CLOSING_TIME_OPTION: "closing_time", ASSISTANCE_DURATION_OPTION: "assistance_duration",
+                      MAX_WORK_TIME_OPTION: "max_work_time"}
+
+    return {rule: options[option] for option, rule in policy_options.items() if option in options}
+
+
+def main(args):
+    """
+    Runs the birth-plan-manager tool from the command line.
+
+    Args:
+        args (list): the command line arguments, in the format of the sys.argv list.
+
+    Returns:
+        int: the exit status of the tool, 1 if the memory budget was exceeded and 0 otherwise.
+    """
+
+    from os import environ
+    from sys import stdin, stdout, stderr
+
+    positional, options = parse_options(args)
+    compression = options[COMPRESS_OPTION] if options.get(COMPRESS_OPTION, True) is not True else "gz"
+
+    if PACK_OPTION in options:
+        from classes.TickArchive import TickArchive
+        TickArchive(options[PACK_OPTION], "".join((".", compression))).pack(positional[1:])
+        return
+
+    if COMPRESS_OPTION in options:
+        from classes.DataManager import DataManager
+        DataManager.set_compression("".join((".", compression)))
+
+    if ARCHIVE_OPTION in options:
+        from classes.DataManager import DataManager
+        from classes.TickArchive import TickArchive
+        DataManager.set_file_contents(TickArchive(options[ARCHIVE_OPTION]).read_files(positional[1:4]))
+
+    policy_overrides = parse_policy_overrides(options)
+
+    if RECOVER_OPTION in options:
+        from classes.Journal import Journal
+        date, time = options[RECOVER_OPTION].split(",")
+        Journal(options[JOURNAL_OPTION], policy_overrides = policy_overrides).recover(date, time)
+        return
+
+    if NETWORK_OPTION in options:
+        unit_files = [tuple(positional[position:position + 3]) for position in range(1, len(positional), 3)]
+        processes = int(options[NETWORK_OPTION]) if options[NETWORK_OPTION] is not True else None
+        network(unit_files, processes = processes, policy_overrides = policy_overrides)
+        return
+
+    if PIPE_OPTION in options:
+        pipe(stdin.buffer, stdout.buffer, stderr, report = REPORT_OPTION in options, policy_overrides = policy_overrides)
+        return
+
+    service = None
+
+    if SERVE_OPTION in options:
+        from classes.QueryService import QueryService
+        service = QueryService(int(options[SERVE_OPTION]) if options[SERVE_OPTION] is not True else 0)
+        service.start()
+        print("Query service: listening on http://{}:{}/".format(*service.get_address()), flush = True)
+
+    if WATCH_OPTION in options:
+        try:
+            watch(options[WATCH_OPTION], report = REPORT_OPTION in options, policy_overrides = policy_overrides,
+                  service = service)
+        finally:
+            if service:
+                service.close()
+        return
+
+    memory_budget = options.get(MEMORY_OPTION)
+    memory_budget = int(float(memory_budget) * 1048576) if memory_budget not in (None, True) else None
+
+    within_budget = plan(positional[DOCTORS_FILE_INDEX], positional[SCHEDULE_FILE_INDEX],
+                         positional[REQUESTS_FILE_INDEX], report = REPORT_OPTION in options,
+                         profile = PROFILE_OPTION in options or bool(environ.get(PROFILE_VARIABLE)),
+                         journal_file = options.get(JOURNAL_OPTION), policy_overrides = policy_overrides,
+                         digest = DIGEST_OPTION in options, ticks = int(options.get(TICKS_OPTION, 1)),
+                         batch = BATCH_OPTION in options, forecast_file = options.get(FORECAST_OPTION),
+                         horizon = int(options.get(LOOKAHEAD_OPTION, LOOKAHEAD_TICKS)),
+                         memory = MEMORY_OPTION in options, memory_budget = memory_budget,
+                         delta = DELTA_OPTION in options, service = service)
+
+    if service:
+        try:
+            service.wait()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            service.close()
+
+    return 0 if within_budget else 1
+
+
+if __name__ == "__main__":
+    exit(main(argv))